@@ -19,6 +19,7 @@ Classes:
         - __init__(): Initializes the Basilisk with its attributes and state.
         - update(trogdor): Updates the Basilisk's state and behavior.
         - _update_normal(trogdor): Handles the Basilisk's normal state behavior.
+        - drop_poison(size, duration): Leaves a poison trail and stamps it into the hazard map.
         - _update_burrowing(): Handles the Basilisk's burrowing state behavior.
         - _update_emerging(): Handles the Basilisk's emerging state behavior.
         - _update_vulnerable(): Handles the Basilisk's vulnerable state behavior.
@@ -37,9 +38,12 @@ from utils import (BASILISK_BURROW_DURATION, BASILISK_HEAD_SIZE, BASILISK_PHASE_
                    LANCELOT_VULNERABLE_DURATION, MERLIN_PROJECTILE_COOLDOWN, MERLIN_PROJECTILE_SIZE, 
                    MERLIN_SIZE, MERLIN_TELEPORT_DISTANCE, WIDTH, HEIGHT, UIBARHEIGHT,
                      RED, GREEN, BLUE, YELLOW, ORANGE, WHITE, BLACK)
-from utils import BOSS_HEALTH_BAR_WIDTH, BOSS_HEALTH_BAR_HEIGHT, BOSS_HEALTH_BAR_BORDER
+from utils import BOSS_HEALTH_BAR_WIDTH, BOSS_HEALTH_BAR_HEIGHT, BOSS_HEALTH_BAR_BORDER, TROGDOR_SIZE
 from entities import Projectile
+from hazard_map import HazardMap
 from ui import load_sound
+from trig_tables import unit_vector, angle_steps, unit_circle, rotated_circle, rotate_all, rotate
+from quality import QUALITY
 
 
 # Helper classes for the Basilisk boss
@@ -72,28 +76,45 @@ class ShedSkin:
         self.positions = positions  # List of (x, y) tuples for each segment
         self.size = BASILISK_SEGMENT_SIZE
         self.alpha = 200
+        # The skin never moves, so it is drawn once and only its alpha changes
+        self.surface, self.origin = self._rasterize()
 
-    def update(self):
-        # Slowly fade out
-        self.alpha = max(0, self.alpha - 0.5)
-        return self.alpha > 0
-
-    def draw(self, screen):
+    def _rasterize(self):
+        """Draw every segment into one surface covering the whole skin"""
+        half = self.size // 2
+        left = int(min(x for x, _ in self.positions)) - half
+        top = int(min(y for _, y in self.positions)) - half
+        width = int(max(x for x, _ in self.positions)) - half - left + self.size
+        height = int(max(y for _, y in self.positions)) - half - top + self.size
+        
+        # Black is never part of the skin, so it marks the transparent area
+        surface = pygame.Surface((width, height))
+        surface.fill(BLACK)
+        surface.set_colorkey(BLACK, pygame.RLEACCEL)
+        
         for i, pos in enumerate(self.positions):
-            color = (120, 120, 120, self.alpha)  # Gray with alpha
-            shed_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            x = int(pos[0]) - half - left
+            y = int(pos[1]) - half - top
             
             # Draw as a circle
-            pygame.draw.circle(shed_surface, color, (self.size//2, self.size//2), self.size//2)
+            pygame.draw.circle(surface, (120, 120, 120), (x + half, y + half), half)
             
             # Add a pattern to make it look like shed skin
             if i % 2 == 0:
-                pattern_color = (150, 150, 150, self.alpha)
-                pygame.draw.arc(shed_surface, pattern_color, 
-                               (5, 5, self.size-10, self.size-10), 
+                pygame.draw.arc(surface, (150, 150, 150), 
+                               (x + 5, y + 5, self.size-10, self.size-10), 
                                0, math.pi, 2)
                 
-            screen.blit(shed_surface, (pos[0] - self.size//2, pos[1] - self.size//2))
+        return surface, (left, top)
+
+    def update(self):
+        # Slowly fade out
+        self.alpha = max(0, self.alpha - 0.5)
+        return self.alpha > 0
+
+    def draw(self, screen):
+        self.surface.set_alpha(int(self.alpha))
+        screen.blit(self.surface, self.origin)
 
 class Basilisk:
     def __init__(self):
@@ -122,6 +143,7 @@ class Basilisk:
         self.max_health = 6
         self.health = self.max_health
         self.segments = []  # Will store past positions for body segments
+        self.max_step = 0  # Longest gap between neighbouring segments, bounds the collision walk
         
         # Initialize position history for body segments
         for _ in range(BASILISK_SEGMENTS):
@@ -139,6 +161,7 @@ class Basilisk:
         
         # Special attack management
         self.poison_trails = []
+        self.hazards = HazardMap()  # Poison trails, checked against Trogdor by update_basilisk_boss
         self.shed_skins = []
         self.burrow_target = None
         self.invulnerable_timer = 0
@@ -186,6 +209,7 @@ class Basilisk:
         
         # Update all poison trails
         self.poison_trails = [trail for trail in self.poison_trails if trail.update()]
+        self.hazards.tick()
         
         # Update all shed skins
         self.shed_skins = [skin for skin in self.shed_skins if skin.update()]
@@ -310,11 +334,17 @@ class Basilisk:
             self.poison_timer += 1
             if self.poison_timer >= self.poison_interval:
                 self.poison_timer = 0
-                self.poison_trails.append(PoisonTrail(self.x, self.y, 30, BASILISK_POISON_DURATION))
+                self.drop_poison(30, BASILISK_POISON_DURATION)
         
         # Update segment positions
         self._update_segments()
 
+    def drop_poison(self, size, duration):
+        """Leave a poison trail at the head and stamp it into the hazard map"""
+        self.poison_trails.append(PoisonTrail(self.x, self.y, size, duration))
+        # Stamped with Trogdor's reach so a lookup at his position is enough
+        self.hazards.stamp_circle(self.x, self.y, size/2 + TROGDOR_SIZE/2, math.ceil(duration))
+
     def _update_burrowing(self):
         self.state_timer -= 1
         if self.state_timer <= 0:
@@ -325,10 +355,11 @@ class Basilisk:
             
             # Update all segment positions to the new location
             self.segments = [(self.x, self.y) for _ in range(BASILISK_SEGMENTS)]
+            self.max_step = 0
             
             # Drop poison at emergence point in phase 3
             if self.phase == 3:
-                self.poison_trails.append(PoisonTrail(self.x, self.y, 60, BASILISK_POISON_DURATION * 1.5))
+                self.drop_poison(60, BASILISK_POISON_DURATION * 1.5)
 
     def _update_emerging(self):
         self.state_timer -= 1
@@ -348,6 +379,8 @@ class Basilisk:
 
     def _update_segments(self):
         # Add current head position to the front of the segments list
+        last_x, last_y = self.segments[0]
+        self.max_step = max(self.max_step, math.hypot(self.x - last_x, self.y - last_y))
         self.segments.insert(0, (self.x, self.y))
         
         # Remove excess positions
@@ -391,11 +424,12 @@ class Basilisk:
         # Draw "burrowing" or "emerging" indicators
         if self.state == "burrowing":
             # Draw dust particles radiating from head
-            for _ in range(10):  # More dust particles
-                angle = random.uniform(0, 2 * math.pi)
+            dust_directions = unit_circle(64)
+            for _ in range(QUALITY.particles(10)):  # More dust particles
+                dir_x, dir_y = random.choice(dust_directions)
                 distance = random.randint(10, 50)  # Wider dust cloud
-                particle_x = self.x + math.cos(angle) * distance
-                particle_y = self.y + math.sin(angle) * distance
+                particle_x = self.x + dir_x * distance
+                particle_y = self.y + dir_y * distance
                 
                 pygame.draw.circle(screen, (150, 130, 100), 
                                   (int(particle_x), int(particle_y)), 
@@ -410,6 +444,10 @@ class Basilisk:
                                  (int(self.x), int(self.y)), 
                                  int(size * scale), 3)
         
+        # Phase 3 glow is sin(t + index * 0.2), expanded with a per-segment table
+        glow_cos, glow_sin = unit_vector(pygame.time.get_ticks() * 0.003)
+        glow_steps = angle_steps(BASILISK_SEGMENTS, 0.2)
+        
         # Draw the body segments (from tail to head)
         for i, pos in enumerate(reversed(self.segments[1:])):
             # Skip head (index 0)
@@ -446,7 +484,8 @@ class Basilisk:
             
             # Phase 3 body glowing effect
             if self.phase == 3 and not (self.flash_timer > 0 and self.flash_timer % 2 == 0):
-                pulse = abs(math.sin(pygame.time.get_ticks() * 0.003 + segment_index * 0.2))
+                step_cos, step_sin = glow_steps[segment_index]
+                pulse = abs(glow_sin * step_cos + glow_cos * step_sin)
                 base_color = (
                     min(base_color[0] + int(20 * pulse), 255),
                     min(base_color[1] + int(20 * pulse), 255),
@@ -465,8 +504,8 @@ class Basilisk:
                 min(base_color[2] + 20, 255)
             )
             
-            # Draw multiple scale arcs along the body
-            for j in range(3):
+            # Draw multiple scale arcs along the body, fewer at lower quality
+            for j in range(QUALITY.scale_arcs):
                 scale_angle = (segment_index * 0.2 + j * (2 * math.pi / 3)) % (2 * math.pi)
                 scale_size = current_segment_size * 0.4
                 
@@ -503,14 +542,14 @@ class Basilisk:
             crown_points = []
             crown_radius = self.head_size * 0.6
             crown_spikes = 5
+            heading_cos, heading_sin = unit_vector(self.angle)
             
-            for i in range(crown_spikes * 2):
-                angle = self.angle + (i * math.pi / crown_spikes) + math.pi
+            for i, (dir_x, dir_y) in enumerate(rotated_circle(crown_spikes * 2, heading_cos, heading_sin, math.pi)):
                 # Alternating spike heights
                 radius = crown_radius * (0.5 if i % 2 == 0 else 0.7)
                 crown_points.append((
-                    self.x + math.cos(angle) * radius,
-                    self.y + math.sin(angle) * radius
+                    self.x + dir_x * radius,
+                    self.y + dir_y * radius
                 ))
             
             if len(crown_points) >= 3:  # Need at least 3 points for a polygon
@@ -522,11 +561,13 @@ class Basilisk:
             eye_angle = self.angle
             
             # Calculate eye positions
-            left_eye_x = self.x + math.cos(eye_angle - 0.4) * eye_offset
-            left_eye_y = self.y + math.sin(eye_angle - 0.4) * eye_offset
+            left_cos, left_sin = rotate(heading_cos, heading_sin, -0.4)
+            left_eye_x = self.x + left_cos * eye_offset
+            left_eye_y = self.y + left_sin * eye_offset
             
-            right_eye_x = self.x + math.cos(eye_angle + 0.4) * eye_offset
-            right_eye_y = self.y + math.sin(eye_angle + 0.4) * eye_offset
+            right_cos, right_sin = rotate(heading_cos, heading_sin, 0.4)
+            right_eye_x = self.x + right_cos * eye_offset
+            right_eye_y = self.y + right_sin * eye_offset
             
             # Draw eye sockets
             pygame.draw.circle(screen, (10, 50, 10), 
@@ -556,33 +597,33 @@ class Basilisk:
             pupil_color = (0, 0, 0)
             pupil_offset = eye_size * 0.3
             pygame.draw.circle(screen, pupil_color, 
-                              (int(left_eye_x + math.cos(eye_angle) * pupil_offset), 
-                               int(left_eye_y + math.sin(eye_angle) * pupil_offset)), 
+                              (int(left_eye_x + heading_cos * pupil_offset), 
+                               int(left_eye_y + heading_sin * pupil_offset)), 
                               int(eye_size * 0.4))
             pygame.draw.circle(screen, pupil_color, 
-                              (int(right_eye_x + math.cos(eye_angle) * pupil_offset), 
-                               int(right_eye_y + math.sin(eye_angle) * pupil_offset)), 
+                              (int(right_eye_x + heading_cos * pupil_offset), 
+                               int(right_eye_y + heading_sin * pupil_offset)), 
                               int(eye_size * 0.4))
             
             # Add "forked tongue" when not vulnerable - more detailed
             if self.state != "vulnerable":
                 tongue_length = self.head_size * 0.8
                 tongue_width = self.head_size * 0.1
-                tongue_angle1 = eye_angle + 0.15
-                tongue_angle2 = eye_angle - 0.15
+                fork1_cos, fork1_sin = rotate(heading_cos, heading_sin, 0.15)
+                fork2_cos, fork2_sin = rotate(heading_cos, heading_sin, -0.15)
                 
-                tongue_start_x = self.x + math.cos(eye_angle) * self.head_size/2
-                tongue_start_y = self.y + math.sin(eye_angle) * self.head_size/2
+                tongue_start_x = self.x + heading_cos * self.head_size/2
+                tongue_start_y = self.y + heading_sin * self.head_size/2
                 
                 # Calculate fork positions
-                mid_x = tongue_start_x + math.cos(eye_angle) * (tongue_length * 0.6)
-                mid_y = tongue_start_y + math.sin(eye_angle) * (tongue_length * 0.6)
+                mid_x = tongue_start_x + heading_cos * (tongue_length * 0.6)
+                mid_y = tongue_start_y + heading_sin * (tongue_length * 0.6)
                 
-                tip1_x = mid_x + math.cos(tongue_angle1) * (tongue_length * 0.4)
-                tip1_y = mid_y + math.sin(tongue_angle1) * (tongue_length * 0.4)
+                tip1_x = mid_x + fork1_cos * (tongue_length * 0.4)
+                tip1_y = mid_y + fork1_sin * (tongue_length * 0.4)
                 
-                tip2_x = mid_x + math.cos(tongue_angle2) * (tongue_length * 0.4)
-                tip2_y = mid_y + math.sin(tongue_angle2) * (tongue_length * 0.4)
+                tip2_x = mid_x + fork2_cos * (tongue_length * 0.4)
+                tip2_y = mid_y + fork2_sin * (tongue_length * 0.4)
                 
                 # Draw tongue with animation
                 flick_offset = math.sin(pygame.time.get_ticks() * 0.01) * (tongue_width * 0.5)
@@ -618,21 +659,22 @@ class Basilisk:
                 pygame.draw.circle(warning_surface, warning_color, (radius, radius), ring_radius, ring_width)
             
             # Add pulsating runes/symbols around the circle
-            for i in range(8):
-                angle = i * (2 * math.pi / 8) + (pygame.time.get_ticks() * 0.001)
-                rune_x = radius + math.cos(angle) * (radius * 0.8)
-                rune_y = radius + math.sin(angle) * (radius * 0.8)
+            spin_cos, spin_sin = unit_vector(pygame.time.get_ticks() * 0.001)
+            for rune_cos, rune_sin in rotated_circle(8, spin_cos, spin_sin):
+                rune_x = radius + rune_cos * (radius * 0.8)
+                rune_y = radius + rune_sin * (radius * 0.8)
                 
                 rune_color = (220, 100, 50, int(200 * pulse))
                 rune_size = 15 + int(5 * pulse)
                 
                 # Draw a rune symbol (simplified as a small star)
-                for j in range(5):
-                    star_angle = j * (2 * math.pi / 5) + angle
-                    x1 = rune_x + math.cos(star_angle) * (rune_size * 0.5)
-                    y1 = rune_y + math.sin(star_angle) * (rune_size * 0.5)
-                    x2 = rune_x + math.cos(star_angle + 2 * math.pi / 10) * (rune_size)
-                    y2 = rune_y + math.sin(star_angle + 2 * math.pi / 10) * (rune_size)
+                inner_points = rotated_circle(5, rune_cos, rune_sin)
+                outer_points = rotated_circle(5, rune_cos, rune_sin, 2 * math.pi / 10)
+                for (inner_cos, inner_sin), (outer_cos, outer_sin) in zip(inner_points, outer_points):
+                    x1 = rune_x + inner_cos * (rune_size * 0.5)
+                    y1 = rune_y + inner_sin * (rune_size * 0.5)
+                    x2 = rune_x + outer_cos * (rune_size)
+                    y2 = rune_y + outer_sin * (rune_size)
                     pygame.draw.line(warning_surface, rune_color, (x1, y1), (x2, y2), 2)
             
             # Add a dramatic flare effect in the center
@@ -669,15 +711,18 @@ class Basilisk:
                                   ring_radius, 4 - i)
             
             # Energy ripples along the circle
-            num_ripples = 24
+            num_ripples = QUALITY.constrict_ripples
             ripple_size = 14
+            drift_cos, drift_sin = unit_vector(self.constrict_timer * 0.03)
+            pulse_cos, pulse_sin = unit_vector(self.constrict_timer * 0.13)
+            ripple_points = rotated_circle(num_ripples, drift_cos, drift_sin)
+            ripple_pulses = rotated_circle(num_ripples, pulse_cos, pulse_sin)
             for i in range(num_ripples):
-                angle = i * (2 * math.pi / num_ripples) + (self.constrict_timer * 0.03)
-                ripple_x = self.constrict_visual_radius + math.cos(angle) * self.constrict_visual_radius
-                ripple_y = self.constrict_visual_radius + math.sin(angle) * self.constrict_visual_radius
+                ripple_x = self.constrict_visual_radius + ripple_points[i][0] * self.constrict_visual_radius
+                ripple_y = self.constrict_visual_radius + ripple_points[i][1] * self.constrict_visual_radius
                 
                 # Ripple pulses
-                ripple_pulse = abs(math.sin(angle + self.constrict_timer * 0.1))
+                ripple_pulse = abs(ripple_pulses[i][1])
                 ripple_color = (100, 220, 50, 150 + int(105 * ripple_pulse))
                 
                 # Draw the ripple as a small glowing orb
@@ -691,11 +736,13 @@ class Basilisk:
             
             # Draw snake scales pattern along the circle
             scale_count = 36
-            for i in range(scale_count):
-                angle = i * (2 * math.pi / scale_count) + (self.constrict_timer * 0.01)
+            scale_spin = self.constrict_timer * 0.01
+            scale_points = rotated_circle(scale_count, *unit_vector(scale_spin))
+            for i, (scale_cos, scale_sin) in enumerate(scale_points):
+                angle = i * (2 * math.pi / scale_count) + scale_spin
                 scale_dist = self.constrict_visual_radius * 0.9
-                scale_x = self.constrict_visual_radius + math.cos(angle) * scale_dist
-                scale_y = self.constrict_visual_radius + math.sin(angle) * scale_dist
+                scale_x = self.constrict_visual_radius + scale_cos * scale_dist
+                scale_y = self.constrict_visual_radius + scale_sin * scale_dist
                 
                 # Draw a scale-like shape
                 scale_color = (0, 180, 30, 200)
@@ -716,16 +763,15 @@ class Basilisk:
             
             # Add magical energy rays emanating from center (more visible as circle shrinks)
             ray_intensity = 100 + int(100 * (1 - self.constrict_radius / 300))
-            ray_count = 8
-            for i in range(ray_count):
-                angle = i * (2 * math.pi / ray_count) + (self.constrict_timer * 0.005)
+            ray_count = QUALITY.constrict_rays
+            for ray_cos, ray_sin in rotated_circle(ray_count, *unit_vector(self.constrict_timer * 0.005)):
                 ray_color = (220, 200, 50, ray_intensity)
                 
                 # Draw ray from center to edge
                 start_x = self.constrict_visual_radius
                 start_y = self.constrict_visual_radius
-                end_x = self.constrict_visual_radius + math.cos(angle) * self.constrict_visual_radius
-                end_y = self.constrict_visual_radius + math.sin(angle) * self.constrict_visual_radius
+                end_x = self.constrict_visual_radius + ray_cos * self.constrict_visual_radius
+                end_y = self.constrict_visual_radius + ray_sin * self.constrict_visual_radius
                 
                 # Draw with varying widths for a light beam effect
                 for w in range(3):
@@ -0,0 +1,139 @@
+"""
+Shared collision helpers.
+
+The swept tests take where both objects were at the start of the frame as well as
+where they are now, and treat the movement in between as a straight line. A fast
+mover (Lancelot's charge, a Lancer, a Teleporter's jump, a speed boosted Trogdor)
+is caught even when it passes all the way through the other object in one frame,
+so raising speeds or lowering the tick rate does not change what counts as a hit.
+
+Functions:
+- point_segment_distance_sq(px, py, ax, ay, bx, by) -> float: Squared distance from a point to a line segment.
+- point_hits_polyline(px, py, points, radius, max_step) -> bool: Whether a point is inside a chain of capsules.
+- segment_hits_box(x0, y0, x1, y1, half_w, half_h) -> bool: Whether a segment passes through a box at the origin.
+- swept_boxes_overlap(a_from, a_to, b_from, b_to, half_w, half_h) -> bool: Swept overlap of two moving boxes.
+- point_in_sector(px, py, cx, cy, start, end, inner_sq, outer_sq) -> bool: Whether a point is inside a ring sector.
+- rect_hits_masks(rect, parts) -> bool: Whether a solid rectangle touches any of a set of placed masks.
+"""
+import math
+from functools import lru_cache
+import pygame
+
+def point_segment_distance_sq(px, py, ax, ay, bx, by):
+    """Squared distance from (px, py) to the segment from (ax, ay) to (bx, by)."""
+    seg_x = bx - ax
+    seg_y = by - ay
+    length_sq = seg_x * seg_x + seg_y * seg_y
+    
+    if length_sq == 0:  # Segment has zero length
+        dx = px - ax
+        dy = py - ay
+        return dx * dx + dy * dy
+    
+    # Projection of the point onto the segment, clamped to its ends
+    t = max(0.0, min(1.0, ((px - ax) * seg_x + (py - ay) * seg_y) / length_sq))
+    dx = px - (ax + t * seg_x)
+    dy = py - (ay + t * seg_y)
+    return dx * dx + dy * dy
+
+def point_hits_polyline(px, py, points, radius, max_step):
+    """Whether (px, py) is closer than radius to the polyline through points,
+    i.e. inside the chain of capsules of that radius around each segment.
+    
+    max_step must be at least the distance between any two consecutive points.
+    Everything within k points of points[i] lies within k * max_step of it, so a
+    point that is far from points[i] lets the walk skip that many points at once.
+    """
+    count = len(points)
+    if count == 0:
+        return False
+    if count == 1 or max_step <= 0:
+        # All the points are in one place
+        x, y = points[0]
+        return math.hypot(px - x, py - y) < radius
+    
+    radius_sq = radius * radius
+    i = 0
+    while i < count - 1:
+        ax, ay = points[i]
+        distance = math.hypot(px - ax, py - ay)
+        skip = int((distance - radius) / max_step)
+        if skip >= 1:
+            # Nothing in the next skip points can be within radius
+            i += skip
+            continue
+        
+        bx, by = points[i + 1]
+        if point_segment_distance_sq(px, py, ax, ay, bx, by) < radius_sq:
+            return True
+        i += 1
+        
+    # The walk can step past the last segment onto the final point
+    x, y = points[-1]
+    return math.hypot(px - x, py - y) < radius
+
+def segment_hits_box(x0, y0, x1, y1, half_w, half_h):
+    """Whether the segment from (x0, y0) to (x1, y1) passes through the open box
+    -half_w < x < half_w, -half_h < y < half_h (a slab test)."""
+    t_enter = 0.0
+    t_exit = 1.0
+    for start, delta, half in ((x0, x1 - x0, half_w), (y0, y1 - y0, half_h)):
+        if delta == 0:
+            # Never moves on this axis, so it has to already be inside the slab
+            if not -half < start < half:
+                return False
+            continue
+        t_near = (-half - start) / delta
+        t_far = (half - start) / delta
+        if t_near > t_far:
+            t_near, t_far = t_far, t_near
+        t_enter = max(t_enter, t_near)
+        t_exit = min(t_exit, t_far)
+        if t_enter >= t_exit:
+            return False
+    return True
+
+def swept_boxes_overlap(a_from, a_to, b_from, b_to, half_w, half_h):
+    """Whether two boxes moving in straight lines overlap at any point in the frame.
+    
+    Positions are (x, y) pairs. Two boxes overlap when their positions are less than
+    half_w apart on x and half_h apart on y, so for two squares of side s compared
+    by their corners, half_w = half_h = s. Working in b's position relative to a,
+    the question becomes whether one segment passes through one box.
+    """
+    return segment_hits_box(b_from[0] - a_from[0], b_from[1] - a_from[1],
+                            b_to[0] - a_to[0], b_to[1] - a_to[1], half_w, half_h)
+
+def point_in_sector(px, py, cx, cy, start, end, inner_sq, outer_sq):
+    """Whether (px, py) lies in the ring sector around (cx, cy) between the unit vectors
+    start and end (counterclockwise, less than half a turn apart) with squared radius
+    strictly between inner_sq and outer_sq. No square roots or angles involved:
+    the radius is compared squared and the angle with two cross products."""
+    dx = px - cx
+    dy = py - cy
+    distance_sq = dx * dx + dy * dy
+    return (inner_sq < distance_sq < outer_sq and
+            start[0] * dy - start[1] * dx > 0 and  # Past the start edge
+            dx * end[1] - dy * end[0] > 0)  # Not yet at the end edge
+
+@lru_cache(maxsize=None)
+def _solid_mask(width, height):
+    return pygame.mask.Mask((width, height), fill=True)
+
+def rect_hits_masks(rect, parts):
+    """Whether the solid pygame Rect rect overlaps any set pixel of the parts, a list
+    of (mask, (x, y)) with each mask's top-left corner at (x, y) on screen.
+    
+    Each part's bounding box is checked first, so Mask.overlap only runs for the
+    parts rect actually reaches.
+    """
+    for mask, (x, y) in parts:
+        x = int(x)
+        y = int(y)
+        width, height = mask.get_size()
+        if (rect.right <= x or rect.left >= x + width or
+                rect.bottom <= y or rect.top >= y + height):
+            continue
+        if mask.overlap(_solid_mask(rect.width, rect.height), (rect.left - x, rect.top - y)):
+            return True
+    return False
@@ -0,0 +1,124 @@
+"""
+Micro-benchmarks for the collision checks in collision.py.
+Run this file directly to compare each check against the code it replaced.
+"""
+import math
+import random
+import timeit
+from collision import point_hits_polyline, point_segment_distance_sq
+from lancelot import Lancelot
+from entities import Trogdor
+from trig_tables import unit_vector
+from utils import WIDTH, HEIGHT, UIBARHEIGHT, TROGDOR_SIZE, BASILISK_SEGMENT_SIZE, BASILISK_SEGMENTS, BASILISK_SPEED
+
+def make_basilisk_trail(seed=0):
+    """A wandering trail of BASILISK_SEGMENTS points, spaced like the real body."""
+    rng = random.Random(seed)
+    x, y = WIDTH / 2, HEIGHT / 2
+    angle = 0
+    trail = []
+    for _ in range(BASILISK_SEGMENTS):
+        trail.append((x, y))
+        angle += rng.uniform(-0.1, 0.1)
+        x = min(max(x + math.cos(angle) * BASILISK_SPEED, 0), WIDTH)
+        y = min(max(y + math.sin(angle) * BASILISK_SPEED, UIBARHEIGHT), HEIGHT)
+    return trail
+
+def sampled_hit(px, py, trail, radius):
+    """The old check: circles around every 5th segment."""
+    for i in range(0, len(trail), 5):
+        pos = trail[i]
+        if math.sqrt((px - pos[0])**2 + (py - pos[1])**2) < radius:
+            return True
+    return False
+
+def brute_force_hit(px, py, trail, radius):
+    """Every capsule tested, used to check the walk gives the same answer."""
+    return any(point_segment_distance_sq(px, py, *trail[i], *trail[i + 1]) < radius * radius
+               for i in range(len(trail) - 1))
+
+def benchmark_basilisk(samples=2000, repeats=5):
+    trail = make_basilisk_trail()
+    radius = TROGDOR_SIZE / 2 + BASILISK_SEGMENT_SIZE / 2
+    rng = random.Random(1)
+    points = [(rng.uniform(0, WIDTH), rng.uniform(UIBARHEIGHT, HEIGHT)) for _ in range(samples)]
+    
+    mismatches = sum(point_hits_polyline(px, py, trail, radius, BASILISK_SPEED) != brute_force_hit(px, py, trail, radius)
+                     for px, py in points)
+    missed = sum(point_hits_polyline(px, py, trail, radius, BASILISK_SPEED) and not sampled_hit(px, py, trail, radius)
+                 for px, py in points)
+    print(f"Basilisk body, {len(trail)} segments, {samples} probe points")
+    print(f"  capsule walk vs brute force mismatches: {mismatches}")
+    print(f"  hits the every-5th sampling missed: {missed}")
+    
+    checks = [("every 5th segment", lambda px, py: sampled_hit(px, py, trail, radius)),
+              ("capsule walk", lambda px, py: point_hits_polyline(px, py, trail, radius, BASILISK_SPEED)),
+              ("brute force capsules", lambda px, py: brute_force_hit(px, py, trail, radius))]
+    for name, check in checks:
+        best = min(timeit.repeat(lambda: [check(px, py) for px, py in points], number=1, repeat=repeats))
+        print(f"  {name:22s} {best / samples * 1e6:7.2f} us per check")
+
+def angle_lancelot_collision(lancelot, trogdor):
+    """The old Lancelot.check_collision, with sqrt, atan2 and angle wrapping."""
+    basic_collision = (abs(trogdor.x - lancelot.x) < trogdor.size + lancelot.size and
+                       abs(trogdor.y - lancelot.y) < trogdor.size + lancelot.size)
+    if lancelot.state == "vulnerable":
+        return False
+    if lancelot.state == "shielded" and not basic_collision:
+        shield_angle = math.atan2(lancelot.shield_dir[1], lancelot.shield_dir[0])
+        shield_x = lancelot.x + lancelot.size/2 + math.cos(shield_angle) * lancelot.shield_size * 0.8
+        shield_y = lancelot.y + lancelot.size/2 + math.sin(shield_angle) * lancelot.shield_size * 0.8
+        return (math.sqrt((trogdor.x + trogdor.size/2 - shield_x)**2 +
+                          (trogdor.y + trogdor.size/2 - shield_y)**2) < trogdor.size/2 + lancelot.shield_size/2)
+    if lancelot.state == "sweeping" and not basic_collision:
+        dx = trogdor.x + trogdor.size/2 - lancelot.sweep_center_x
+        dy = trogdor.y + trogdor.size/2 - lancelot.sweep_center_y
+        distance = math.sqrt(dx**2 + dy**2)
+        player_angle = math.atan2(dy, dx)
+        if player_angle < 0:
+            player_angle += 2 * math.pi
+        sweep_start = lancelot.sweep_angle - lancelot.sweep_width / lancelot.sweep_radius
+        if sweep_start < 0:
+            sweep_start += 2 * math.pi
+        radius_match = abs(distance - lancelot.sweep_radius) < trogdor.size + 15
+        if lancelot.sweep_angle < sweep_start:
+            angle_match = player_angle > sweep_start or player_angle < lancelot.sweep_angle
+        else:
+            angle_match = player_angle > sweep_start and player_angle < lancelot.sweep_angle
+        return radius_match and angle_match
+    return basic_collision
+
+def benchmark_lancelot(samples=2000, repeats=20):
+    rng = random.Random(2)
+    lancelot = Lancelot()
+    lancelot.x, lancelot.y = WIDTH / 2, HEIGHT / 2
+    lancelot.sweep_center_x, lancelot.sweep_center_y = WIDTH / 2, HEIGHT / 2
+    trogdors = []
+    for _ in range(samples):
+        trogdor = Trogdor()
+        trogdor.x = rng.uniform(0, WIDTH)
+        trogdor.y = rng.uniform(UIBARHEIGHT, HEIGHT)
+        trogdors.append(trogdor)
+    
+    for state in ("shielded", "sweeping"):
+        lancelot.state = state
+        mismatches = 0
+        for step in range(60):
+            # Walk the sweep and shield around the circle, one frame at a time
+            lancelot.sweep_angle = 0.1 * (step + 1)
+            lancelot.sweep_dir = (math.cos(lancelot.sweep_angle), math.sin(lancelot.sweep_angle))
+            lancelot.sweep_start_dir = unit_vector(lancelot.sweep_angle - lancelot.sweep_width / lancelot.sweep_radius)
+            lancelot.shield_dir = lancelot.sweep_dir
+            mismatches += sum(lancelot.check_collision(t) != angle_lancelot_collision(lancelot, t) for t in trogdors)
+        print(f"Lancelot {state}, {samples} Trogdor positions x 60 frames")
+        print(f"  sector test vs angle test mismatches: {mismatches}")
+        
+        checks = [("angle test", lambda t: angle_lancelot_collision(lancelot, t)),
+                  ("sector test", lancelot.check_collision)]
+        for name, check in checks:
+            best = min(timeit.repeat(lambda: [check(t) for t in trogdors], number=1, repeat=repeats))
+            print(f"  {name:22s} {best / samples * 1e6:7.2f} us per check")
+
+if __name__ == "__main__":
+    benchmark_basilisk()
+    benchmark_lancelot()
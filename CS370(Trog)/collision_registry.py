@@ -0,0 +1,88 @@
+"""
+Persistent registry of everything that hurts Trogdor on a regular level.
+
+Hostiles are added when a level is built (or when one spawns later) and removed when
+they go away, instead of being gathered into a new list every frame. Each one has a
+pygame Rect hitbox that is moved in place once per frame, so the broad overlap test
+runs in C through Rect.collidelistall.
+
+The hitboxes keep the original collision rule: Trogdor is hit when an enemy's
+position is less than his size away on both axes. That is an overlap between two
+squares of Trogdor's size, one at his position and one at the enemy's.
+
+Enemies like Lancers and Teleporters move far enough in one frame to pass through
+Trogdor, so the test is swept: each hitbox covers the whole path from where the
+entity was at the last update to where it is now, and Rect.collidelistall only
+picks the candidates. Those get the exact swept_boxes_overlap test.
+
+Classes:
+- CollisionRegistry: Hostile entities, their hitboxes and the level's trap hazard map.
+"""
+import pygame
+from utils import TROGDOR_SIZE
+from hazard_map import HazardMap
+from collision import swept_boxes_overlap
+
+class CollisionRegistry:
+    def __init__(self, hitbox_size=TROGDOR_SIZE):
+        self.hitbox_size = hitbox_size
+        self.entities = []
+        self.hitboxes = []  # Same order as entities, covering the frame's movement
+        self.starts = []  # Where each entity's movement this frame started
+        self.previous = []  # Where each entity was at the last update
+        self.trap_hazards = HazardMap()  # Shared with the level's trappers
+        
+    def add(self, entity):
+        self.entities.append(entity)
+        self.hitboxes.append(pygame.Rect(entity.x, entity.y, self.hitbox_size, self.hitbox_size))
+        self.starts.append((entity.x, entity.y))
+        self.previous.append((entity.x, entity.y))
+        
+    def add_all(self, entities):
+        for entity in entities:
+            self.add(entity)
+            
+    def remove(self, entity):
+        index = self.entities.index(entity)
+        del self.entities[index]
+        del self.hitboxes[index]
+        del self.starts[index]
+        del self.previous[index]
+        
+    def clear(self):
+        self.entities.clear()
+        self.hitboxes.clear()
+        self.starts.clear()
+        self.previous.clear()
+        self.trap_hazards.clear()
+        
+    def update(self):
+        """Cover each entity's movement since the last update with its hitbox.
+        Call once per frame, even while Trogdor can't be hit, so the paths stay one frame long."""
+        for i, entity in enumerate(self.entities):
+            self.starts[i] = self.previous[i]
+            self.previous[i] = (entity.x, entity.y)
+            self.hitboxes[i].update(self._path_rect(self.starts[i], self.previous[i]))
+            
+    def first_hit(self, x, y, from_x=None, from_y=None):
+        """The first registered entity that touched a Trogdor moving from (from_x, from_y)
+        to (x, y) this frame, or None. Without a start point Trogdor is taken as standing still."""
+        if from_x is None:
+            from_x, from_y = x, y
+        size = self.hitbox_size
+        for index in self._path_rect((from_x, from_y), (x, y)).collidelistall(self.hitboxes):
+            if swept_boxes_overlap((from_x, from_y), (x, y), self.starts[index], self.previous[index], size, size):
+                return self.entities[index]
+        return None
+        
+    def _path_rect(self, start, end):
+        # Bounds of a hitbox moving from start to end, padded a pixel each way
+        # because Rect rounds to whole pixels
+        left = min(start[0], end[0]) - 1
+        top = min(start[1], end[1]) - 1
+        return pygame.Rect(left, top, abs(end[0] - start[0]) + self.hitbox_size + 2,
+                           abs(end[1] - start[1]) + self.hitbox_size + 2)
+        
+    def trapped(self, x, y):
+        """Whether a Trogdor at (x, y) stands on one of the level's traps."""
+        return bool(self.trap_hazards.hit(x, y))
@@ -6,6 +6,7 @@ and after defeating each boss.
 
 Functions:
 - show_cutscene(screen, cutscene_id): Display a specific cutscene by ID
+- cutscene_steps(screen, cutscene_id): The same cutscene as timeline steps, for use inside the game loop
 - get_cutscene_data(cutscene_id): Get text and image data for a cutscene
 
 Disclaimer: All cutscenes have been created with ChatGPT and are not drawn by hand.
@@ -15,6 +16,7 @@ import pygame
 import os
 from utils import WIDTH, HEIGHT, BLACK, WHITE, ORANGE, YELLOW
 from ui import load_sound, play_music, current_music
+from timeline import run_blocking
 
 # Constants for the cutscene display
 CUTSCENE_TEXT_BOX_HEIGHT = 200
@@ -119,12 +121,12 @@ def get_cutscene_data(cutscene_id):
         return CUTSCENES[cutscene_id]
     return None
 
-# In cutscenes.py, update the show_cutscene function to play music:
-
 def show_cutscene(screen, cutscene_id):
-    # Remember current music
-    previous_music = current_music
-    """Display a cutscene with text, image, and music."""
+    """Display a cutscene with text, image, and music. Returns False if the user quit."""
+    return run_blocking(screen, cutscene_steps(screen, cutscene_id))
+
+def cutscene_steps(screen, cutscene_id):
+    """Timeline steps that show a cutscene until a key is pressed. Returns False if the user quit."""
     # Get cutscene data
     cutscene_data = get_cutscene_data(cutscene_id)
     if not cutscene_data:
@@ -152,22 +154,23 @@ def show_cutscene(screen, cutscene_id):
     text_box_y = HEIGHT - CUTSCENE_TEXT_BOX_HEIGHT
     text_start_y = text_box_y + CUTSCENE_TEXT_PADDING + title_font.get_height() + 10
     
-    # Clear the screen
-    screen.fill(BLACK)
+    # The cutscene is drawn once into its own frame, which is shown until a key is pressed
+    frame = pygame.Surface(screen.get_size())
+    frame.fill(BLACK)
     
     # Draw image if available
     if image:
         # Scale the image to fit the screen width and calculated height
         scaled_image = pygame.transform.scale(image, (WIDTH, CUTSCENE_IMAGE_HEIGHT))
-        screen.blit(scaled_image, (0, 0))
+        frame.blit(scaled_image, (0, 0))
     
     # Draw text box background
-    pygame.draw.rect(screen, BLACK, (0, text_box_y, WIDTH, CUTSCENE_TEXT_BOX_HEIGHT))
-    pygame.draw.rect(screen, YELLOW, (0, text_box_y, WIDTH, CUTSCENE_TEXT_BOX_HEIGHT), 2)
+    pygame.draw.rect(frame, BLACK, (0, text_box_y, WIDTH, CUTSCENE_TEXT_BOX_HEIGHT))
+    pygame.draw.rect(frame, YELLOW, (0, text_box_y, WIDTH, CUTSCENE_TEXT_BOX_HEIGHT), 2)
     
     # Draw title
     title_surface = title_font.render(cutscene_data["title"], True, ORANGE)
-    screen.blit(title_surface, (WIDTH // 2 - title_surface.get_width() // 2, text_box_y + CUTSCENE_TEXT_PADDING))
+    frame.blit(title_surface, (WIDTH // 2 - title_surface.get_width() // 2, text_box_y + CUTSCENE_TEXT_PADDING))
     
     # Draw text lines
     line_height = text_font.get_height() + 5
@@ -181,26 +184,24 @@ def show_cutscene(screen, cutscene_id):
             wrapped_lines = wrap_text(line, text_font, max_text_width)
             for wrapped in wrapped_lines:
                 text_surface = text_font.render(wrapped, True, WHITE)
-                screen.blit(text_surface, (CUTSCENE_TEXT_PADDING, y_pos))
+                frame.blit(text_surface, (CUTSCENE_TEXT_PADDING, y_pos))
                 y_pos += line_height
         else:
             text_surface = text_font.render(line, True, WHITE)
-            screen.blit(text_surface, (CUTSCENE_TEXT_PADDING, y_pos))
+            frame.blit(text_surface, (CUTSCENE_TEXT_PADDING, y_pos))
             y_pos += line_height
     
     # Add prompt at the bottom
     prompt_font = pygame.font.Font(None, 24)
     prompt_text = "Press any key to continue..."
     prompt_surface = prompt_font.render(prompt_text, True, WHITE)
-    screen.blit(prompt_surface, (WIDTH - prompt_surface.get_width() - 20, 
+    frame.blit(prompt_surface, (WIDTH - prompt_surface.get_width() - 20, 
                                HEIGHT - prompt_surface.get_height() - 10))
     
-    pygame.display.flip()
-    
     # Wait for user input
     waiting = True
     while waiting:
-        for event in pygame.event.get():
+        for event in (yield frame):
             if event.type == pygame.QUIT:
                 # Stop the music if user quits
                 if cutscene_music:
@@ -6,6 +6,19 @@ from utils import (WIDTH, HEIGHT, UIBARHEIGHT, FPS, RED, GREEN, BLUE, YELLOW, OR
 from utils import BOSS_HEALTH_BAR_WIDTH, BOSS_HEALTH_BAR_HEIGHT, BOSS_HEALTH_BAR_BORDER
 from entities import Projectile
 from ui import load_sound
+from trig_tables import unit_vector, rotate
+from sprite_cache import SpriteCache, RotationCache, snap_angle, sprite_mask, render_circle
+from pool import ObjectPool
+from quality import QUALITY, draw_glow_circle
+from particles import particle_culled
+
+# Fire particles come in a few hundred colour and size combinations, shared by every particle
+FIRE_PARTICLE_SPRITES = SpriteCache(512)
+
+def _render_fire_particle(color, radius, inner_radius):
+    surface, offset = render_circle(color, radius)
+    pygame.draw.circle(surface, (255, 255, 200), (radius + 1, radius + 1), inner_radius)
+    return surface, offset
 
 class FireParticle:
     """Fire breath particle with animation and physics"""
@@ -38,7 +51,8 @@ class FireParticle:
         green = min(200, int(150 * (self.life / 60)))
         self.color = (red, green, 0)
         
-        return self.life > 0 and 0 <= self.x <= WIDTH and 0 <= self.y <= HEIGHT
+        # The size runs out with the life
+        return not particle_culled(self.x, self.y, self.size)
     
     def draw(self, screen):
         # Draw as a glowing circle
@@ -49,32 +63,44 @@ class FireParticle:
         inner_color = (255, 255, 200)  # Bright yellow-white center
         pygame.draw.circle(screen, inner_color, (int(self.x), int(self.y)), int(inner_size))
 
+    def sprite(self):
+        """The same circles as draw(), as a (surface, position) pair for Surface.blits."""
+        color, radius, inner_radius = self.color, int(self.size), int(self.size * 0.6)
+        surface, (offset_x, offset_y) = FIRE_PARTICLE_SPRITES.get(
+            (color, radius, inner_radius), lambda: _render_fire_particle(color, radius, inner_radius))
+        return surface, (int(self.x) + offset_x, int(self.y) + offset_y)
+
 class FireballProjectile:
-    """Larger fireball projectile that explodes on impact"""
+    """Larger fireball projectile that explodes on impact, made through FIREBALL_POOL"""
     def __init__(self, x, y, angle, size, speed):
+        self.explosion_particles = []
+        self.reset(x, y, angle, size, speed)
+
+    def reset(self, x, y, angle, size, speed):
         self.x = x
         self.y = y
         self.angle = angle
+        self.dir_x, self.dir_y = unit_vector(angle)  # Fireballs fly straight, so cache the direction
         self.size = size
         self.speed = speed
         self.life = 180  # 3 seconds at 60 FPS
         self.exploded = False
-        self.explosion_particles = []
+        self.explosion_particles.clear()
         self.pulse = 0
         self.hit_radius = size * 1.5  # Slightly larger hitbox than visual
     
     def update(self):
         if not self.exploded:
-            self.x += math.cos(self.angle) * self.speed
-            self.y += math.sin(self.angle) * self.speed
+            self.x += self.dir_x * self.speed
+            self.y += self.dir_y * self.speed
             
             # Pulse size for visual effect
             self.pulse = (self.pulse + 0.2) % (2 * math.pi)
             
             # Generate trail particles
-            if random.random() < 0.3:
-                trail_x = self.x - math.cos(self.angle) * (random.uniform(0, self.size))
-                trail_y = self.y - math.sin(self.angle) * (random.uniform(0, self.size))
+            if QUALITY.chance(0.3):
+                trail_x = self.x - self.dir_x * (random.uniform(0, self.size))
+                trail_y = self.y - self.dir_y * (random.uniform(0, self.size))
                 self.explosion_particles.append(
                     FireParticle(trail_x, trail_y, 
                                  random.uniform(0, math.pi * 2),
@@ -87,9 +113,7 @@ class FireballProjectile:
                 self.explode()
         
         # Update explosion particles
-        for particle in self.explosion_particles[:]:
-            if not particle.update():
-                self.explosion_particles.remove(particle)
+        self.explosion_particles[:] = [particle for particle in self.explosion_particles if particle.update()]
         
         # Count explosion duration
         if self.exploded:
@@ -103,7 +127,7 @@ class FireballProjectile:
         self.exploded = True
         
         # Create explosion particles
-        for _ in range(30):
+        for _ in range(QUALITY.particles(30)):
             angle = random.uniform(0, math.pi * 2)
             speed = random.uniform(1, 5)
             size = random.uniform(3, 8)
@@ -126,9 +150,10 @@ class FireballProjectile:
                                (int(self.x), int(self.y)), 
                                int(self.size * 0.6 * size_mod))
         
-        # Draw all explosion particles
-        for particle in self.explosion_particles:
-            particle.draw(screen)
+        # Draw all explosion particles in one batch
+        screen.blits([particle.sprite() for particle in self.explosion_particles], doreturn=False)
+
+FIREBALL_POOL = ObjectPool(FireballProjectile)
 
 class LightningBolt:
     """Lightning attack that strikes instantly with branches"""
@@ -145,34 +170,22 @@ class LightningBolt:
     
     def generate_branches(self):
         """Create a lightning bolt with random branches"""
-        # Main bolt path
-        self.branches = [[(self.start_x, self.start_y), (self.end_x, self.end_y)]]
+        dx = self.end_x - self.start_x
+        dy = self.end_y - self.start_y
         
-        # Add zigzag segments to main path
+        # Main bolt path, zigzagging around the straight line from start to end
         zigzags = random.randint(3, 6)
         main_path = [(self.start_x, self.start_y)]
-        
-        for i in range(zigzags):
-            # Create a point along the line from start to end
-            t = (i + 1) / (zigzags + 1)
-            mid_x = self.start_x + (self.end_x - self.start_x) * t
-            mid_y = self.start_y + (self.end_y - self.start_y) * t
-            
-            # Add some random deviation
+        for t in [(i + 1) / (zigzags + 1) for i in range(zigzags)]:
             offset = 20 * (1 - t)  # Less deviation closer to target
-            mid_x += random.uniform(-offset, offset)
-            mid_y += random.uniform(-offset, offset)
-            
-            main_path.append((mid_x, mid_y))
-        
+            main_path.append((self.start_x + dx * t + random.uniform(-offset, offset),
+                              self.start_y + dy * t + random.uniform(-offset, offset)))
         main_path.append((self.end_x, self.end_y))
-        self.branches[0] = main_path
+        self.branches = [main_path]
         
-        # Add secondary branches
-        for i in range(1, len(main_path) - 1):
+        # Add secondary branches from the zigzag points
+        for branch_start in main_path[1:-1]:
             if random.random() < 0.6:  # 60% chance for a branch
-                branch_start = main_path[i]
-                
                 # Branch in a random direction
                 angle = random.uniform(0, math.pi * 2)
                 length = random.uniform(20, 60)
@@ -182,15 +195,15 @@ class LightningBolt:
                 )
                 
                 # Add a zigzag to the branch too
-                branch_path = [branch_start]
-                mid_x = (branch_start[0] + branch_end[0]) / 2
-                mid_y = (branch_start[1] + branch_end[1]) / 2
-                mid_x += random.uniform(-10, 10)
-                mid_y += random.uniform(-10, 10)
-                branch_path.append((mid_x, mid_y))
-                branch_path.append(branch_end)
-                
-                self.branches.append(branch_path)
+                branch_mid = ((branch_start[0] + branch_end[0]) / 2 + random.uniform(-10, 10),
+                              (branch_start[1] + branch_end[1]) / 2 + random.uniform(-10, 10))
+                self.branches.append([branch_start, branch_mid, branch_end])
+        
+        # Bounding box of the whole bolt, lets collision checks skip bolts that are out of reach
+        xs = [x for branch in self.branches for x, _ in branch]
+        ys = [y for branch in self.branches for _, y in branch]
+        left, top = math.floor(min(xs)), math.floor(min(ys))
+        self.bounds = pygame.Rect(left, top, math.ceil(max(xs)) - left + 1, math.ceil(max(ys)) - top + 1)
     
     def update(self):
         self.life -= 1
@@ -200,18 +213,13 @@ class LightningBolt:
         # Lightning flashes, alternating between bright white and blue
         color = WHITE if self.life % 2 == 0 else self.color
         
-        # Draw all branches
+        # The glow is the same colour drawn wider over the bolt (the screen has no alpha),
+        # so the initial bright flash is just thicker lines
+        width = self.width + 2 if self.life > 10 else self.width
+        
+        # One polyline per branch
         for branch in self.branches:
-            for i in range(len(branch) - 1):
-                pygame.draw.line(screen, color, 
-                                 branch[i], branch[i+1], 
-                                 self.width)
-                
-                # Add glow effect
-                if self.life > 10:  # Only for the initial bright flash
-                    pygame.draw.line(screen, (color[0], color[1], color[2], 100), 
-                                     branch[i], branch[i+1], 
-                                     self.width + 2)
+            pygame.draw.lines(screen, color, False, branch, width)
 
 class Wing:
     """Dragon wing that animates with flight"""
@@ -242,16 +250,17 @@ class Wing:
         """Draw the wing as a triangular membrane"""
         # Wing connection point at the body
         body_radius = self.dragon_size / 2
-        connection_x = self.base_x + math.cos(self.angle + math.pi) * body_radius * 0.7
-        connection_y = self.base_y + math.sin(self.angle + math.pi) * body_radius * 0.7
+        wing_cos, wing_sin = unit_vector(self.angle)
+        connection_x = self.base_x - wing_cos * body_radius * 0.7
+        connection_y = self.base_y - wing_sin * body_radius * 0.7
         
         # Wing tip point
-        tip_x = connection_x + math.cos(self.angle) * self.length
-        tip_y = connection_y + math.sin(self.angle) * self.length
+        tip_x = connection_x + wing_cos * self.length
+        tip_y = connection_y + wing_sin * self.length
         
-        # Wing membrane points (triangular shape)
-        back_x = self.base_x + math.cos(self.angle + math.pi) * (body_radius * 1.2)
-        back_y = self.base_y + math.sin(self.angle + math.pi) * (body_radius * 1.2)
+        # Wing membrane points (triangular shape, opposite side of the body)
+        back_x = self.base_x - wing_cos * (body_radius * 1.2)
+        back_y = self.base_y - wing_sin * (body_radius * 1.2)
         
         # Draw wing membrane
         wing_color = (max(0, min(color[0] - 30, 255)), 
@@ -288,6 +297,8 @@ class DragonKing:
         self.wing_span = self.size * 1.8
         self.tail_length = self.size * 0.8
         self.shadow_alpha = 150
+        self.sprites = SpriteCache()  # Pre-rendered body, head and tail, see draw
+        self.hit_masks = SpriteCache()  # Masks of the same parts and the wings, see hit_parts
         
         # Wings
         self.left_wing = Wing('left', self.x, self.y, self.wing_span, self.size)
@@ -487,7 +498,7 @@ class DragonKing:
                 self.dive_ascend_timer = 60
                 
                 # Create impact effect
-                for _ in range(20):
+                for _ in range(QUALITY.particles(20)):
                     angle = random.uniform(0, math.pi * 2)
                     speed = random.uniform(2, 5)
                     size = random.uniform(3, 8)
@@ -533,8 +544,10 @@ class DragonKing:
         # Generate fire breath particles
         if self.breath_intensity > 0:
             particle_count = int(10 * self.breath_intensity)
+            # fire_breath is what burns Trogdor, so quality only thins out the particles drawn
+            visible_count = QUALITY.particles(particle_count)
             
-            for _ in range(particle_count):
+            for i in range(particle_count):
                 # Calculate mouth position (center of dragon's front)
                 mouth_x = self.x + self.size/2 + math.cos(self.breath_angle) * (self.size/2)
                 mouth_y = self.y + self.size/2 + math.sin(self.breath_angle) * (self.size/2)
@@ -550,9 +563,10 @@ class DragonKing:
                 # Add to both systems for compatibility
                 self.fire_breath.append((mouth_x, mouth_y, particle_angle))
                 
-                self.fire_particles.append(
-                    FireParticle(mouth_x, mouth_y, particle_angle, size, speed)
-                )
+                if i < visible_count:
+                    self.fire_particles.append(
+                        FireParticle(mouth_x, mouth_y, particle_angle, size, speed)
+                    )
         
         # End attack when timer expires
         if self.state_timer <= 0:
@@ -569,7 +583,7 @@ class DragonKing:
             self.z = min(self.max_z, self.z + 2)
             
             # Create charging particles around dragon
-            if random.random() < 0.3:
+            if QUALITY.chance(0.3):
                 angle = random.uniform(0, math.pi * 2)
                 distance = random.uniform(0, self.size)
                 
@@ -620,13 +634,15 @@ class DragonKing:
                         )
         
         # Update charging particles
-        for particle in self.lightning_charge_particles[:]:
+        for particle in self.lightning_charge_particles:
             particle['x'] += particle['dx']
             particle['y'] += particle['dy']
             particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.lightning_charge_particles.remove(particle)
+        # Drawn shrinking and fading with their life
+        self.lightning_charge_particles[:] = [
+            particle for particle in self.lightning_charge_particles
+            if not particle_culled(particle['x'], particle['y'], particle['size'] * particle['life'] / 30,
+                                   255 * particle['life'] / 30)]
         
         # End attack when timer expires
         if self.state_timer <= 0:
@@ -661,7 +677,7 @@ class DragonKing:
                 
                 # Create fireball
                 self.fireballs.append(
-                    FireballProjectile(
+                    FIREBALL_POOL.acquire(
                         mouth_x, mouth_y,
                         angle,
                         10,  # Size
@@ -702,14 +718,13 @@ class DragonKing:
     def _update_effects(self):
         """Update all visual effects and projectiles"""
         # Update fire particles
-        for particle in self.fire_particles[:]:
-            if not particle.update():
-                self.fire_particles.remove(particle)
+        self.fire_particles[:] = [particle for particle in self.fire_particles if particle.update()]
         
         # Update fireballs
         for fireball in self.fireballs[:]:
             if not fireball.update():
                 self.fireballs.remove(fireball)
+                FIREBALL_POOL.release(fireball)
         
         # Update lightning bolts
         for bolt in self.lightning_bolts[:]:
@@ -752,30 +767,31 @@ class DragonKing:
         self.right_wing.draw(screen, current_color)
         
         # Dragon body (oval)
-        pygame.draw.ellipse(screen, current_color, 
-                           (self.x, self.y, self.size, self.size * 0.8))
-        
-        # Draw head/neck extension in flight direction
+        screen.blit(self.sprites.get(('body', current_color), lambda: self._render_body(current_color)),
+                    (self.x, self.y))
+        
+        # Neck, head and horns turn together with the flight direction
+        center_x = self.x + self.size/2
+        center_y = self.y + self.size/2
+        head_sprite = self.sprites.get(('head', current_color), lambda: self._render_head(current_color))
+        head_sprite.blit(screen, self.heading_angle, center_x, center_y)
+        
+        # Eyes glow with the attack state, so they are drawn on top of the cached head
+        # using the same snapped heading the sprite was drawn with
+        heading_cos, heading_sin = unit_vector(snap_angle(self.heading_angle))
         neck_length = self.size * 0.4
-        head_x = self.x + self.size/2 + math.cos(self.heading_angle) * neck_length
-        head_y = self.y + self.size/2 + math.sin(self.heading_angle) * neck_length
-        
-        # Neck
-        pygame.draw.line(screen, current_color, 
-                        (self.x + self.size/2, self.y + self.size/2),
-                        (head_x, head_y), int(self.size * 0.2))
-        
-        # Head
         head_size = self.size * 0.35
-        pygame.draw.circle(screen, current_color, (int(head_x), int(head_y)), int(head_size))
+        head_x = center_x + heading_cos * neck_length
+        head_y = center_y + heading_sin * neck_length
         
-        # Eyes
         eye_offset = head_size * 0.4
         eye_size = head_size * 0.25
-        left_eye_x = head_x + math.cos(self.heading_angle + 2.5) * eye_offset
-        left_eye_y = head_y + math.sin(self.heading_angle + 2.5) * eye_offset
-        right_eye_x = head_x + math.cos(self.heading_angle - 2.5) * eye_offset
-        right_eye_y = head_y + math.sin(self.heading_angle - 2.5) * eye_offset
+        left_cos, left_sin = rotate(heading_cos, heading_sin, 2.5)
+        right_cos, right_sin = rotate(heading_cos, heading_sin, -2.5)
+        left_eye_x = head_x + left_cos * eye_offset
+        left_eye_y = head_y + left_sin * eye_offset
+        right_eye_x = head_x + right_cos * eye_offset
+        right_eye_y = head_y + right_sin * eye_offset
         
         # Draw eyes with glowing effect based on attack state
         eye_color = tuple(self.eye_color)  # Create a copy of the color
@@ -792,45 +808,11 @@ class DragonKing:
         pygame.draw.circle(screen, BLACK, (int(left_eye_x), int(left_eye_y)), int(pupil_size))
         pygame.draw.circle(screen, BLACK, (int(right_eye_x), int(right_eye_y)), int(pupil_size))
         
-        # Horns
-        for i in [-1, 1]:
-            horn_angle = self.heading_angle + i * 0.5
-            horn_x = head_x + math.cos(horn_angle) * head_size
-            horn_y = head_y + math.sin(horn_angle) * head_size
-            
-            horn_tip_x = horn_x + math.cos(horn_angle + i * 0.5) * self.horn_length
-            horn_tip_y = horn_y + math.sin(horn_angle + i * 0.5) * self.horn_length
-            
-            pygame.draw.line(screen, (180, 180, 180), 
-                            (horn_x, horn_y),
-                            (horn_tip_x, horn_tip_y), 4)
-        
-        # Tail
-        tail_start_x = self.x + self.size/2 - math.cos(self.heading_angle) * self.size/2
-        tail_start_y = self.y + self.size/2 - math.sin(self.heading_angle) * self.size/2
-        
         # Tail curves behind with subtle animation
-        tail_curve = math.sin(pygame.time.get_ticks() * 0.002) * 0.5
-        tail_angle = self.heading_angle + math.pi + tail_curve
-        
-        tail_end_x = tail_start_x + math.cos(tail_angle) * self.tail_length
-        tail_end_y = tail_start_y + math.sin(tail_angle) * self.tail_length
-        
-        pygame.draw.line(screen, current_color, 
-                        (tail_start_x, tail_start_y),
-                        (tail_end_x, tail_end_y), int(self.size * 0.15))
-        
-        # Draw tail spike
-        spike_size = self.size * 0.1
-        pygame.draw.polygon(screen, (180, 180, 180), [
-            (tail_end_x, tail_end_y),
-            (tail_end_x + math.cos(tail_angle + 0.5) * spike_size, 
-             tail_end_y + math.sin(tail_angle + 0.5) * spike_size),
-            (tail_end_x + math.cos(tail_angle) * spike_size * 2, 
-             tail_end_y + math.sin(tail_angle) * spike_size * 2),
-            (tail_end_x + math.cos(tail_angle - 0.5) * spike_size, 
-             tail_end_y + math.sin(tail_angle - 0.5) * spike_size)
-        ])
+        tail_start_x = center_x - heading_cos * self.size/2
+        tail_start_y = center_y - heading_sin * self.size/2
+        tail_sprite = self.sprites.get(('tail', current_color), lambda: self._render_tail(current_color))
+        tail_sprite.blit(screen, self._tail_angle(), tail_start_x, tail_start_y)
         
         # Draw special attack effects
         
@@ -839,19 +821,11 @@ class DragonKing:
             alpha = int(255 * (particle['life'] / 30))
             size = particle['size'] * (particle['life'] / 30)
             
-            # Create surface with alpha
-            particle_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (100, 100, 255, alpha), 
-                             (size, size), size)
-            
-            screen.blit(particle_surface, (
-                particle['x'] - size,
-                particle['y'] - size
-            ))
+            # Drawn with alpha when glow surfaces are on
+            draw_glow_circle(screen, (100, 100, 255), alpha, particle['x'], particle['y'], size)
         
-        # Fire particles
-        for particle in self.fire_particles:
-            particle.draw(screen)
+        # Fire particles, in one batch
+        screen.blits([particle.sprite() for particle in self.fire_particles], doreturn=False)
             
         # Fireballs
         for fireball in self.fireballs:
@@ -864,6 +838,102 @@ class DragonKing:
         # Draw health bar
         self.draw_health_bar(screen)
     
+    def _tail_angle(self):
+        """Tail points behind the heading and curves with a subtle animation"""
+        return self.heading_angle + math.pi + math.sin(pygame.time.get_ticks() * 0.002) * 0.5
+        
+    def hit_parts(self):
+        """(mask, (x, y)) for the body, head, tail and wings as drawn this frame.
+        Turning parts use the RotationCache mask for their quantized angle."""
+        center_x = self.x + self.size/2
+        center_y = self.y + self.size/2
+        heading_cos, heading_sin = unit_vector(snap_angle(self.heading_angle))
+        tail_start_x = center_x - heading_cos * self.size/2
+        tail_start_y = center_y - heading_sin * self.size/2
+        
+        # Masks don't depend on colour, so they are built once from the normal colours
+        body = self.hit_masks.get('body', lambda: sprite_mask((self._render_body(self.body_color), (0, 0))))
+        head = self.hit_masks.get('head', lambda: self._render_head(self.body_color))
+        tail = self.hit_masks.get('tail', lambda: self._render_tail(self.body_color))
+        wing = self.hit_masks.get('wing', self._render_wing)
+        
+        parts = [(body[0], (self.x, self.y))]
+        for sprite, angle, x, y in ((head, self.heading_angle, center_x, center_y),
+                                    (tail, self._tail_angle(), tail_start_x, tail_start_y),
+                                    (wing, self.left_wing.angle, center_x, center_y),
+                                    (wing, self.right_wing.angle, center_x, center_y)):
+            mask, (dx, dy) = sprite.get_mask(angle)
+            parts.append((mask, (x + dx, y + dy)))
+        return parts
+    
+    # Sprite builders. Turning parts are drawn facing right and rotated by RotationCache
+    
+    def _render_body(self, color):
+        surface = pygame.Surface((self.size, self.size * 0.8), pygame.SRCALPHA)
+        pygame.draw.ellipse(surface, color, (0, 0, self.size, self.size * 0.8))
+        return surface
+        
+    def _render_head(self, color):
+        """Neck, head and horns, turning about the body centre"""
+        neck_length = self.size * 0.4
+        neck_width = int(self.size * 0.2)
+        head_size = self.size * 0.35
+        
+        horns = []
+        for i in [-1, 1]:
+            horn_cos, horn_sin = unit_vector(i * 0.5)
+            tip_cos, tip_sin = unit_vector(i * 1.0)
+            horn_x = neck_length + horn_cos * head_size
+            horn_y = horn_sin * head_size
+            horns.append(((horn_x, horn_y),
+                          (horn_x + tip_cos * self.horn_length, horn_y + tip_sin * self.horn_length)))
+            
+        left = neck_width // 2 + 2
+        right = math.ceil(max([neck_length + head_size] + [tip[0] for _, tip in horns])) + 3
+        half_height = math.ceil(max([head_size] + [abs(tip[1]) for _, tip in horns])) + 3
+        
+        surface = pygame.Surface((left + right, half_height * 2), pygame.SRCALPHA)
+        pygame.draw.line(surface, color, (left, half_height), (left + neck_length, half_height), neck_width)
+        pygame.draw.circle(surface, color, (int(left + neck_length), half_height), int(head_size))
+        for (horn_x, horn_y), (tip_x, tip_y) in horns:
+            pygame.draw.line(surface, (180, 180, 180), 
+                            (left + horn_x, half_height + horn_y),
+                            (left + tip_x, half_height + tip_y), 4)
+        return RotationCache(surface, (left, half_height))
+        
+    def _render_tail(self, color):
+        """Tail with its spike, turning about where it leaves the body"""
+        tail_width = int(self.size * 0.15)
+        spike_size = self.size * 0.1
+        spike_cos, spike_sin = unit_vector(0.5)
+        
+        left = tail_width // 2 + 2
+        right = math.ceil(self.tail_length + spike_size * 2) + 3
+        half_height = math.ceil(max(tail_width / 2, spike_sin * spike_size)) + 3
+        end_x = left + self.tail_length
+        
+        surface = pygame.Surface((left + right, half_height * 2), pygame.SRCALPHA)
+        pygame.draw.line(surface, color, (left, half_height), (end_x, half_height), tail_width)
+        pygame.draw.polygon(surface, (180, 180, 180), [
+            (end_x, half_height),
+            (end_x + spike_cos * spike_size, half_height + spike_sin * spike_size),
+            (end_x + spike_size * 2, half_height),
+            (end_x + spike_cos * spike_size, half_height - spike_sin * spike_size)
+        ])
+        return RotationCache(surface, (left, half_height))
+    
+    def _render_wing(self):
+        """Wing outline for hit tests only, the wings themselves are still drawn by Wing.
+        Both wings have the same shape, turning about the body centre."""
+        body_radius = self.size / 2
+        back = body_radius * 1.2  # Membrane starts behind the body centre
+        tip = self.wing_span - body_radius * 0.7
+        
+        left = math.ceil(back) + 2
+        surface = pygame.Surface((left + math.ceil(tip) + 3, 5), pygame.SRCALPHA)
+        pygame.draw.line(surface, WHITE, (left - back, 2), (left + tip, 2), 3)
+        return RotationCache(surface, (left, 2))
+    
     def _draw_shadow(self, screen):
         """Draw shadow beneath the dragon based on height"""
         # Shadow size depends on height
@@ -970,15 +1040,17 @@ class DragonKing:
                     return True
         
         # Lightning collision
+        trogdor_center = (trogdor.x + trogdor.size/2, trogdor.y + trogdor.size/2)
         for bolt in self.lightning_bolts:
+            # Skip bolts whose bounding box is out of reach
+            if not bolt.bounds.inflate(trogdor.size, trogdor.size).collidepoint(trogdor_center):
+                continue
+            
             # Check distance to each segment of the lightning
             for branch in bolt.branches:
                 for i in range(len(branch) - 1):
                     # Check distance to line segment
-                    if self._point_line_distance(
-                        (trogdor.x + trogdor.size/2, trogdor.y + trogdor.size/2),
-                        branch[i], branch[i+1]
-                    ) < trogdor.size/2:
+                    if self._point_line_distance(trogdor_center, branch[i], branch[i+1]) < trogdor.size/2:
                         return True
         
         return False
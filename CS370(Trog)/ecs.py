@@ -0,0 +1,321 @@
+"""
+Small archetype based entity-component-system for the simple enemies.
+
+Every enemy type used to be its own class, each with a copy of the same position,
+timer and random walk code, and every object paid for its own attribute lookups
+each frame. Here an archetype is a fixed set of components, and each component
+field is one contiguous array with a row per entity. Systems loop over those
+arrays for every archetype that has the components they need, so a new enemy type
+is a new archetype and doesn't bring new per-frame loops along.
+
+Rows are packed: despawning moves the last row into the hole. Entities keep a
+stable id, and an EntityRef reads and writes its row through that id, so the rest
+of the game (like the collision registry) can still treat them as objects with x,
+y and size. EntityRefs come from ENTITY_REF_POOL and go back to it on despawn, so
+don't hold on to one after its entity is gone.
+
+Anything that goes over every entity each frame works on the columns instead:
+culling and drawing (Archetype.cull, draw and sprites) and the peasant stomping
+test (Archetype.hits), so a crowd doesn't cost a Python attribute lookup per field.
+
+Components (fields):
+- POSITION: x, y
+- VELOCITY: dir_x, dir_y (unit vector), speed
+- RANDOM_WALK: move_timer, walk_interval
+- CHASER: chasing, chase_start_time
+- SHOOTER: projectile_timer, projectile_cooldown, projectile_size, projectile_speed
+- HITBOX: size
+- RENDERABLE: color (index into the archetype's palette)
+
+Classes:
+- Archetype: Column storage for every entity with one set of components.
+- EntityRef: Object style view of one entity's row.
+- Field: Descriptor an EntityRef reads and writes one component field through.
+
+Functions:
+- random_walk_system(archetype): Pick a new random direction when the walk timer runs out.
+- chase_system(archetype, target_x, target_y, now, flow_field): Turn chasers towards a target.
+- movement_system(archetype, left, top, right, bottom): Step along the velocity, clamped to the field.
+- shooter_system(archetype, target_x, target_y, projectiles, make_projectile): Fire at a target on cooldown.
+- render_system(archetype, screen): Draw every entity of an archetype.
+"""
+import math
+import random
+from array import array
+
+from utils import WIDTH, HEIGHT, UIBARHEIGHT, KNIGHT_CHASE_PROBABILITY
+from trig_tables import unit_vector
+from pool import ObjectPool
+
+POSITION = 'position'
+VELOCITY = 'velocity'
+RANDOM_WALK = 'random_walk'
+CHASER = 'chaser'
+SHOOTER = 'shooter'
+HITBOX = 'hitbox'
+RENDERABLE = 'renderable'
+
+# Field names and array typecodes of every component
+COMPONENTS = {
+    POSITION: (('x', 'd'), ('y', 'd')),
+    VELOCITY: (('dir_x', 'd'), ('dir_y', 'd'), ('speed', 'd')),
+    RANDOM_WALK: (('move_timer', 'l'), ('walk_interval', 'l')),
+    CHASER: (('chasing', 'b'), ('chase_start_time', 'q')),
+    SHOOTER: (('projectile_timer', 'l'), ('projectile_cooldown', 'l'),
+              ('projectile_size', 'l'), ('projectile_speed', 'd')),
+    HITBOX: (('size', 'l'),),
+    RENDERABLE: (('color', 'B'),),
+}
+
+CHASE_DURATION = 5000  # ms a chaser keeps after its target once it starts
+
+class Archetype:
+    def __init__(self, name, components, painter=None, palette=(), sprite=None):
+        self.name = name
+        self.components = frozenset(components)
+        self.columns = {}
+        for component in components:
+            for field, typecode in COMPONENTS[component]:
+                self.columns[field] = array(typecode)
+        self.painter = painter  # painter(screen, archetype, row)
+        self.sprite = sprite  # sprite(color, size) -> surface blitted at x, y, for batched blits
+        self.palette = palette
+        self.ids = []  # Entity id of each row
+        self.rows = {}  # Entity id -> row
+        self.refs = {}  # Entity id -> its EntityRef, so views compare and remove by identity
+        self.visible_rows = []  # Rows found on screen by the last cull
+        self.next_id = 0
+
+    def has(self, *components):
+        return self.components.issuperset(components)
+
+    def spawn(self, **values):
+        """Add an entity, fields left out start at zero. Returns its EntityRef."""
+        entity_id = self.next_id
+        self.next_id += 1
+        for field, column in self.columns.items():
+            column.append(values.pop(field, 0))
+        if values:
+            raise KeyError(f"{self.name} has no fields {sorted(values)}")
+        self.rows[entity_id] = len(self.ids)
+        self.ids.append(entity_id)
+        ref = self.refs[entity_id] = ENTITY_REF_POOL.acquire(self, entity_id)
+        return ref
+
+    def despawn(self, entity_id):
+        # Fill the hole with the last row so the columns stay packed
+        row = self.rows.pop(entity_id)
+        last = len(self.ids) - 1
+        if row != last:
+            for column in self.columns.values():
+                column[row] = column[last]
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+        for column in self.columns.values():
+            column.pop()
+        self.ids.pop()
+        ENTITY_REF_POOL.release(self.refs.pop(entity_id))
+
+    # The game loop treats each archetype like the list of objects it replaced
+    def remove(self, ref):
+        self.despawn(ref.entity_id)
+
+    def clear(self):
+        for column in self.columns.values():
+            del column[:]
+        self.ids.clear()
+        self.rows.clear()
+        ENTITY_REF_POOL.release_all(self.refs.values())
+        self.refs.clear()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        # Over a snapshot, so entities can be despawned while iterating
+        refs = self.refs
+        return iter([refs[entity_id] for entity_id in self.ids])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.refs[entity_id] for entity_id in self.ids[index]]
+        return self.refs[self.ids[index]]
+
+    # The world culls and draws a whole archetype at once, straight from its columns
+    def cull(self, left, top, right, bottom):
+        """Find the rows whose box, padded by its size on each side, touches the given bounds.
+        Returns whether any did."""
+        xs = self.columns['x']
+        ys = self.columns['y']
+        sizes = self.columns['size']
+        visible = self.visible_rows
+        visible.clear()
+        for row in range(len(xs)):
+            x = xs[row]
+            y = ys[row]
+            size = sizes[row]
+            if x + size * 2 >= left and x - size <= right and y + size * 2 >= top and y - size <= bottom:
+                visible.append(row)
+        return bool(visible)
+
+    def draw(self, screen):
+        painter = self.painter
+        for row in self.visible_rows:
+            painter(screen, self, row)
+
+    def sprites(self):
+        # Each colour and size is looked up once, the blit pairs come straight from the columns
+        xs = self.columns['x']
+        ys = self.columns['y']
+        sizes = self.columns['size']
+        colors = self.columns['color']
+        surfaces = {}
+        batch = []
+        for row in self.visible_rows:
+            key = (colors[row], sizes[row])
+            surface = surfaces.get(key)
+            if surface is None:
+                surface = surfaces[key] = self.sprite(self.palette[key[0]], key[1])
+            batch.append((surface, (xs[row], ys[row])))
+        return batch
+
+    def hits(self, x, y, reach):
+        """Ids of the entities less than reach from (x, y) on both axes, in row order."""
+        xs = self.columns['x']
+        ys = self.columns['y']
+        ids = self.ids
+        return [ids[row] for row in range(len(xs)) if abs(x - xs[row]) < reach and abs(y - ys[row]) < reach]
+
+class Field:
+    """One component field on EntityRef, so reading ref.x goes straight to the column
+    instead of missing the slots and falling back to __getattr__."""
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, ref, owner=None):
+        if ref is None:
+            return self
+        archetype = ref.archetype
+        try:
+            column = archetype.columns[self.name]
+        except KeyError:
+            raise AttributeError(f"{archetype.name} has no field {self.name!r}") from None
+        return column[archetype.rows[ref.entity_id]]
+
+    def __set__(self, ref, value):
+        archetype = ref.archetype
+        try:
+            column = archetype.columns[self.name]
+        except KeyError:
+            raise AttributeError(f"{archetype.name} has no field {self.name!r}") from None
+        column[archetype.rows[ref.entity_id]] = value
+
+class EntityRef:
+    __slots__ = ('archetype', 'entity_id')
+
+    def __init__(self, archetype, entity_id):
+        self.reset(archetype, entity_id)
+
+    def reset(self, archetype, entity_id):
+        self.archetype = archetype
+        self.entity_id = entity_id
+
+    def draw(self, screen):
+        archetype = self.archetype
+        archetype.painter(screen, archetype, archetype.rows[self.entity_id])
+
+    def sprites(self):
+        archetype = self.archetype
+        columns = archetype.columns
+        row = archetype.rows[self.entity_id]
+        surface = archetype.sprite(archetype.palette[columns['color'][row]], columns['size'][row])
+        return ((surface, (columns['x'][row], columns['y'][row])),)
+
+for _fields in COMPONENTS.values():
+    for _field, _ in _fields:
+        setattr(EntityRef, _field, Field(_field))
+
+ENTITY_REF_POOL = ObjectPool(EntityRef)
+
+def random_walk_system(archetype):
+    timers = archetype.columns['move_timer']
+    intervals = archetype.columns['walk_interval']
+    dir_x = archetype.columns['dir_x']
+    dir_y = archetype.columns['dir_y']
+    for row in range(len(timers)):
+        timers[row] += 1
+        if timers[row] > intervals[row]:
+            dir_x[row], dir_y[row] = unit_vector(random.uniform(0, 2 * math.pi))
+            timers[row] = 0
+
+def chase_system(archetype, target_x, target_y, now, flow_field=None, chance=KNIGHT_CHASE_PROBABILITY):
+    """Run before random_walk_system. A chaser that is due for a new direction either picks up
+    the chase or is left for the random walk, and while chasing it steers every frame."""
+    xs = archetype.columns['x']
+    ys = archetype.columns['y']
+    dir_x = archetype.columns['dir_x']
+    dir_y = archetype.columns['dir_y']
+    timers = archetype.columns['move_timer']
+    intervals = archetype.columns['walk_interval']
+    chasing = archetype.columns['chasing']
+    started = archetype.columns['chase_start_time']
+    for row in range(len(xs)):
+        if chasing[row] and now - started[row] > CHASE_DURATION:
+            chasing[row] = 0
+        if not chasing[row] and (timers[row] + 1 <= intervals[row] or random.random() >= chance):
+            continue
+        if not chasing[row]:
+            chasing[row] = 1
+            started[row] = now
+        # The random walk adds one before checking, so this resets the timer like a new direction does
+        timers[row] = -1
+        # Go around houses when they are in the way
+        step = flow_field.direction(xs[row], ys[row]) if flow_field else None
+        if step is not None:
+            dir_x[row], dir_y[row] = step
+            continue
+        dx = target_x - xs[row]
+        dy = target_y - ys[row]
+        distance = math.hypot(dx, dy)
+        if distance > 0:
+            dir_x[row], dir_y[row] = dx / distance, dy / distance
+
+def movement_system(archetype, left=0, top=UIBARHEIGHT, right=WIDTH, bottom=HEIGHT):
+    xs = archetype.columns['x']
+    ys = archetype.columns['y']
+    dir_x = archetype.columns['dir_x']
+    dir_y = archetype.columns['dir_y']
+    speeds = archetype.columns['speed']
+    sizes = archetype.columns['size']
+    for row in range(len(xs)):
+        speed = speeds[row]
+        size = sizes[row]
+        xs[row] = max(left, min(right - size, xs[row] + dir_x[row] * speed))
+        ys[row] = max(top, min(bottom - size, ys[row] + dir_y[row] * speed))
+
+def shooter_system(archetype, target_x, target_y, projectiles, make_projectile):
+    xs = archetype.columns['x']
+    ys = archetype.columns['y']
+    sizes = archetype.columns['size']
+    timers = archetype.columns['projectile_timer']
+    cooldowns = archetype.columns['projectile_cooldown']
+    projectile_sizes = archetype.columns['projectile_size']
+    projectile_speeds = archetype.columns['projectile_speed']
+    for row in range(len(xs)):
+        timers[row] -= 1
+        if timers[row] > 0:
+            continue
+        angle = math.atan2(target_y - ys[row], target_x - xs[row])
+        half = sizes[row] // 2
+        projectile = make_projectile(xs[row] + half, ys[row] + half, angle, projectile_sizes[row])
+        projectile.speed = projectile_speeds[row]
+        projectiles.append(projectile)
+        timers[row] = cooldowns[row]
+
+def render_system(archetype, screen):
+    painter = archetype.painter
+    for row in range(len(archetype.ids)):
+        painter(screen, archetype, row)
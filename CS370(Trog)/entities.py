@@ -4,36 +4,74 @@ Defines the main game entities for Trogdor.
 
 Classes:
 - Trogdor: Player character with movement, burnination mode, and drawing methods.
-- Peasant: NPC that moves randomly and can be stomped by Trogdor.
-- Knight: Enemy that chases Trogdor periodically.
 - House: Stationary object that Trogdor can burn in burnination mode.
-- Projectile: Used by bosses, moves in a straight line.
+- Projectile: Used by bosses, moves in a straight line. Pooled in PROJECTILE_POOL.
+
+Entities that always look the same for a given colour and size have a sprites() method
+returning (surface, position) pairs out of ENTITY_SPRITES, so the world can draw a
+whole layer of them with one Surface.blits call.
+
+Functions:
+- peasant_archetype() -> Archetype: NPCs that move randomly and can be stomped by Trogdor.
+- knight_archetype() -> Archetype: Enemies that chase Trogdor periodically.
+- apprentice_mage_archetype() -> Archetype: Enemies that shoot at Trogdor.
+- spawn_peasant(peasants, house): Add a peasant at a house.
+- spawn_knights(knights, count): Add knights at random positions.
+- spawn_apprentice_mages(apprentice_mages, count): Add apprentice mages at random positions.
 """
 
 import pygame
 import random
 import math
-from utils import (BUILDER_COOLDOWN, BUILDER_REPAIR_AMOUNT, BUILDER_REPAIR_RANGE, BUILDER_SIZE, BUILDER_SPEED, CYAN, FPS, HOUSE_HEALTH, HOUSE_SIZE, KNIGHT_CHASE_PROBABILITY, KNIGHT_DIRECTION_CHANGE_INTERVAL,
+from utils import (BUILDER_COOLDOWN, BUILDER_REPAIR_AMOUNT, BUILDER_REPAIR_RANGE, BUILDER_SIZE, BUILDER_SPEED, CYAN, FPS, HOUSE_HEALTH, HOUSE_SIZE, KNIGHT_DIRECTION_CHANGE_INTERVAL,
                    KNIGHT_SIZE, KNIGHT_SPEED, MERLIN_PROJECTILE_SPEED, PEASANT_DIRECTION_CHANGE_INTERVAL,
                    WIDTH, HEIGHT, RED, DARKGREEN, DARKORANGE, GREEN, BLUE, YELLOW, ORANGE, PURPLE, WHITE, BLACK, TROGDOR_SIZE, TROGDOR_SPEED,
                    TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y, PEASANT_SIZE, PEASANT_SPEED, UIBARHEIGHT, LANCER_SPEED, LANCER_SIZE, TELEPORTER_SIZE)
+from trig_tables import unit_vector
+from hazard_map import HazardMap
+from timer_wheel import TimerWheel
+from pool import ObjectPool
+from sprite_cache import SpriteCache, render_circle
+from ecs import Archetype, POSITION, VELOCITY, RANDOM_WALK, CHASER, SHOOTER, HITBOX, RENDERABLE
+
+# Looks of the simple entities, each drawn once and blitted from then on
+ENTITY_SPRITES = SpriteCache()
+
+def _render_square(color, size):
+    # Opaque, in the display's format, so blitting it is a plain copy
+    surface = pygame.Surface((size, size))
+    surface.fill(color)
+    return surface
+
+def _square_sprite(color, size):
+    return ENTITY_SPRITES.get(('square', color, size), lambda: _render_square(color, size))
+
+def _circle_sprite(color, radius):
+    # (surface, offset from the centre)
+    return ENTITY_SPRITES.get(('circle', color, radius), lambda: render_circle(color, radius))
 
 class Trogdor:
-    def __init__(self):
+    def __init__(self, timers=None):
         # Initialize Trogdor's position, size, speed, and other attributes
         self.x = TROGDOR_INITIAL_X
         self.y = TROGDOR_INITIAL_Y
+        self.prev_x, self.prev_y = self.x, self.y  # Where this frame's movement started
+        self.settled = (self.x, self.y)  # Position at the end of the last update
         self.size = TROGDOR_SIZE
         self.speed = TROGDOR_SPEED
         self.peasants_stomped = 0
         self.burnination_mode = False
-        self.burnination_timer = 0
         # New invincibility properties
         self.is_invincible = False
-        self.invincibility_timer = 0
         self.invincibility_duration = 3 * FPS  # 3 seconds at 60 FPS
         self.flash_interval = 10  # Flash every 10 frames
         self.visible = True  # For flashing effect
+        # Burnination and invincibility end on the level's timer wheel, a Trogdor on his own keeps one
+        self.owns_timers = timers is None
+        self.timers = timers if timers is not None else TimerWheel()
+        self.burnination_end = None
+        self.invincibility_end = None
+        self.flash = None
 
     def move(self, dx, dy):
         # Move Trogdor within the screen boundaries
@@ -41,30 +79,50 @@ class Trogdor:
         self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy * self.speed))
 
     def update(self):
-        # Update Trogdor's burnination mode timer
-        if self.burnination_mode:
-            self.burnination_timer -= 1
-            if self.burnination_timer <= 0:
-                self.burnination_mode = False
-                
-        # Update invincibility status
-        if self.is_invincible:
-            self.invincibility_timer -= 1
-            
-            # Handle flashing effect
-            if self.invincibility_timer % self.flash_interval == 0:
-                self.visible = not self.visible
-                
-            # End invincibility when timer expires
-            if self.invincibility_timer <= 0:
-                self.is_invincible = False
-                self.visible = True  # Ensure visibility is restored
+        # Movement this frame ran from where the last update left Trogdor to here
+        self.prev_x, self.prev_y = self.settled
+        self.settled = (self.x, self.y)
+        if self.owns_timers:
+            self.timers.advance()
+
+    @property
+    def burnination_timer(self):
+        # Frames of burnination left, for the burnination bar
+        return self.burnination_end.remaining if self.burnination_end else 0
+
+    @property
+    def invincibility_timer(self):
+        return self.invincibility_end.remaining if self.invincibility_end else 0
+
+    def start_burnination(self, duration):
+        self.end_burnination()
+        self.burnination_mode = True
+        self.burnination_end = self.timers.schedule(duration, self.end_burnination)
+
+    def end_burnination(self):
+        self.burnination_mode = False
+        if self.burnination_end:
+            self.burnination_end.cancel()
 
     def make_invincible(self):
         """Make Trogdor invincible for the set duration."""
+        self.end_invincibility()
         self.is_invincible = True
-        self.invincibility_timer = self.invincibility_duration
-        self.visible = True  # Reset visibility state
+        self.invincibility_end = self.timers.schedule(self.invincibility_duration, self.end_invincibility)
+        self.flash = self.timers.every(self.flash_interval, self.toggle_visible)
+        # Trogdor is usually put back at the start after a hit, which isn't movement to sweep
+        self.settled = (self.x, self.y)
+
+    def end_invincibility(self):
+        self.is_invincible = False
+        self.visible = True  # Ensure visibility is restored
+        for timer in (self.invincibility_end, self.flash):
+            if timer:
+                timer.cancel()
+
+    def toggle_visible(self):
+        # Flashing effect while invincible
+        self.visible = not self.visible
 
     def draw(self, screen):
         # Draw Trogdor on the screen, changing color if in burnination mode
@@ -79,75 +137,75 @@ class Trogdor:
         pygame.draw.circle(screen, BLACK, (self.x + 5, self.y + 7), 2)
         pygame.draw.circle(screen, BLACK, (self.x + 15, self.y + 7), 2)
 
-class Peasant:
-    def __init__(self, house):
-        # Initialize Peasant's position, size, speed, and movement direction
-        self.x = house.x
-        self.y = house.y
-        self.size = PEASANT_SIZE
-        self.speed = PEASANT_SPEED
-        self.direction = random.uniform(0, 2 * math.pi)
-        self.move_timer = 0
-
-    def move(self):
-        # Move Peasant in a random direction, changing direction periodically
-        self.move_timer += 1
-        if self.move_timer > PEASANT_DIRECTION_CHANGE_INTERVAL:
-            self.direction = random.uniform(0, 2 * math.pi)
-            self.move_timer = 0
-        
-        dx = math.cos(self.direction) * self.speed
-        dy = math.sin(self.direction) * self.speed
-        self.x = max(0, min(WIDTH - self.size, self.x + dx))
-        self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
-
-    def draw(self, screen):
-        # Draw Peasant on the screen
-        pygame.draw.rect(screen, GREEN, (self.x, self.y, self.size, self.size))
-
-class Knight:
-    def __init__(self):
-        # Initialize Knight's position, size, speed, and movement direction
-        self.x = random.randint(0, WIDTH)
-        self.y = random.randint(UIBARHEIGHT, HEIGHT)
-        self.size = KNIGHT_SIZE
-        self.speed = KNIGHT_SPEED
-        self.direction = random.uniform(0, 2 * math.pi)
-        self.move_timer = 0
-        self.chasing = False
-        self.chase_start_time = 0  #Timer for chasing behavior
-
-    def move(self, trogdor):
-        # Move Knight, chasing Trogdor if close enough
-        self.move_timer += 1
-        current_time = pygame.time.get_ticks()  # Get current time
-
-        if self.chasing and current_time - self.chase_start_time > 5000:  # 5000 ms = 5 seconds
-            self.chasing = False  # Stop chasing after 5 seconds
-
-        if self.move_timer > KNIGHT_DIRECTION_CHANGE_INTERVAL or self.chasing:
-            if random.random() < KNIGHT_CHASE_PROBABILITY or self.chasing:
-                self.chase(trogdor)
-            else:
-                self.direction = random.uniform(0, 2 * math.pi)
-            self.move_timer = 0
-        
-        dx = math.cos(self.direction) * self.speed
-        dy = math.sin(self.direction) * self.speed
-        self.x = max(0, min(WIDTH - self.size, self.x + dx))
-        self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
-
-    def chase(self, trogdor):
-        # Set Knight's direction towards Trogdor
-        if not self.chasing:
-            self.chasing = True
-            self.chase_start_time = pygame.time.get_ticks()  # Start the chase timer
-        angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
-        self.direction = angle
-
-    def draw(self, screen):
-        # Draw Knight on the screen
-        pygame.draw.rect(screen, BLUE, (self.x, self.y, self.size, self.size))
+# Peasants, knights and apprentice mages only walk, chase and shoot, so they live in
+# ecs archetypes instead of classes and are moved by the systems in ecs.py
+
+def _draw_square(screen, archetype, row):
+    columns = archetype.columns
+    size = columns['size'][row]
+    pygame.draw.rect(screen, archetype.palette[columns['color'][row]],
+                     (columns['x'][row], columns['y'][row], size, size))
+
+def _draw_apprentice_mage(screen, archetype, row):
+    # A square with a white circle in the middle to distinguish from other enemies
+    _draw_square(screen, archetype, row)
+    columns = archetype.columns
+    size = columns['size'][row]
+    center_x = columns['x'][row] + size // 2
+    center_y = columns['y'][row] + size // 2
+    pygame.draw.circle(screen, WHITE, (int(center_x), int(center_y)), size // 4)
+
+def _render_apprentice_mage(color, size):
+    surface = _render_square(color, size)
+    pygame.draw.circle(surface, WHITE, (size // 2, size // 2), size // 4)
+    return surface
+
+def _apprentice_mage_sprite(color, size):
+    return ENTITY_SPRITES.get(('apprentice_mage', color, size), lambda: _render_apprentice_mage(color, size))
+
+def peasant_archetype():
+    """NPCs that walk randomly and can be stomped by Trogdor."""
+    return Archetype('peasant', (POSITION, VELOCITY, RANDOM_WALK, HITBOX, RENDERABLE),
+                     _draw_square, (GREEN,), _square_sprite)
+
+def knight_archetype():
+    """Enemies that walk randomly and now and then chase Trogdor for a while."""
+    return Archetype('knight', (POSITION, VELOCITY, RANDOM_WALK, CHASER, HITBOX, RENDERABLE),
+                     _draw_square, (BLUE,), _square_sprite)
+
+def apprentice_mage_archetype():
+    """Slow random walkers that shoot at Trogdor every two seconds."""
+    return Archetype('apprentice_mage', (POSITION, VELOCITY, RANDOM_WALK, SHOOTER, HITBOX, RENDERABLE),
+                     _draw_apprentice_mage, (PURPLE,), _apprentice_mage_sprite)
+
+def _random_heading():
+    dir_x, dir_y = unit_vector(random.uniform(0, 2 * math.pi))
+    return {'dir_x': dir_x, 'dir_y': dir_y}
+
+def spawn_peasant(peasants, house):
+    # Peasants come out of a house
+    return peasants.spawn(x=house.x, y=house.y, speed=PEASANT_SPEED, size=PEASANT_SIZE,
+                          walk_interval=PEASANT_DIRECTION_CHANGE_INTERVAL, **_random_heading())
+
+def spawn_knights(knights, count):
+    for _ in range(count):
+        knights.spawn(x=random.randint(0, WIDTH), y=random.randint(UIBARHEIGHT, HEIGHT),
+                      speed=KNIGHT_SPEED, size=KNIGHT_SIZE,
+                      walk_interval=KNIGHT_DIRECTION_CHANGE_INTERVAL, **_random_heading())
+
+def spawn_apprentice_mages(apprentice_mages, count):
+    for _ in range(count):
+        apprentice_mages.spawn(x=random.randint(0, WIDTH - KNIGHT_SIZE),
+                               y=random.randint(UIBARHEIGHT, HEIGHT - KNIGHT_SIZE),
+                               speed=KNIGHT_SPEED * 0.75,  # Slower than knights
+                               size=KNIGHT_SIZE, walk_interval=KNIGHT_DIRECTION_CHANGE_INTERVAL,
+                               projectile_cooldown=120,  # 2 seconds at 60 FPS
+                               projectile_timer=120,
+                               projectile_size=10,  # Smaller than Merlin's projectiles
+                               projectile_speed=MERLIN_PROJECTILE_SPEED * 0.65,  # Slower than Merlin's projectiles
+                               **_random_heading())
+
+HOUSE_HEALTH_BAR_HEIGHT = 5
 
 class House:
     def __init__(self):
@@ -159,14 +217,14 @@ class House:
         self.max_health = HOUSE_HEALTH
         self.is_destroyed = False  # New flag for destroyed houses
 
-    def draw(self, screen):
-        # Draw House on the screen with a health bar
+    def appearance(self):
+        """What draw() shows: the house color and the health bar width in whole pixels, None once destroyed."""
         # Change color based on health percentage
         health_percent = self.health / self.max_health
         
         if self.is_destroyed:
             # Destroyed house (burnt black)
-            house_color = BLACK
+            return BLACK, None
         elif health_percent < 0.3:
             # Severely damaged house (reddish)
             house_color = (150, 50, 0)  # Dark red/brown
@@ -176,15 +234,22 @@ class House:
         else:
             # Healthy house (yellow)
             house_color = YELLOW
-            
+        # pygame cuts rect sizes down to whole pixels
+        return house_color, int(self.size * health_percent)
+
+    def bounds(self):
+        # The house and the health bar above it
+        return pygame.Rect(self.x, self.y - HOUSE_HEALTH_BAR_HEIGHT - 2, self.size, self.size + HOUSE_HEALTH_BAR_HEIGHT + 2)
+
+    def draw(self, screen):
+        # Draw House on the screen with a health bar
+        house_color, health_bar_width = self.appearance()
         pygame.draw.rect(screen, house_color, (self.x, self.y, self.size, self.size))
         
         # Only show health bar if house isn't destroyed
-        if not self.is_destroyed:
-            health_bar_height = 5
-            health_bar_width = self.size * health_percent
-            pygame.draw.rect(screen, GREEN, (self.x, self.y - health_bar_height - 2, 
-                                          health_bar_width, health_bar_height))
+        if health_bar_width is not None:
+            pygame.draw.rect(screen, GREEN, (self.x, self.y - HOUSE_HEALTH_BAR_HEIGHT - 2, 
+                                          health_bar_width, HOUSE_HEALTH_BAR_HEIGHT))
 
 class Guardian:
     def __init__(self, house):
@@ -205,6 +270,9 @@ class Guardian:
         #Draw guardian on screen
         pygame.draw.rect(screen, PURPLE, (self.x, self.y, self.size, self.size))
 
+    def sprites(self):
+        return ((_square_sprite(PURPLE, self.size), (self.x, self.y)),)
+
 class Teleporter:
     def __init__(self):
         # Initialize Trogdor's position, size, speed, and other attributes
@@ -213,37 +281,65 @@ class Teleporter:
         self.size = TELEPORTER_SIZE
         self.jumpsize = 100
 
-    def move(self, trogdor):
-        # Move Trogdor within the screen boundaries
+    def move(self, trogdor, flow_field=None):
+        # Jump along the way around houses when they are in the way. The field is grown for
+        # knights, so a teleporter checks where it lands and shortens the jump to miss houses
+        step = flow_field.direction(self.x, self.y) if flow_field else None
+        if step is not None:
+            for jump in (self.jumpsize, self.jumpsize / 2, self.jumpsize / 4):
+                x = max(0, min(WIDTH - self.size, self.x + step[0] * jump))
+                y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + step[1] * jump))
+                if flow_field.box_clear(x, y, self.size):
+                    self.x = x
+                    self.y = y
+                    return
+        
+        # Otherwise straight at Trogdor, within the screen boundaries
         angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
         dx = math.cos(angle) * self.jumpsize
         dy = math.sin(angle) * self.jumpsize
         if ((abs(dx) > abs(self.x - trogdor.x)) & (abs(dy) > abs(self.y - trogdor.y))):
-            self.x = trogdor.x
-            self.y = trogdor.y
+            x = trogdor.x
+            y = trogdor.y
         else:
-            self.x = max(0, min(WIDTH - self.size, self.x + dx))
-            self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
+            x = max(0, min(WIDTH - self.size, self.x + dx))
+            y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
+        if step is not None and not flow_field.box_clear(x, y, self.size):
+            return  # Houses all round, wait for Trogdor to move the field
+        self.x = x
+        self.y = y
 
     def draw(self, screen):
         pygame.draw.rect(screen, DARKGREEN, (self.x, self.y, self.size, self.size)) # Body
 
+    def sprites(self):
+        return ((_square_sprite(DARKGREEN, self.size), (self.x, self.y)),)
+
 
 class Projectile:
+    # Made through PROJECTILE_POOL, and released to it when taken out of play
     def __init__(self, x, y, angle, size):
+        self.reset(x, y, angle, size)
+
+    def reset(self, x, y, angle, size):
         self.x = x
         self.y = y
         self.speed = MERLIN_PROJECTILE_SPEED
         self.angle = angle
+        self.dir_x, self.dir_y = unit_vector(angle)  # Fixed for the projectile's lifetime
         self.size = size
 
     def move(self):
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
+        self.x += self.dir_x * self.speed
+        self.y += self.dir_y * self.speed
 
     def draw(self, screen):
         pygame.draw.circle(screen, YELLOW, (int(self.x), int(self.y)), self.size)
 
+    def sprites(self):
+        surface, (offset_x, offset_y) = _circle_sprite(YELLOW, self.size)
+        return ((surface, (int(self.x) + offset_x, int(self.y) + offset_y)),)
+
 
 class Lancer:
     def __init__(self):
@@ -307,38 +403,66 @@ class Lancer:
       elif self.movement_axis == "horizontal":
         pygame.draw.rect(screen, DARKORANGE, (self.x, self.y, self.size, self.size))
         pygame.draw.rect(screen, BLACK, (self.x, self.y + 5, self.size, self.size/2))
+
+    def sprites(self):
+        axis = self.movement_axis
+        sprite = ENTITY_SPRITES.get(('lancer', axis, self.size), lambda: self._render(axis, self.size))
+        return ((sprite, (self.x, self.y)),)
+
+    @staticmethod
+    def _render(axis, size):
+        # Same stripe as draw(), across the axis the lancer charges along
+        surface = _render_square(DARKORANGE, size)
+        if axis == "vertical":
+            pygame.draw.rect(surface, BLACK, (5, 0, size/2, size))
+        else:
+            pygame.draw.rect(surface, BLACK, (0, 5, size, size/2))
+        return surface
           
 class Trapper:
-    def __init__(self):
+    def __init__(self, hazards=None, timers=None):
         # Initialize Trapper's position, size, speed, and movement direction
         self.x = random.randint(0, WIDTH)
         self.y = random.randint(UIBARHEIGHT, HEIGHT)
         self.size = KNIGHT_SIZE
         self.speed = KNIGHT_SPEED
-        self.direction = random.uniform(0, 2 * math.pi)
-        self.move_timer = 0
-        self.trap_timer = 0  # Timer for placing traps
+        self.set_direction(random.uniform(0, 2 * math.pi))
         self.traps = []  # List to store traps
+        # Traps are stamped into a hazard map, shared by all the trappers of a level
+        self.hazards = hazards if hazards is not None else HazardMap()
+        # Turning and trap placing run on the level's timer wheel, a trapper on its own keeps one
+        self.owns_timers = timers is None
+        self.timers = timers if timers is not None else TimerWheel()
+        self.turn_timer = self.timers.every(121, self.turn)  # After 120 frames of walking
+        self.trap_timer = self.timers.every(180, self.place_trap)  # 3 seconds at 60 FPS
+
+    def set_direction(self, angle):
+        # Cache the unit vector so move() doesn't call cos/sin every frame
+        self.direction = angle
+        self.dir_x, self.dir_y = unit_vector(angle)
+
+    def turn(self):
+        # Change to a new random direction
+        self.set_direction(random.uniform(0, 2 * math.pi))
 
     def move(self):
-        # Move Trapper in a random direction, changing direction periodically
-        self.move_timer += 1
-        if self.move_timer > 120:
-            self.direction = random.uniform(0, 2 * math.pi)
-            self.move_timer = 0
-        
-        dx = math.cos(self.direction) * self.speed
-        dy = math.sin(self.direction) * self.speed
+        # Move Trapper in its current direction
+        if self.owns_timers:
+            self.timers.advance()
+        dx = self.dir_x * self.speed
+        dy = self.dir_y * self.speed
         self.x = max(0, min(WIDTH - self.size, self.x + dx))
         self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
 
     def place_trap(self):
-        # Place a trap every 180 frames (3 seconds at 60 FPS)
-        self.trap_timer += 1
-        if self.trap_timer >= 180 and len(self.traps) < 6:
-            new_trap = Trap(self)  # Create a new Trap instance at the Trapper's location
-            self.traps.append(new_trap)
-            self.trap_timer = 0
+        # Called by the trap timer, a trapper stops once it has 6 traps out
+        new_trap = TRAP_POOL.acquire(self)  # A Trap at the Trapper's location
+        self.traps.append(new_trap)
+        # Trogdor is caught when his position is within his size of the trap on both axes
+        self.hazards.stamp_rect(new_trap.x - TROGDOR_SIZE, new_trap.y - TROGDOR_SIZE,
+                                TROGDOR_SIZE * 2, TROGDOR_SIZE * 2)
+        if len(self.traps) >= 6:
+            self.trap_timer.cancel()
 
     def draw(self, screen):
         # Draw Trapper on the screen
@@ -347,10 +471,22 @@ class Trapper:
         for trap in self.traps:
             trap.draw(screen)
 
+    def sprites(self):
+        # The body, then the traps over it like draw()
+        sprites = [(_square_sprite(DARKORANGE, self.size), (self.x, self.y))]
+        for trap in self.traps:
+            sprites.extend(trap.sprites())
+        return sprites
+
 class Trap:
+    # Made through TRAP_POOL, the world releases a level's traps when it is torn down
     def __init__(self, trapper):
-        self.x = trapper.x
-        self.y = trapper.y
+        self.reset(trapper)
+
+    def reset(self, trapper):
+        # On whole pixels, lines drawn at sub-pixel positions come out differently than the sprite
+        self.x = round(trapper.x)
+        self.y = round(trapper.y)
         self.size = PEASANT_SIZE
 
     def draw(self, screen):
@@ -363,119 +499,92 @@ class Trap:
         # Line 2: top-right to bottom-left
         pygame.draw.line(screen, RED, (self.x + half_size, self.y - half_size), (self.x - half_size, self.y + half_size), 4)
 
-class ApprenticeMage:
-    def __init__(self):
-        self.x = random.randint(0, WIDTH - KNIGHT_SIZE)
-        self.y = random.randint(UIBARHEIGHT, HEIGHT - KNIGHT_SIZE)
-        self.size = KNIGHT_SIZE
-        self.speed = KNIGHT_SPEED * 0.75  # Slower than knights
-        self.direction = random.uniform(0, 2 * math.pi)
-        self.move_timer = 0
-        self.projectile_cooldown = 120  # 2 seconds at 60 FPS
-        self.projectile_timer = self.projectile_cooldown
-        self.projectile_size = 10  # Smaller than Merlin's projectiles
+    def sprites(self):
+        surface, (offset_x, offset_y) = ENTITY_SPRITES.get(('trap', self.size), lambda: self._render(self.size))
+        return ((surface, (self.x + offset_x, self.y + offset_y)),)
 
-    def move(self, trogdor):
-        # Change direction periodically
-        self.move_timer += 1
-        if self.move_timer > KNIGHT_DIRECTION_CHANGE_INTERVAL:
-            self.direction = random.uniform(0, 2 * math.pi)
-            self.move_timer = 0
-        
-        # Move in current direction
-        dx = math.cos(self.direction) * self.speed
-        dy = math.sin(self.direction) * self.speed
-        self.x = max(0, min(WIDTH - self.size, self.x + dx))
-        self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
-
-    def update(self, trogdor, projectiles):
-        self.move(trogdor)
-        self.projectile_timer -= 1
-        
-        # Fire projectile when cooldown reaches 0
-        if self.projectile_timer <= 0:
-            self.fire_projectile(trogdor, projectiles)
-            self.projectile_timer = self.projectile_cooldown
-
-    def fire_projectile(self, trogdor, projectiles):
-        # Calculate angle to target
-        angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
-        # Create new projectile
-        new_projectile = Projectile(
-            self.x + self.size // 2,
-            self.y + self.size // 2,
-            angle,
-            self.projectile_size
-        )
-        new_projectile.speed = MERLIN_PROJECTILE_SPEED * 0.65  # Slower than Merlin's projectiles
-        projectiles.append(new_projectile)
+    @staticmethod
+    def _render(size):
+        half_size = size // 2
+        center = half_size + 3  # Room for the line width
+        surface = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.line(surface, RED, (center - half_size, center - half_size), (center + half_size, center + half_size), 4)
+        pygame.draw.line(surface, RED, (center + half_size, center - half_size), (center - half_size, center + half_size), 4)
+        return surface, (-center, -center)
 
-    def draw(self, screen):
-        # Draw the apprentice mage as a purple square
-        pygame.draw.rect(screen, PURPLE, (self.x, self.y, self.size, self.size))
-        # Add a white circle in the middle to distinguish from other enemies
-        center_x = self.x + self.size // 2
-        center_y = self.y + self.size // 2
-        pygame.draw.circle(screen, WHITE, (int(center_x), int(center_y)), self.size // 4)
+PROJECTILE_POOL = ObjectPool(Projectile)
+TRAP_POOL = ObjectPool(Trap)
 
 class Builder:
-    def __init__(self):
+    def __init__(self, timers=None):
         # Initialize Builder's position, size, speed, and movement direction
         self.x = random.randint(0, WIDTH - BUILDER_SIZE)
         self.y = random.randint(UIBARHEIGHT, HEIGHT - BUILDER_SIZE)
         self.size = BUILDER_SIZE
         self.speed = BUILDER_SPEED
-        self.direction = random.uniform(0, 2 * math.pi)
+        self.set_direction(random.uniform(0, 2 * math.pi))
         self.move_timer = 0
         self.state = "roaming"  # States: "roaming", "repairing", "cooldown"
-        self.cooldown_timer = 0
+        # Cooldowns end on the level's timer wheel, a builder on its own keeps one
+        self.owns_timers = timers is None
+        self.timers = timers if timers is not None else TimerWheel()
+        self.cooldown = None
         self.target_house = None
         self.repair_rate = 1  # Health points repaired per frame
         self.repair_timer = 0
         self.repair_interval = 10  # Repair every 10 frames (6 times per second at 60 FPS)
 
+    def set_direction(self, angle):
+        # Cache the unit vector so move() doesn't call cos/sin every frame
+        self.direction = angle
+        self.dir_x, self.dir_y = unit_vector(angle)
+
+    @property
+    def cooldown_timer(self):
+        # Frames of cooldown left, for the clock drawn over the builder
+        return self.cooldown.remaining if self.cooldown else 0
+
+    def start_cooldown(self, houses):
+        houses.release(self)
+        self.state = "cooldown"
+        self.cooldown = self.timers.schedule(BUILDER_COOLDOWN, self.end_cooldown)
+        self.target_house = None
+        self.repair_timer = 0
+
+    def end_cooldown(self):
+        self.state = "roaming"
+        self.target_house = None
+
     def move(self, houses):
-        # Update state based on houses
-        if self.state == "cooldown":
-            self.cooldown_timer -= 1
-            if self.cooldown_timer <= 0:
-                self.state = "roaming"
-                self.target_house = None
+        # Update state based on houses, a HouseRegistry
+        if self.owns_timers:
+            self.timers.advance()
                 
         if self.state == "roaming":
-            # Check for damaged houses
-            damaged_houses = [house for house in houses if house.health < HOUSE_HEALTH and not house.is_destroyed]
-            if damaged_houses:
-                # Find nearest damaged house
-                nearest_house = min(damaged_houses, 
-                                   key=lambda h: math.sqrt((self.x - h.x)**2 + (self.y - h.y)**2))
+            # Claim the nearest damaged house no other builder is already repairing
+            nearest_house = houses.claim_repair(self)
+            if nearest_house:
                 self.target_house = nearest_house
                 self.state = "repairing"
             else:
                 # Roam randomly like peasants
                 self.move_timer += 1
                 if self.move_timer > PEASANT_DIRECTION_CHANGE_INTERVAL:
-                    self.direction = random.uniform(0, 2 * math.pi)
+                    self.set_direction(random.uniform(0, 2 * math.pi))
                     self.move_timer = 0
                 
-                dx = math.cos(self.direction) * self.speed
-                dy = math.sin(self.direction) * self.speed
+                dx = self.dir_x * self.speed
+                dy = self.dir_y * self.speed
                 self.x = max(0, min(WIDTH - self.size, self.x + dx))
                 self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, self.y + dy))
                 
         elif self.state == "repairing":
             if not self.target_house or self.target_house.is_destroyed:
                 # House is gone or destroyed
-                self.state = "cooldown"
-                self.cooldown_timer = BUILDER_COOLDOWN
-                self.target_house = None
-                self.repair_timer = 0
+                self.start_cooldown(houses)
             elif self.target_house.health >= HOUSE_HEALTH:
                 # House is fully repaired
-                self.state = "cooldown"
-                self.cooldown_timer = BUILDER_COOLDOWN
-                self.target_house = None
-                self.repair_timer = 0
+                self.start_cooldown(houses)
             else:
                 # Move towards target house
                 dx = self.target_house.x - self.x
@@ -486,7 +595,7 @@ class Builder:
                     # We're close enough to repair - do a small repair each tick
                     self.repair_timer += 1
                     if self.repair_timer >= self.repair_interval:
-                        self.repair_house()
+                        self.repair_house(houses)
                         self.repair_timer = 0
                 else:
                     # Move towards house
@@ -494,10 +603,10 @@ class Builder:
                     self.x += (dx / distance) * speed
                     self.y += (dy / distance) * speed
 
-    def repair_house(self):
+    def repair_house(self, houses):
         if self.target_house and not self.target_house.is_destroyed:
-            # Repair by a small amount each time
-            self.target_house.health = min(HOUSE_HEALTH, self.target_house.health + self.repair_rate)
+            # Repair by a small amount each time, through the registry so it sees the change
+            houses.repair(self.target_house, self.repair_rate)
 
     def draw(self, screen):
         # Draw Builder on the screen
@@ -0,0 +1,177 @@
+"""
+Shared flow field that leads chasing enemies to Trogdor around obstacles.
+
+Instead of every chaser aiming straight at Trogdor on its own, one breadth first
+pass over a coarse grid works out how many steps each cell is from Trogdor's cell,
+going around houses. A chaser then reads its next step from its own cell and the
+eight around it, which costs the same however many chasers or houses there are.
+The pass only runs again when Trogdor changes cell or the obstacles change.
+
+Cells Trogdor can be seen from in a straight line are worked out as chasers ask
+about them. A chaser in one of those heads straight at him, as before, so the grid's eight directions
+only show when there is something in the way.
+
+Positions are entity top-left corners, like Trogdor's and the chasers' own x and y,
+so obstacles are grown by the chaser size on their top and left sides. Entities
+bigger than that, or that jump over cells like teleporters, check where they land
+with box_clear.
+
+Classes:
+- FlowField: Step counts to a target cell, visibility flags and per-position directions.
+"""
+import math
+from array import array
+from collections import deque
+from utils import WIDTH, HEIGHT, FLOW_FIELD_CELL_SIZE
+
+SEEN = 1  # Values in FlowField.visible, 0 is not worked out yet
+HIDDEN = 2
+
+DIAGONAL = 1 / math.sqrt(2)
+# (column step, row step, unit x, unit y) for the eight neighbours of a cell
+NEIGHBOURS = ((1, 0, 1.0, 0.0), (-1, 0, -1.0, 0.0), (0, 1, 0.0, 1.0), (0, -1, 0.0, -1.0),
+              (1, 1, DIAGONAL, DIAGONAL), (1, -1, DIAGONAL, -DIAGONAL),
+              (-1, 1, -DIAGONAL, DIAGONAL), (-1, -1, -DIAGONAL, -DIAGONAL))
+
+class FlowField:
+    def __init__(self, cell_size=FLOW_FIELD_CELL_SIZE, width=WIDTH, height=HEIGHT):
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.blocked = bytearray(self.cols * self.rows)
+        self.sight_blocked = bytearray(self.cols * self.rows)  # blocked plus a cell all round
+        self.distance = array('q', [-1]) * (self.cols * self.rows)  # -1 where the target can't be reached
+        self.visible = bytearray(self.cols * self.rows)  # SEEN, HIDDEN or 0 for not worked out yet
+        self.obstacles = ()  # Rectangles currently marked in blocked
+        self.rects = ()  # The same rectangles before they were grown
+        self.target = None  # (col, row) the field currently leads to
+        
+    def set_obstacles(self, rects, grow=0):
+        """Mark the cells covered by (left, top, width, height) rectangles, each grown by
+        grow pixels up and left. Does nothing if the obstacles haven't changed."""
+        obstacles = tuple((left - grow, top - grow, width + grow, height + grow)
+                          for left, top, width, height in rects)
+        if obstacles == self.obstacles:
+            return
+        self.obstacles = obstacles
+        self.rects = tuple(rects)
+        self.blocked = bytearray(self.cols * self.rows)
+        self.sight_blocked = bytearray(self.cols * self.rows)
+        size = self.cell_size
+        for left, top, width, height in obstacles:
+            for row in self._span(top, top + height, self.rows):
+                for col in self._span(left, left + width, self.cols):
+                    self.blocked[row * self.cols + col] = 1
+            # A chaser is anywhere in its cell, not at the centre the sight lines are
+            # traced from, so straight runs keep an extra cell away from obstacles
+            for row in self._span(top - size, top + height + size, self.rows):
+                for col in self._span(left - size, left + width + size, self.cols):
+                    self.sight_blocked[row * self.cols + col] = 1
+        self.target = None  # Paths have to be worked out again
+        
+    def update(self, x, y):
+        """Lead the field to (x, y). Only recomputed when that is a different cell."""
+        target = self._cell(x, y)
+        if target != self.target:
+            self.target = target
+            self._integrate(target)
+            self.visible = bytearray(self.cols * self.rows)
+            self.visible[target[1] * self.cols + target[0]] = SEEN
+            
+    def direction(self, x, y):
+        """Unit (dx, dy) for a chaser at (x, y) to follow, or None when it should head
+        straight for the target: it can see it, or there is no way around."""
+        col, row = self._cell(x, y)
+        index = row * self.cols + col
+        if self.distance[index] == 0 or self._sees_target(col, row):
+            return None
+        
+        best = None
+        best_distance = self.distance[index]
+        if best_distance < 0:
+            # Standing in a blocked cell, any open neighbour is a way out
+            best_distance = len(self.distance)
+        for step_col, step_row, unit_x, unit_y in NEIGHBOURS:
+            next_col = col + step_col
+            next_row = row + step_row
+            if not (0 <= next_col < self.cols and 0 <= next_row < self.rows):
+                continue
+            # Don't cut the corner of an obstacle on a diagonal step
+            if step_col and step_row and (self.blocked[row * self.cols + next_col] or
+                                          self.blocked[next_row * self.cols + col]):
+                continue
+            distance = self.distance[next_row * self.cols + next_col]
+            if 0 <= distance < best_distance:
+                best = (unit_x, unit_y)
+                best_distance = distance
+        return best
+        
+    def box_clear(self, left, top, size):
+        """Whether a size by size box at (left, top) overlaps none of the obstacles. The
+        cells only keep chasers of the grown size out, bigger or jumping ones check here."""
+        right = left + size
+        bottom = top + size
+        for rect_left, rect_top, width, height in self.rects:
+            if left < rect_left + width and rect_left < right and top < rect_top + height and rect_top < bottom:
+                return False
+        return True
+        
+    def _integrate(self, target):
+        # Breadth first from the target over open cells. The target itself always
+        # counts, so a target standing on an obstacle is still reachable next to it.
+        cols = self.cols
+        distance = array('q', [-1]) * (cols * self.rows)
+        start = target[1] * cols + target[0]
+        distance[start] = 0
+        queue = deque([start])
+        while queue:
+            index = queue.popleft()
+            next_distance = distance[index] + 1
+            col = index % cols
+            for neighbour in (index - 1 if col > 0 else -1,
+                              index + 1 if col < cols - 1 else -1,
+                              index - cols, index + cols):
+                if 0 <= neighbour < len(distance) and distance[neighbour] < 0 and not self.blocked[neighbour]:
+                    distance[neighbour] = next_distance
+                    queue.append(neighbour)
+        self.distance = distance
+        
+    def _sees_target(self, col, row):
+        # A cell sees the target if it is open and so is the cell one step back along
+        # the straight line to the target. Answers are kept until the target moves,
+        # so each cell's chain is only walked once however many chasers ask.
+        cols = self.cols
+        target_col, target_row = self.target
+        chain = []
+        index = row * cols + col
+        while not self.visible[index]:
+            if self.sight_blocked[index]:
+                seen = HIDDEN
+                break
+            chain.append(index)
+            dx = col - target_col
+            dy = row - target_row
+            # One step along the longer axis, the other axis scaled to stay on the line
+            if abs(dx) >= abs(dy):
+                back_dx = dx - (dx > 0) + (dx < 0)
+                back_dy = round(dy * back_dx / dx)
+            else:
+                back_dy = dy - (dy > 0) + (dy < 0)
+                back_dx = round(dx * back_dy / dy)
+            col = target_col + back_dx
+            row = target_row + back_dy
+            index = row * cols + col
+        else:
+            seen = self.visible[index]
+        for index in chain:
+            self.visible[index] = seen
+        return seen == SEEN
+        
+    def _cell(self, x, y):
+        # Clamped, chasers can stand right on the screen edge
+        return (min(self.cols - 1, max(0, int(x // self.cell_size))),
+                min(self.rows - 1, max(0, int(y // self.cell_size))))
+        
+    def _span(self, low, high, count):
+        # Cell indices between two coordinates, clipped to the grid
+        return range(max(0, int(low // self.cell_size)), min(count - 1, int(high // self.cell_size)) + 1)
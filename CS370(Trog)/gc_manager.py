@@ -0,0 +1,135 @@
+"""
+Garbage collector instrumentation and gameplay aware collection scheduling.
+
+Boss phases make a lot of short lived particle dicts and temporary lists, and the
+cyclic collector tends to run in the middle of them, which shows up as frame time
+spikes. The manager times every collection through gc.callbacks, with the frame
+it happened on, and writes them to a CSV profile.
+
+With scheduling turned on (GC_SCHEDULING, off by default), the manager collects
+and then freezes everything a level loaded (houses, enemies, sprites, sounds) so
+later collections don't walk it again, and raises the collection thresholds while
+the level is played. Full collections are done explicitly instead, when play is
+paused anyway: at level transitions, cutscenes, the power-up screen and the menus.
+
+Classes:
+- GCManager: Collection log, per-frame pause totals and the scheduling mode.
+"""
+import gc
+import time
+
+from utils import GC_SCHEDULING, GC_GAMEPLAY_THRESHOLDS, GC_PROFILE_PATH
+
+class GCManager:
+    def __init__(self, scheduling=GC_SCHEDULING, gameplay_thresholds=GC_GAMEPLAY_THRESHOLDS,
+                 profile_path=GC_PROFILE_PATH):
+        self.scheduling = scheduling
+        self.gameplay_thresholds = gameplay_thresholds
+        self.profile_path = profile_path  # None only keeps the per-generation totals
+        self.default_thresholds = gc.get_threshold()
+        self.installed = False
+        self.frame = 0  # Frames counted by next_frame, collections are logged against it
+        self.reason = 'automatic'  # Why the running collection happened
+        self.started = 0.0
+        self.pending = []  # (frame, generation, duration_ms, collected, uncollectable, reason) not yet written
+        self.header_written = False
+        self.frame_pause_ms = 0.0  # Time spent collecting in the current frame
+        self.worst_frame_pause_ms = 0.0
+        self.worst_frame = 0
+        # generation -> [collections, total ms, longest ms]
+        self.totals = {generation: [0, 0.0, 0.0] for generation in range(3)}
+
+    def install(self):
+        if not self.installed:
+            gc.callbacks.append(self._callback)
+            self.installed = True
+
+    def uninstall(self):
+        if self.installed:
+            gc.callbacks.remove(self._callback)
+            self.installed = False
+        gc.unfreeze()
+        gc.set_threshold(*self.default_thresholds)
+
+    def _callback(self, phase, info):
+        if phase == 'start':
+            self.started = time.perf_counter()
+            return
+        duration = (time.perf_counter() - self.started) * 1000
+        generation = info['generation']
+        if self.profile_path:
+            self.pending.append((self.frame, generation, duration, info['collected'],
+                                 info['uncollectable'], self.reason))
+        totals = self.totals[generation]
+        totals[0] += 1
+        totals[1] += duration
+        totals[2] = max(totals[2], duration)
+        self.frame_pause_ms += duration
+
+    def next_frame(self):
+        """Call once per game frame, before the frame's work starts."""
+        if self.frame_pause_ms > self.worst_frame_pause_ms:
+            self.worst_frame_pause_ms = self.frame_pause_ms
+            self.worst_frame = self.frame
+        self.frame_pause_ms = 0.0
+        self.frame += 1
+
+    def collect(self, reason):
+        """Run a full collection now, logged with the given reason."""
+        self.reason = reason
+        try:
+            gc.collect()
+        finally:
+            self.reason = 'automatic'
+
+    def level_loaded(self):
+        """The level's long lived objects exist now, set the collector up for play."""
+        if not self.scheduling:
+            return
+        # The previous level's frozen objects may be garbage by now, so they get one more look
+        gc.unfreeze()
+        self.collect('level load')
+        gc.freeze()
+        gc.set_threshold(*self.gameplay_thresholds)
+
+    def idle(self):
+        """Play is paused (transition, cutscene or menu), a good time for a full collection."""
+        self.flush()
+        if not self.scheduling:
+            return
+        gc.unfreeze()
+        gc.set_threshold(*self.default_thresholds)
+        self.collect('idle')
+
+    def flush(self):
+        """Append the collections logged so far to the profile."""
+        if not self.pending:
+            return
+        try:
+            with open(self.profile_path, 'a' if self.header_written else 'w') as profile:
+                if not self.header_written:
+                    profile.write("frame,generation,duration_ms,collected,uncollectable,reason\n")
+                    self.header_written = True
+                for frame, generation, duration, collected, uncollectable, reason in self.pending:
+                    profile.write(f"{frame},{generation},{duration:.3f},{collected},{uncollectable},{reason}\n")
+        except OSError as e:
+            print(f"Error writing GC profile: {e}")
+        self.pending.clear()
+
+    def summary(self):
+        """Collections, total and longest pause per generation, and the worst frame."""
+        return {
+            'generations': {generation: {'collections': count, 'total_ms': total, 'max_ms': longest}
+                            for generation, (count, total, longest) in self.totals.items()},
+            'worst_frame': self.worst_frame,
+            'worst_frame_pause_ms': self.worst_frame_pause_ms,
+        }
+
+    def close(self):
+        """Write out the profile, print the summary and put the collector back how it was."""
+        self.flush()
+        self.uninstall()
+        for generation, totals in self.summary()['generations'].items():
+            if totals['collections']:
+                print(f"GC gen {generation}: {totals['collections']} collections, "
+                      f"{totals['total_ms']:.1f} ms total, {totals['max_ms']:.2f} ms longest")
@@ -0,0 +1,87 @@
+"""
+Low resolution occupancy map for area hazards.
+
+Poison trails, traps and arcane circles never move once they are placed. Instead of
+testing Trogdor against every one of them each frame, each hazard is stamped into a
+coarse grid when it becomes dangerous. Every cell holds the frame its hazard expires
+on and that hazard's id, so a lookup is one cell read however many hazards are out.
+
+Every hazard in a map is dangerous from the moment it is stamped, so when hazards
+overlap a cell only needs to keep the one that lasts longest.
+
+Classes:
+- HazardMap: Grid of expiry frames and hazard ids, with stamp and lookup methods.
+"""
+from array import array
+from utils import WIDTH, HEIGHT, HAZARD_CELL_SIZE
+
+PERMANENT = 2 ** 62  # Expiry frame for hazards that last as long as the map
+
+class HazardMap:
+    def __init__(self, cell_size=HAZARD_CELL_SIZE, width=WIDTH, height=HEIGHT):
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.frame = 0
+        self.next_id = 1  # 0 means no hazard
+        self.expiry = array('q', [0]) * (self.cols * self.rows)
+        self.ids = array('q', [0]) * (self.cols * self.rows)
+        
+    def tick(self):
+        """Advance one frame. Cells whose expiry frame has been reached stop counting."""
+        self.frame += 1
+        
+    def clear(self):
+        self.expiry = array('q', [0]) * (self.cols * self.rows)
+        self.ids = array('q', [0]) * (self.cols * self.rows)
+        
+    def stamp_circle(self, x, y, radius, duration=None):
+        """Mark the cells whose centres lie within radius of (x, y) for duration frames
+        (for good if duration is None). Returns the new hazard id."""
+        size = self.cell_size
+        radius_sq = radius * radius
+        cells = []
+        for row in self._span(y - radius, y + radius, self.rows):
+            dy = (row + 0.5) * size - y
+            for col in self._span(x - radius, x + radius, self.cols):
+                dx = (col + 0.5) * size - x
+                if dx * dx + dy * dy < radius_sq:
+                    cells.append(row * self.cols + col)
+        return self._stamp(cells, duration)
+        
+    def stamp_rect(self, left, top, width, height, duration=None):
+        """Mark the cells whose centres lie inside the rectangle. Returns the new hazard id."""
+        size = self.cell_size
+        cells = []
+        for row in self._span(top, top + height, self.rows):
+            center_y = (row + 0.5) * size
+            if not top < center_y < top + height:
+                continue
+            for col in self._span(left, left + width, self.cols):
+                if left < (col + 0.5) * size < left + width:
+                    cells.append(row * self.cols + col)
+        return self._stamp(cells, duration)
+        
+    def hit(self, x, y):
+        """Id of the live hazard covering (x, y), or 0 if there is none."""
+        col = int(x // self.cell_size)
+        row = int(y // self.cell_size)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return 0
+        index = row * self.cols + col
+        return self.ids[index] if self.expiry[index] > self.frame else 0
+        
+    def _span(self, low, high, count):
+        # Cell indices between two coordinates, clipped to the map
+        return range(max(0, int(low // self.cell_size)), min(count - 1, int(high // self.cell_size)) + 1)
+        
+    def _stamp(self, cells, duration):
+        hazard_id = self.next_id
+        self.next_id += 1
+        expiry = PERMANENT if duration is None else self.frame + duration
+        for index in cells:
+            # Expired cells always lose, live ones keep whichever hazard lasts longer
+            if expiry >= self.expiry[index]:
+                self.expiry[index] = expiry
+                self.ids[index] = hazard_id
+        return hazard_id
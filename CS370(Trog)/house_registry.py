@@ -0,0 +1,170 @@
+"""
+The houses of a regular level, indexed by position and by state.
+
+Houses never move, so each one is put in a coarse grid cell once. Questions like
+"which houses is Trogdor touching" or "which damaged house is nearest" only look at
+the cells around a point instead of going through every house. Health changes go
+through damage() and repair(), which move a house between the healthy, damaged and
+destroyed sets as it happens, so nothing has to rebuild those lists each frame.
+They also note the house in changed, so whatever keeps the houses drawn (see
+static_layer.py) only looks at the houses that were hurt or repaired, and
+standing_version moves on whenever the set of standing houses changes, which is
+when the chasers' flow field has new obstacles.
+
+Builders claim the damaged house they are going to repair, and a claimed house isn't
+handed to another builder until it is released, so they spread out instead of all
+walking to the same house.
+
+The registry can be used like the plain list of houses it replaces: iterated,
+indexed, sliced, passed to random.choice and checked for emptiness.
+
+Classes:
+- HouseRegistry: Houses with a position grid, state sets and repair claims.
+"""
+from utils import WIDTH, HEIGHT, HOUSE_HEALTH, HOUSE_GRID_CELL_SIZE
+
+class HouseRegistry:
+    def __init__(self, houses=(), cell_size=HOUSE_GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.max_ring = max(WIDTH, HEIGHT) // cell_size + 1  # Enough rings to cover the screen
+        self.houses = []
+        self.cells = {}  # (col, row) -> houses whose top-left corner is in that cell
+        self.damaged_cells = {}  # Same, for damaged houses only
+        self.healthy = set()
+        self.damaged = set()  # Hurt but still standing, what builders repair
+        self.destroyed = set()
+        self.claims = {}  # house -> builder repairing it
+        self.claimed = {}  # builder -> house it claimed, the same claims the other way round
+        self.changed = set()  # Houses whose health changed since take_changed() was last called
+        self.standing_version = 0  # Bumped whenever a house is added or destroyed
+        for house in houses:
+            self.add(house)
+            
+    def __iter__(self):
+        return iter(self.houses)
+        
+    def __len__(self):
+        return len(self.houses)
+        
+    def __getitem__(self, index):
+        return self.houses[index]
+        
+    def add(self, house):
+        self.houses.append(house)
+        self.cells.setdefault(self._cell(house.x, house.y), []).append(house)
+        self._refresh(house)
+        self.changed.add(house)
+        self.standing_version += 1
+        
+    def damage(self, house, amount):
+        """Take amount of health off a standing house. Returns True if that destroyed it."""
+        if house.is_destroyed:
+            return False
+        house.health -= amount
+        if house.health <= 0:
+            house.is_destroyed = True
+            house.health = 0
+            self.standing_version += 1
+        self._refresh(house)
+        self.changed.add(house)
+        return house.is_destroyed
+        
+    def repair(self, house, amount):
+        """Give a standing house amount of health back, up to full health."""
+        if not house.is_destroyed:
+            house.health = min(HOUSE_HEALTH, house.health + amount)
+            self._refresh(house)
+            self.changed.add(house)
+
+    def take_changed(self):
+        """The houses whose health changed since the last call."""
+        changed, self.changed = self.changed, set()
+        return changed
+            
+    def touching(self, x, y, reach):
+        """Houses whose top-left corner is less than reach from (x, y) on both axes."""
+        found = []
+        for cell in self._cells_around(x, y, reach):
+            for house in self.cells.get(cell, ()):
+                if abs(x - house.x) < reach and abs(y - house.y) < reach:
+                    found.append(house)
+        return found
+        
+    def nearest_damaged(self, x, y, unclaimed=False):
+        """The damaged house whose top-left corner is nearest (x, y), or None.
+        With unclaimed, houses a builder has already claimed are skipped."""
+        if not self.damaged:
+            return None
+        size = self.cell_size
+        col, row = self._cell(x, y)
+        best = None
+        best_distance_sq = None
+        for ring in range(self.max_ring + 1):
+            for cell in self._ring(col, row, ring):
+                for house in self.damaged_cells.get(cell, ()):
+                    if unclaimed and house in self.claims:
+                        continue
+                    distance_sq = (x - house.x) ** 2 + (y - house.y) ** 2
+                    if best is None or distance_sq < best_distance_sq:
+                        best = house
+                        best_distance_sq = distance_sq
+            # Everything in the next ring out is at least ring cells away
+            if best is not None and best_distance_sq <= (ring * size) ** 2:
+                break
+        return best
+        
+    def claim_repair(self, builder):
+        """Hand builder the nearest damaged house nobody else is repairing, or None."""
+        self.release(builder)
+        if len(self.claims) >= len(self.damaged):
+            return None  # Every damaged house already has a builder, no need to search the grid
+        house = self.nearest_damaged(builder.x, builder.y, unclaimed=True)
+        if house is not None:
+            self.claims[house] = builder
+            self.claimed[builder] = house
+        return house
+        
+    def release(self, builder):
+        """Drop whatever claim builder holds."""
+        house = self.claimed.pop(builder, None)
+        if house is not None:
+            del self.claims[house]
+                
+    def _refresh(self, house):
+        # Put the house in the set matching its health, keeping the damaged grid in step
+        was_damaged = house in self.damaged
+        self.healthy.discard(house)
+        self.damaged.discard(house)
+        self.destroyed.discard(house)
+        if house.is_destroyed:
+            self.destroyed.add(house)
+        elif house.health < HOUSE_HEALTH:
+            self.damaged.add(house)
+        else:
+            self.healthy.add(house)
+            
+        is_damaged = house in self.damaged
+        if is_damaged and not was_damaged:
+            self.damaged_cells.setdefault(self._cell(house.x, house.y), []).append(house)
+        elif was_damaged and not is_damaged:
+            self.damaged_cells[self._cell(house.x, house.y)].remove(house)
+            builder = self.claims.pop(house, None)  # Nothing left to repair
+            if builder is not None:
+                del self.claimed[builder]
+            
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+        
+    def _cells_around(self, x, y, reach):
+        # Every cell a point less than reach away on both axes can be in
+        left, top = self._cell(x - reach, y - reach)
+        right, bottom = self._cell(x + reach, y + reach)
+        return [(col, row) for col in range(left, right + 1) for row in range(top, bottom + 1)]
+        
+    def _ring(self, col, row, ring):
+        # The cells exactly ring cells away from (col, row), counting diagonals as one
+        if ring == 0:
+            return [(col, row)]
+        cells = [(col + dx, row + dy) for dx in range(-ring, ring + 1) for dy in (-ring, ring)]
+        cells += [(col + dx, row + dy) for dx in (-ring, ring) for dy in range(-ring + 1, ring)]
+        return cells
@@ -32,6 +32,14 @@ from utils import (BASILISK_BURROW_DURATION, BASILISK_HEAD_SIZE, BASILISK_PHASE_
 from utils import BOSS_HEALTH_BAR_WIDTH, BOSS_HEALTH_BAR_HEIGHT, BOSS_HEALTH_BAR_BORDER
 from entities import Projectile
 from ui import load_sound
+from trig_tables import unit_vector, angle_steps, rotate_all, rotate
+from collision import point_in_sector
+from quality import QUALITY, draw_glow_circle
+from particles import cull_particles
+from sprite_cache import SpriteCache, render_circle
+
+# Trail particles are plain circles of a few sizes, shared by every particle
+TRAIL_SPRITES = SpriteCache()
 
 
 
@@ -39,6 +47,7 @@ class Lancelot:
     def __init__(self):
         self.x = random.randint(0, WIDTH - LANCELOT_SIZE)
         self.y = random.randint(UIBARHEIGHT, HEIGHT - LANCELOT_SIZE)
+        self.prev_x, self.prev_y = self.x, self.y  # Where this frame's movement started
         self.size = LANCELOT_SIZE
         self.max_health = 6  # Increased from 3 to match Basilisk
         self.health = self.max_health
@@ -58,11 +67,13 @@ class Lancelot:
         
         # Phase 2: Shield bash attack
         self.shield_up = False
-        self.shield_angle = 0
+        self.shield_dir = (1.0, 0.0)  # Unit vector the shield faces
         self.shield_size = self.size * 0.8
         
         # Phase 3: Sweeping attack
         self.sweep_angle = 0
+        self.sweep_dir = (1.0, 0.0)  # Unit vector of sweep_angle, the leading edge of the arc
+        self.sweep_start_dir = (1.0, 0.0)  # Trailing edge, sweep_width behind the leading one
         self.sweep_radius = 150
         self.sweep_speed = 0.1
         self.sweep_width = 100  # Width of the sweeping attack
@@ -80,47 +91,28 @@ class Lancelot:
         
         # If shielded, check shield collision
         if self.state == "shielded" and not basic_collision:
-            shield_x = self.x + self.size/2 + math.cos(self.shield_angle) * self.shield_size * 0.8
-            shield_y = self.y + self.size/2 + math.sin(self.shield_angle) * self.shield_size * 0.8
-        
-            shield_collision = (math.sqrt((trogdor.x + trogdor.size/2 - shield_x)**2 + 
-                            (trogdor.y + trogdor.size/2 - shield_y)**2) < trogdor.size/2 + self.shield_size/2)
-            return shield_collision
+            shield_offset = self.shield_size * 0.8
+            dx = trogdor.x + trogdor.size/2 - (self.x + self.size/2 + self.shield_dir[0] * shield_offset)
+            dy = trogdor.y + trogdor.size/2 - (self.y + self.size/2 + self.shield_dir[1] * shield_offset)
+            reach = trogdor.size/2 + self.shield_size/2
+            return dx * dx + dy * dy < reach * reach
         
         # If sweeping, check arc collision
         if self.state == "sweeping" and not basic_collision:
-            # Calculate player position relative to sweep center
-            dx = trogdor.x + trogdor.size/2 - self.sweep_center_x
-            dy = trogdor.y + trogdor.size/2 - self.sweep_center_y
-        
-            # Calculate distance from player to sweep center
-            distance = math.sqrt(dx**2 + dy**2)
-        
-            # Calculate angle of player relative to sweep center
-            player_angle = math.atan2(dy, dx)
-            if player_angle < 0:
-                player_angle += 2 * math.pi
-            
-            # Determine if player is within the current sweep arc
-            sweep_start = self.sweep_angle - self.sweep_width / self.sweep_radius
-            if sweep_start < 0:
-                sweep_start += 2 * math.pi
-            
-            # Check if player is within the sweep arc radius and angle
-            radius_match = abs(distance - self.sweep_radius) < trogdor.size + 15
-        
-            # Handle crossing the 0/2π boundary
-            if self.sweep_angle < sweep_start:  # Crossed the boundary
-                angle_match = player_angle > sweep_start or player_angle < self.sweep_angle
-            else:
-                angle_match = player_angle > sweep_start and player_angle < self.sweep_angle
-            
-            return radius_match and angle_match
+            # Between the arc's edges, within a band around the sweep radius
+            band = trogdor.size + 15
+            inner = self.sweep_radius - band
+            outer = self.sweep_radius + band
+            return point_in_sector(trogdor.x + trogdor.size/2, trogdor.y + trogdor.size/2,
+                                   self.sweep_center_x, self.sweep_center_y, self.sweep_start_dir, self.sweep_dir,
+                                   inner * inner if inner > 0 else -1, outer * outer)
         
         # Regular collision for other states
         return basic_collision
 
     def update(self, trogdor):
+        self.prev_x, self.prev_y = self.x, self.y
+        
         # Update phase based on health
         new_phase = max(1, 4 - math.ceil(self.health / 2))  # 3 phases, 2 health points each
         if new_phase > self.phase:
@@ -168,7 +160,7 @@ class Lancelot:
         self.timer -= 1
         
         # Add aiming particles occasionally
-        if random.random() < 0.3:
+        if QUALITY.chance(0.3):
             particle_angle = self.angle + random.uniform(-0.2, 0.2)
             distance = random.randint(30, 50)
             particle_x = self.x + self.size/2 + math.cos(particle_angle) * distance
@@ -192,7 +184,7 @@ class Lancelot:
                 self.state = "shielded"
                 self.timer = 120  # 2 seconds of shield up
                 self.shield_up = True
-                self.shield_angle = self.angle
+                self.shield_dir = unit_vector(self.angle)
             else:
                 self.start_charge(trogdor)
         
@@ -201,6 +193,8 @@ class Lancelot:
             self.state = "sweeping"
             self.timer = 180  # 3 seconds of sweeping
             self.sweep_angle = 0
+            self.sweep_dir = (1.0, 0.0)
+            self.sweep_start_dir = rotate(1.0, 0.0, -self.sweep_width / self.sweep_radius)
             
             # Center of sweep is slightly ahead of Lancelot, but ensure it's within bounds
             potential_center_x = self.x + math.cos(self.angle) * 50
@@ -219,7 +213,7 @@ class Lancelot:
         self.y += self.charge_direction[1] * self.charge_speed
         
         # Add trail particles
-        for _ in range(3):
+        for _ in range(QUALITY.particles(3)):
             offset_x = random.uniform(-5, 5)
             offset_y = random.uniform(-5, 5)
             self.trail_particles.append({
@@ -237,7 +231,7 @@ class Lancelot:
             self.timer = LANCELOT_VULNERABLE_DURATION
             
             # Generate impact particles
-            for _ in range(20):
+            for _ in range(QUALITY.particles(20)):
                 angle = random.uniform(0, 2 * math.pi)
                 speed = random.uniform(1, 5)
                 self.impact_particles.append({
@@ -262,10 +256,12 @@ class Lancelot:
         
         # Continue sweeping attack
         self.sweep_angle += self.sweep_speed
+        self.sweep_dir = rotate(self.sweep_dir[0], self.sweep_dir[1], self.sweep_speed)
+        self.sweep_start_dir = rotate(self.sweep_dir[0], self.sweep_dir[1], -self.sweep_width / self.sweep_radius)
         
         # Create particles along the sweep path
-        sweep_x = self.sweep_center_x + math.cos(self.sweep_angle) * self.sweep_radius
-        sweep_y = self.sweep_center_y + math.sin(self.sweep_angle) * self.sweep_radius
+        sweep_x = self.sweep_center_x + self.sweep_dir[0] * self.sweep_radius
+        sweep_y = self.sweep_center_y + self.sweep_dir[1] * self.sweep_radius
         
         # Make sure sweep position stays within screen bounds
         if sweep_x < self.size/2:
@@ -286,7 +282,7 @@ class Lancelot:
         self.angle = self.sweep_angle + math.pi/2
         
         # Add sweep particles
-        for _ in range(2):
+        for _ in range(QUALITY.particles(2)):
             offset = random.uniform(-self.sweep_width/2, self.sweep_width/2)
             offset_angle = self.sweep_angle + (offset / self.sweep_radius)
             particle_x = self.sweep_center_x + math.cos(offset_angle) * self.sweep_radius
@@ -318,22 +314,24 @@ class Lancelot:
         self.timer -= 1
         
         # Shield bash behavior - charge at player with shield
-        target_angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
-        self.shield_angle = target_angle
+        dx = trogdor.x - self.x
+        dy = trogdor.y - self.y
+        distance = math.hypot(dx, dy)
+        self.shield_dir = (dx / distance, dy / distance) if distance else (1.0, 0.0)
         
         # Move more slowly during shield bash
         move_speed = self.charge_speed * 0.6
-        new_x = self.x + math.cos(target_angle) * move_speed
-        new_y = self.y + math.sin(target_angle) * move_speed
+        new_x = self.x + self.shield_dir[0] * move_speed
+        new_y = self.y + self.shield_dir[1] * move_speed
         
         # Keep within screen bounds
         self.x = max(0, min(WIDTH - self.size, new_x))
         self.y = max(UIBARHEIGHT, min(HEIGHT - self.size, new_y))
         
         # Add shield particles
-        if random.random() < 0.4:
-            shield_front_x = self.x + self.size/2 + math.cos(self.shield_angle) * self.shield_size
-            shield_front_y = self.y + self.size/2 + math.sin(self.shield_angle) * self.shield_size
+        if QUALITY.chance(0.4):
+            shield_front_x = self.x + self.size/2 + self.shield_dir[0] * self.shield_size
+            shield_front_y = self.y + self.size/2 + self.shield_dir[1] * self.shield_size
             
             # Keep particles within bounds
             shield_front_x = max(0, min(WIDTH, shield_front_x))
@@ -350,37 +348,33 @@ class Lancelot:
         # End shield bash
         if self.timer <= 0:
             self.state = "charging"
-            self.charge_direction = (math.cos(self.shield_angle), math.sin(self.shield_angle))
+            self.charge_direction = self.shield_dir
             self.shield_up = False
 
     def _update_particles(self):
         # Update trail particles
-        for particle in self.trail_particles[:]:
+        for particle in self.trail_particles:
             particle['alpha'] -= 10
             particle['size'] -= 0.2
-            if particle['alpha'] <= 0 or particle['size'] <= 0:
-                self.trail_particles.remove(particle)
+        cull_particles(self.trail_particles)
                 
         # Update charge particles
-        for particle in self.charge_particles[:]:
+        for particle in self.charge_particles:
             particle['alpha'] -= 15
-            if particle['alpha'] <= 0:
-                self.charge_particles.remove(particle)
+        cull_particles(self.charge_particles)
                 
         # Update impact particles
-        for particle in self.impact_particles[:]:
+        for particle in self.impact_particles:
             particle['x'] += particle['dx']
             particle['y'] += particle['dy']
             particle['alpha'] -= 8
             particle['size'] -= 0.1
-            if particle['alpha'] <= 0 or particle['size'] <= 0:
-                self.impact_particles.remove(particle)
+        cull_particles(self.impact_particles)
                 
         # Update sweep particles
-        for particle in self.sweep_particles[:]:
+        for particle in self.sweep_particles:
             particle['alpha'] -= 20
-            if particle['alpha'] <= 0:
-                self.sweep_particles.remove(particle)
+        cull_particles(self.sweep_particles)
 
     def start_charge(self, trogdor):
         angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
@@ -445,12 +439,15 @@ class Lancelot:
         center_x = self.x + self.size/2
         center_y = self.y + self.size/2
         
+        # Facing direction, shared by the body, visor, lance and plume
+        facing_cos, facing_sin = unit_vector(self.angle)
+        
         # Body/armor (rectangle rotated to face direction)
         body_points = []
         for corner in [(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)]:
             # Rotate point around center
-            rx = corner[0] * math.cos(self.angle) - corner[1] * math.sin(self.angle)
-            ry = corner[0] * math.sin(self.angle) + corner[1] * math.cos(self.angle)
+            rx = corner[0] * facing_cos - corner[1] * facing_sin
+            ry = corner[0] * facing_sin + corner[1] * facing_cos
             # Scale and position
             px = center_x + rx * self.size
             py = center_y + ry * self.size
@@ -459,8 +456,8 @@ class Lancelot:
         pygame.draw.polygon(screen, base_color, body_points)
         
         # Helmet/visor (circle at front)
-        visor_x = center_x + math.cos(self.angle) * (self.size * 0.3)
-        visor_y = center_y + math.sin(self.angle) * (self.size * 0.3)
+        visor_x = center_x + facing_cos * (self.size * 0.3)
+        visor_y = center_y + facing_sin * (self.size * 0.3)
         visor_size = self.size * 0.3
         
         # Visor color darker than body
@@ -473,9 +470,9 @@ class Lancelot:
         
         # Shield (in shielded state or phase 2+)
         if self.shield_up or (self.phase >= 2 and self.state == "aiming"):
-            shield_angle = self.shield_angle if self.shield_up else self.angle
-            shield_x = center_x + math.cos(shield_angle) * (self.size * 0.6)
-            shield_y = center_y + math.sin(shield_angle) * (self.size * 0.6)
+            shield_cos, shield_sin = self.shield_dir if self.shield_up else (facing_cos, facing_sin)
+            shield_x = center_x + shield_cos * (self.size * 0.6)
+            shield_y = center_y + shield_sin * (self.size * 0.6)
             shield_size = self.shield_size
             
             # Shield points for a curved shield shape
@@ -483,15 +480,16 @@ class Lancelot:
             shield_width = shield_size * 0.7
             shield_curve_points = 8
             
-            for i in range(shield_curve_points + 1):
-                curve_angle = shield_angle + math.pi/2 - (i * math.pi / shield_curve_points)
-                px = shield_x + math.cos(curve_angle) * shield_width
-                py = shield_y + math.sin(curve_angle) * shield_width
+            # Half circle from +90 to -90 degrees around the shield direction
+            shield_curve = angle_steps(shield_curve_points + 1, -math.pi / shield_curve_points, math.pi/2)
+            for curve_cos, curve_sin in rotate_all(shield_curve, shield_cos, shield_sin):
+                px = shield_x + curve_cos * shield_width
+                py = shield_y + curve_sin * shield_width
                 shield_points.append((px, py))
                 
             # Add shield base points
-            shield_back_x = center_x + math.cos(shield_angle) * (self.size * 0.3)
-            shield_back_y = center_y + math.sin(shield_angle) * (self.size * 0.3)
+            shield_back_x = center_x + shield_cos * (self.size * 0.3)
+            shield_back_y = center_y + shield_sin * (self.size * 0.3)
             shield_points.append((shield_back_x, shield_back_y))
             
             # Shield color is blue with shimmering effect
@@ -510,17 +508,16 @@ class Lancelot:
         if self.state == "charging" or self.phase >= 2:
             lance_length = self.size * 1.2
             lance_width = self.size * 0.15
-            lance_x = center_x + math.cos(self.angle) * (self.size * 0.5)
-            lance_y = center_y + math.sin(self.angle) * (self.size * 0.5)
+            lance_x = center_x + facing_cos * (self.size * 0.5)
+            lance_y = center_y + facing_sin * (self.size * 0.5)
             
             # Lance tip coordinates
-            lance_tip_x = lance_x + math.cos(self.angle) * lance_length
-            lance_tip_y = lance_y + math.sin(self.angle) * lance_length
+            lance_tip_x = lance_x + facing_cos * lance_length
+            lance_tip_y = lance_y + facing_sin * lance_length
             
-            # Lance width points
-            perp_angle = self.angle + math.pi/2
-            width_x = math.cos(perp_angle) * lance_width
-            width_y = math.sin(perp_angle) * lance_width
+            # Lance width points (facing direction turned 90 degrees)
+            width_x = -facing_sin * lance_width
+            width_y = facing_cos * lance_width
             
             # Lance polygon points
             lance_points = [
@@ -546,55 +543,59 @@ class Lancelot:
             pygame.draw.polygon(screen, (150, 150, 170), [
                 (lance_tip_x - width_x/2, lance_tip_y - width_y/2),
                 (lance_tip_x + width_x/2, lance_tip_y + width_y/2),
-                (lance_tip_x + math.cos(self.angle) * (lance_width * 1.5),
-                 lance_tip_y + math.sin(self.angle) * (lance_width * 1.5))
+                (lance_tip_x + facing_cos * (lance_width * 1.5),
+                 lance_tip_y + facing_sin * (lance_width * 1.5))
             ])
         
         # Plume/crest on helmet (phase 2+)
         if self.phase >= 2:
-            plume_start_x = visor_x - math.cos(self.angle) * (visor_size * 0.5)
-            plume_start_y = visor_y - math.sin(self.angle) * (visor_size * 0.5)
+            plume_start_x = visor_x - facing_cos * (visor_size * 0.5)
+            plume_start_y = visor_y - facing_sin * (visor_size * 0.5)
             plume_length = self.size * 0.6
             plume_width = self.size * 0.2
             
             # Plume points for a flowing crest
             plume_points = []
             plume_segments = 5
-            plume_angle = self.angle + math.pi  # Flowing backward
-            
             # Wave effect for plume
             wave_offset = math.sin(pygame.time.get_ticks() * 0.01) * 0.2
             
+            # Segment directions, flowing backward (facing + pi) and bending a little more each segment
+            bend_cos, bend_sin = unit_vector(wave_offset / (plume_segments - 1))
+            segment_dirs = [(-facing_cos, -facing_sin)]
+            for _ in range(plume_segments - 1):
+                prev_cos, prev_sin = segment_dirs[-1]
+                segment_dirs.append((prev_cos * bend_cos - prev_sin * bend_sin,
+                                     prev_sin * bend_cos + prev_cos * bend_sin))
+            
             for i in range(plume_segments):
                 segment_ratio = i / (plume_segments - 1)
-                segment_angle = plume_angle + wave_offset * segment_ratio
+                segment_cos, segment_sin = segment_dirs[i]
                 segment_length = plume_length * segment_ratio
                 
-                px = plume_start_x + math.cos(segment_angle) * segment_length
-                py = plume_start_y + math.sin(segment_angle) * segment_length
+                px = plume_start_x + segment_cos * segment_length
+                py = plume_start_y + segment_sin * segment_length
                 
-                # Add points on both sides of the plume
-                perp_angle = segment_angle + math.pi/2
+                # Add points on both sides of the plume (+90 degrees)
                 width_factor = 1 - segment_ratio * 0.7  # Taper toward the end
                 plume_points.append((
-                    px + math.cos(perp_angle) * plume_width * width_factor,
-                    py + math.sin(perp_angle) * plume_width * width_factor
+                    px - segment_sin * plume_width * width_factor,
+                    py + segment_cos * plume_width * width_factor
                 ))
                 
-            # Add points in reverse for the other side
+            # Add points in reverse for the other side (-90 degrees)
             for i in range(plume_segments - 1, -1, -1):
                 segment_ratio = i / (plume_segments - 1)
-                segment_angle = plume_angle + wave_offset * segment_ratio
+                segment_cos, segment_sin = segment_dirs[i]
                 segment_length = plume_length * segment_ratio
                 
-                px = plume_start_x + math.cos(segment_angle) * segment_length
-                py = plume_start_y + math.sin(segment_angle) * segment_length
+                px = plume_start_x + segment_cos * segment_length
+                py = plume_start_y + segment_sin * segment_length
                 
-                perp_angle = segment_angle - math.pi/2
                 width_factor = 1 - segment_ratio * 0.7
                 plume_points.append((
-                    px + math.cos(perp_angle) * plume_width * width_factor,
-                    py + math.sin(perp_angle) * plume_width * width_factor
+                    px + segment_sin * plume_width * width_factor,
+                    py - segment_cos * plume_width * width_factor
                 ))
                 
             # Plume color - red for a knight's crest
@@ -609,44 +610,31 @@ class Lancelot:
         self.draw_health_bar(screen)
 
     def _draw_particles(self, screen):
-        # Draw trail particles
+        # Draw trail particles, in one batch
+        batch = []
         for particle in self.trail_particles:
-            pygame.draw.circle(screen, particle['color'], 
-                              (int(particle['x']), int(particle['y'])), 
-                              int(particle['size']))
+            color, radius = particle['color'], int(particle['size'])
+            surface, (offset_x, offset_y) = TRAIL_SPRITES.get((color, radius), lambda: render_circle(color, radius))
+            batch.append((surface, (int(particle['x']) + offset_x, int(particle['y']) + offset_y)))
+        screen.blits(batch, doreturn=False)
                               
         # Draw charge particles
         for particle in self.charge_particles:
-            # Create surface with alpha for glow effect
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, 
-                              (particle['color'][0], particle['color'][1], particle['color'][2], particle['alpha']), 
-                              (int(particle['size']), int(particle['size'])), 
-                              int(particle['size']))
-            screen.blit(particle_surface, 
-                       (int(particle['x'] - particle['size']), int(particle['y'] - particle['size'])))
+            # Drawn with alpha for a glow effect, when glow surfaces are on
+            draw_glow_circle(screen, particle['color'], particle['alpha'],
+                             particle['x'], particle['y'], particle['size'])
                        
         # Draw impact particles
         for particle in self.impact_particles:
-            # Create surface with alpha for dust effect
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, 
-                              (particle['color'][0], particle['color'][1], particle['color'][2], particle['alpha']), 
-                              (int(particle['size']), int(particle['size'])), 
-                              int(particle['size']))
-            screen.blit(particle_surface, 
-                       (int(particle['x'] - particle['size']), int(particle['y'] - particle['size'])))
+            # Drawn with alpha for a dust effect, when glow surfaces are on
+            draw_glow_circle(screen, particle['color'], particle['alpha'],
+                             particle['x'], particle['y'], particle['size'])
                        
         # Draw sweep particles
         for particle in self.sweep_particles:
-            # Create surface with alpha for energy slash effect
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, 
-                              (particle['color'][0], particle['color'][1], particle['color'][2], particle['alpha']), 
-                              (int(particle['size']), int(particle['size'])), 
-                              int(particle['size']))
-            screen.blit(particle_surface, 
-                       (int(particle['x'] - particle['size']), int(particle['y'] - particle['size'])))
+            # Drawn with alpha for an energy slash effect, when glow surfaces are on
+            draw_glow_circle(screen, particle['color'], particle['alpha'],
+                             particle['x'], particle['y'], particle['size'])
 
     def _draw_sweep_attack(self, screen):
         # Create a surface for the sweep arc with alpha
@@ -689,8 +677,8 @@ class Lancelot:
                           start_angle, end_angle, arc_width)
         
         # Add particles along the arc edge
-        edge_x = self.sweep_center_x + math.cos(self.sweep_angle) * self.sweep_radius
-        edge_y = self.sweep_center_y + math.sin(self.sweep_angle) * self.sweep_radius
+        edge_x = self.sweep_center_x + self.sweep_dir[0] * self.sweep_radius
+        edge_y = self.sweep_center_y + self.sweep_dir[1] * self.sweep_radius
         
         # Keep edge indicator within bounds
         edge_x = max(0, min(WIDTH, edge_x))
@@ -1,82 +1,362 @@
 # leaderboard.py
+"""
+Leaderboard storage and screens for Trogdor.
+
+Scores are stored in a SQLite database (WAL mode) so a crash mid-write can't
+corrupt the table, and every run is kept for stats. The old leaderboard.json
+format is still supported through import_json/export_json.
+
+Classes:
+- Leaderboard: SQLite backed leaderboard with an indexed top-k query on time.
+- LeaderboardClient: Talks to leaderboard_server.py from a background thread so
+  score submission never blocks a frame, and serves a cached snapshot.
+
+Functions:
+- show_leaderboard_screen(screen, leaderboard): Displays the top entries.
+- get_player_name(screen) -> str: Text input box for a new high score.
+"""
 import pygame
+import asyncio
 import json
 import os
-from utils import WIDTH, HEIGHT, BLACK, WHITE, GREEN, BLUE, MENU_FONT_SIZE, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_PADDING
+import sqlite3
+import threading
+import time
+import uuid
+from utils import (WIDTH, HEIGHT, BLACK, WHITE, GREEN, BLUE, MENU_FONT_SIZE, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_PADDING,
+                   LEADERBOARD_SIZE, LEADERBOARD_SERVER_HOST, LEADERBOARD_SERVER_PORT,
+                   LEADERBOARD_POOL_SIZE, LEADERBOARD_TIMEOUT)
 from ui import draw_background, draw_button
 
+def make_entry(name, game_stats):
+    """Build a leaderboard entry from the game_stats dictionary."""
+    # Extract time from game_stats dictionary
+    hours = game_stats['timeH']
+    minutes = game_stats['timeM']
+    seconds = game_stats['timeS']
+
+    return {
+        'name': name,
+        'time': hours * 3600 + minutes * 60 + seconds,
+        'display_time': f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    }
+
 class Leaderboard:
-    def __init__(self):
-        self.leaderboard_file = "leaderboard.json"
+    def __init__(self, db_file="leaderboard.db", leaderboard_file="leaderboard.json"):
+        self.db_file = db_file
+        self.leaderboard_file = leaderboard_file  # Legacy JSON file, used for import/export
         self.entries = []
+        self.connection = None
         self.load_leaderboard()
 
+    def _connect(self):
+        # isolation_level=None lets us manage transactions explicitly. The leaderboard server
+        # may open the database on one thread and serve it from its event loop thread.
+        connection = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                time INTEGER NOT NULL,
+                display_time TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                submission_id TEXT
+            )
+        """)
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(entries)")]
+        if 'submission_id' not in columns:
+            # Databases made before submissions carried an id
+            connection.execute("ALTER TABLE entries ADD COLUMN submission_id TEXT")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_entries_time ON entries (time, id)")
+        # A resent submission is dropped by its id, local entries have none
+        connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_entries_submission ON entries (submission_id)")
+        return connection
+
     def load_leaderboard(self):
         try:
-            if os.path.exists(self.leaderboard_file):
-                with open(self.leaderboard_file, 'r') as f:
-                    self.entries = json.load(f)
-            else:
-                # Create placeholder leaderboard
-                self.entries = [
-                    {"name": "Slowpoke", "time": 3600, "display_time": "01:00:00"},
-                    {"name": "TurtlePlayer", "time": 3300, "display_time": "00:55:00"},
-                    {"name": "CasualGamer", "time": 3000, "display_time": "00:50:00"},
-                    {"name": "TakingMyTime", "time": 2700, "display_time": "00:45:00"},
-                    {"name": "NoRush", "time": 2400, "display_time": "00:40:00"}
-                ]
-                self.save_leaderboard()
+            new_database = not os.path.exists(self.db_file)
+            self.connection = self._connect()
+            if new_database and self.leaderboard_file:
+                if os.path.exists(self.leaderboard_file):
+                    # Carry over scores from the old JSON leaderboard
+                    self.import_json(self.leaderboard_file)
+                else:
+                    # Create placeholder leaderboard
+                    self._insert_entries([
+                        {"name": "Slowpoke", "time": 3600, "display_time": "01:00:00"},
+                        {"name": "TurtlePlayer", "time": 3300, "display_time": "00:55:00"},
+                        {"name": "CasualGamer", "time": 3000, "display_time": "00:50:00"},
+                        {"name": "TakingMyTime", "time": 2700, "display_time": "00:45:00"},
+                        {"name": "NoRush", "time": 2400, "display_time": "00:40:00"}
+                    ])
+            self.entries = self.get_top_entries()
         except Exception as e:
             print(f"Error loading leaderboard: {e}")
             self.entries = []
 
     def save_leaderboard(self):
+        # Every add_entry is committed on its own, so saving only means mirroring to JSON
+        if self.leaderboard_file:
+            self.export_json(self.leaderboard_file)
+
+    def add_entries(self, entries):
+        """Insert several entries in one transaction."""
+        self._insert_entries(entries)
+        self.entries = self.get_top_entries()
+
+    def _insert_entries(self, entries):
+        if self.connection is None:
+            print("Error saving leaderboard: database is not open")
+            return
+        now = time.time()
+        with self.connection:
+            self.connection.execute("BEGIN")
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO entries (name, time, display_time, created_at, submission_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(entry['name'], int(entry['time']), entry['display_time'], now, entry.get('id'))
+                 for entry in entries]
+            )
+
+    def get_top_entries(self, limit=LEADERBOARD_SIZE):
+        # Served straight off the time index, shorter times first
+        if self.connection is None:
+            return []
+        rows = self.connection.execute(
+            "SELECT name, time, display_time FROM entries ORDER BY time, id LIMIT ?", (limit,)
+        ).fetchall()
+        return [{'name': name, 'time': total, 'display_time': display} for name, total, display in rows]
+
+    def get_all_entries(self):
+        # Full run history, oldest first, for stats
+        if self.connection is None:
+            return []
+        rows = self.connection.execute(
+            "SELECT name, time, display_time, created_at FROM entries ORDER BY id"
+        ).fetchall()
+        return [{'name': name, 'time': total, 'display_time': display, 'created_at': created}
+                for name, total, display, created in rows]
+
+    def add_entry(self, name, game_stats):
+        # Single row insert, nothing else in the table is rewritten
         try:
-            with open(self.leaderboard_file, 'w') as f:
-                json.dump(self.entries, f)
+            self.add_entries([make_entry(name, game_stats)])
         except Exception as e:
             print(f"Error saving leaderboard: {e}")
 
-    def add_entry(self, name, game_stats):
-        # Extract time from game_stats dictionary
-        hours = game_stats['timeH']
-        minutes = game_stats['timeM']
-        seconds = game_stats['timeS']
-    
-        total_seconds = hours * 3600 + minutes * 60 + seconds
-    
-        # Create new entry
-        new_entry = {
-            'name': name,
-            'time': total_seconds,
-            'display_time': f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        }
-    
-        # Add entry and sort by time (ascending order - shorter times first)
-        self.entries.append(new_entry)
-        self.entries.sort(key=lambda x: x['time'])  # This already sorts smallest to largest
-    
-        # Keep only top 10
-        self.entries = self.entries[:10]
-        self.save_leaderboard()
-
     def check_if_highscore(self, game_stats):
-        hours = game_stats['timeH']
-        minutes = game_stats['timeM']
-        seconds = game_stats['timeS']
-        
-        total_seconds = hours * 3600 + minutes * 60 + seconds
+        total_seconds = make_entry("", game_stats)['time']
+        if self.connection is None:
+            return True
         
-        if len(self.entries) < 10:
+        # Time of the last place entry, read off the index
+        row = self.connection.execute(
+            "SELECT time FROM entries ORDER BY time, id LIMIT 1 OFFSET ?", (LEADERBOARD_SIZE - 1,)
+        ).fetchone()
+        if row is None:
             return True
             
-        return total_seconds < self.entries[-1]['time']
+        return total_seconds < row[0]
+
+    def import_json(self, path):
+        """Add every entry from a leaderboard.json style file to the database."""
+        try:
+            with open(path, 'r') as f:
+                self._insert_entries(json.load(f))
+            self.entries = self.get_top_entries()
+        except Exception as e:
+            print(f"Error importing leaderboard: {e}")
+
+    def export_json(self, path, limit=LEADERBOARD_SIZE):
+        """Write the top entries in the leaderboard.json format without ever leaving a half written file."""
+        if self.connection is None:
+            # An empty export would wipe the scores the JSON file still has
+            print("Error saving leaderboard: database is not open")
+            return
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(self.get_top_entries(limit), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error saving leaderboard: {e}")
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+class LeaderboardClient:
+    """
+    Client for the global leaderboard server.
+
+    All networking runs on an asyncio loop in a daemon thread. Submissions are
+    queued and sent in batches over a small pool of keep-alive connections, so
+    the render thread only ever appends to a queue. The local Leaderboard keeps
+    every score too, and is what the screen shows until a server snapshot has
+    been fetched or whenever the server can't be reached.
+    """
+    def __init__(self, local=None, host=LEADERBOARD_SERVER_HOST, port=LEADERBOARD_SERVER_PORT,
+                 pool_size=LEADERBOARD_POOL_SIZE, timeout=LEADERBOARD_TIMEOUT):
+        self.local = local if local is not None else Leaderboard()
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.snapshot = None  # Last top-N list fetched from the server
+        self.online = False
+
+        self.outbox = []  # Entries not yet accepted by the server, only touched on the loop thread
+        self.flush_scheduled = False
+        self.idle_connections = []
+        self.pool_size = pool_size
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="leaderboard-client", daemon=True)
+        self.thread.start()
+
+    @property
+    def entries(self):
+        return self.snapshot if self.snapshot is not None else self.local.entries
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.connection_slots = asyncio.Semaphore(self.pool_size)
+        self.loop.run_forever()
+
+    def add_entry(self, name, game_stats):
+        self.local.add_entry(name, game_stats)
+        self.submit(make_entry(name, game_stats))
+
+    def check_if_highscore(self, game_stats):
+        entries = self.entries
+        if len(entries) < LEADERBOARD_SIZE:
+            return True
+        return make_entry("", game_stats)['time'] < entries[LEADERBOARD_SIZE - 1]['time']
+
+    def submit(self, entry):
+        """Queue an entry for the server. Never blocks."""
+        # The id lets the server drop a batch it already stored when a retry sends it again
+        entry = dict(entry, id=uuid.uuid4().hex)
+        self.loop.call_soon_threadsafe(self._queue_entry, entry)
+
+    def refresh(self):
+        """Ask for a new snapshot in the background. Never blocks."""
+        self.loop.call_soon_threadsafe(self._schedule_flush)
+
+    def close(self):
+        if self.loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._close_connections(), self.loop)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(self.timeout)
+        self.local.close()
+
+    # Everything below runs on the client loop thread
+
+    def _queue_entry(self, entry):
+        self.outbox.append(entry)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        # Coalesce everything queued in the same loop tick into one request
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.loop.create_task(self._flush())
+
+    async def _flush(self):
+        self.flush_scheduled = False
+        batch, self.outbox = self.outbox, []
+        if batch:
+            try:
+                status, _ = await self._request("POST", "/scores", json.dumps(batch).encode())
+            except (OSError, asyncio.TimeoutError, ValueError, asyncio.IncompleteReadError):
+                status = None
+            if status is not None and 400 <= status < 500:
+                # Sending the same entries again would be refused again
+                print(f"Leaderboard server rejected {len(batch)} scores (status {status})")
+            elif status is None or not 200 <= status < 300:
+                # Keep unsent scores for the next attempt and fall back to local entries
+                self.outbox = batch + self.outbox
+                self.online = False
+                return
+        try:
+            status, body = await self._request("GET", f"/leaderboard?limit={LEADERBOARD_SIZE}")
+            if status == 200:
+                self.snapshot = json.loads(body)
+            self.online = True
+        except (OSError, asyncio.TimeoutError, ValueError, asyncio.IncompleteReadError):
+            # The scores were accepted, only the snapshot is missing until the next refresh
+            self.online = False
+
+    async def _acquire(self):
+        await self.connection_slots.acquire()
+        if self.idle_connections:
+            return self.idle_connections.pop()
+        try:
+            return await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        except BaseException:
+            self.connection_slots.release()
+            raise
+
+    def _release(self, connection, reusable):
+        if reusable:
+            self.idle_connections.append(connection)
+        else:
+            connection[1].close()
+        self.connection_slots.release()
+
+    async def _request(self, method, path, body=b''):
+        connection = await self._acquire()
+        reader, writer = connection
+        reusable = False
+        try:
+            writer.write((f"{method} {path} HTTP/1.1\r\n"
+                          f"Host: {self.host}:{self.port}\r\n"
+                          f"Content-Type: application/json\r\n"
+                          f"Content-Length: {len(body)}\r\n"
+                          f"Connection: keep-alive\r\n\r\n").encode('latin-1') + body)
+            await writer.drain()
+            status, headers, response = await asyncio.wait_for(self._read_response(reader), self.timeout)
+            reusable = headers.get('connection', '').lower() != 'close'
+            return status, response
+        finally:
+            self._release(connection, reusable)
+
+    async def _read_response(self, reader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("leaderboard server closed the connection")
+        parts = status_line.split()
+        if len(parts) < 2:
+            raise ValueError(f"malformed status line from leaderboard server: {status_line!r}")
+        status = int(parts[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            headers[key.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get('content-length', 0) or 0))
+        return status, headers, body
+
+    async def _close_connections(self):
+        for _, writer in self.idle_connections:
+            writer.close()
+        self.idle_connections = []
 
 def show_leaderboard_screen(screen, leaderboard):
     running = True
     font = pygame.font.Font(None, MENU_FONT_SIZE)
     title_font = pygame.font.Font(None, int(MENU_FONT_SIZE * 1.5))
     
+    # Global leaderboards fetch in the background, entries switch over once it lands
+    if hasattr(leaderboard, 'refresh'):
+        leaderboard.refresh()
+    
     while running:
         draw_background(screen, 'level')
         
@@ -0,0 +1,220 @@
+"""
+Small asyncio HTTP server for the global leaderboard.
+
+Speaks just enough HTTP/1.1 (keep-alive, Content-Length bodies) for
+LeaderboardClient in leaderboard.py. Scores are stored with the same SQLite
+backed Leaderboard class the game uses locally.
+
+Endpoints:
+- GET /leaderboard?limit=N: Top N entries as JSON, served from a cache that is
+  only rebuilt after new scores are written.
+- POST /scores: A JSON entry or list of entries. Entries are queued and written
+  in one transaction per batch. An entry sent again with the same id is dropped,
+  so a client can safely retry a batch it never got an answer for.
+
+Usage:
+python leaderboard_server.py [--host 127.0.0.1] [--port 8765] [--db leaderboard_server.db]
+"""
+import argparse
+import asyncio
+import json
+import math
+from urllib.parse import urlsplit, parse_qs
+
+from leaderboard import Leaderboard
+from utils import (LEADERBOARD_SIZE, LEADERBOARD_SERVER_HOST, LEADERBOARD_SERVER_PORT,
+                   LEADERBOARD_BATCH_SIZE, LEADERBOARD_FLUSH_INTERVAL)
+
+MAX_BODY_SIZE = 64 * 1024
+MAX_NAME_LENGTH = 15  # Matches the name input box in get_player_name
+MAX_TIME = 99 * 3600 + 59 * 60 + 59  # Longest time the HH:MM:SS display can show
+MAX_ID_LENGTH = 64
+
+STATUS_TEXT = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}
+
+
+class LeaderboardServer:
+    def __init__(self, storage, host=LEADERBOARD_SERVER_HOST, port=LEADERBOARD_SERVER_PORT,
+                 batch_size=LEADERBOARD_BATCH_SIZE, flush_interval=LEADERBOARD_FLUSH_INTERVAL):
+        self.storage = storage
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = []  # Validated entries waiting for the next batch write
+        self.top_cache = {}  # limit -> encoded JSON body
+        self.server = None
+        self.flush_task = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        # Port 0 picks a free port, report the real one back
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self):
+        if self.flush_task:
+            self.flush_task.cancel()
+            try:
+                await self.flush_task
+            except asyncio.CancelledError:
+                pass
+        self.flush()
+        if self.server:
+            self.server.close()
+            await self.server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Leaderboard server listening on {self.host}:{self.port}")
+        async with self.server:
+            await self.server.serve_forever()
+
+    def flush(self):
+        """Write every pending entry in a single transaction and drop the top-N cache."""
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        self.storage.add_entries(batch)
+        self.top_cache.clear()
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def get_top(self, limit):
+        # Reads always see earlier submissions, batching only coalesces the writes
+        self.flush()
+        if limit not in self.top_cache:
+            self.top_cache[limit] = json.dumps(self.storage.get_top_entries(limit)).encode()
+        return self.top_cache[limit]
+
+    def queue_entries(self, entries):
+        if isinstance(entries, dict):
+            entries = [entries]
+        if not isinstance(entries, list):
+            raise ValueError("expected an entry or a list of entries")
+
+        validated = []
+        for entry in entries:
+            name, total, submission_id = entry['name'], entry['time'], entry.get('id')
+            if not isinstance(name, str):
+                raise ValueError("name must be a string")
+            # bool is an int too, and JSON numbers like 1e999 come in as inf
+            if isinstance(total, bool) or not isinstance(total, (int, float)) or not math.isfinite(total):
+                raise ValueError("time must be a number")
+            if submission_id is not None and (not isinstance(submission_id, str)
+                                              or not 0 < len(submission_id) <= MAX_ID_LENGTH):
+                raise ValueError("bad id")
+            name = name.strip()[:MAX_NAME_LENGTH]
+            total = int(total)
+            if not name or not 0 <= total <= MAX_TIME:
+                raise ValueError("invalid entry")
+            hours, rest = divmod(total, 3600)
+            validated.append({
+                'name': name,
+                'time': total,
+                'display_time': f"{hours:02d}:{rest // 60:02d}:{rest % 60:02d}",
+                'id': submission_id
+            })
+
+        self.pending.extend(validated)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        return len(validated)
+
+    async def handle_client(self, reader, writer):
+        # One connection serves requests until the client closes it
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, _ = request_line.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "bad request line"}, keep_alive=False)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # The body's end can't be found, so the connection can't be read any further
+                    await self._respond(writer, 400, {"error": "bad content length"}, keep_alive=False)
+                    break
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                if length > MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {"error": "body too large"}, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = self.route(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def route(self, method, target, body):
+        url = urlsplit(target)
+        if method == 'GET' and url.path == '/leaderboard':
+            try:
+                limit = int(parse_qs(url.query).get('limit', [LEADERBOARD_SIZE])[0])
+            except ValueError:
+                return 400, {"error": "bad limit"}
+            return 200, self.get_top(max(1, min(limit, 100)))
+        if method == 'POST' and url.path == '/scores':
+            try:
+                queued = self.queue_entries(json.loads(body or b'null'))
+            except (ValueError, KeyError, TypeError, OverflowError):
+                return 400, {"error": "bad entries"}
+            return 202, {"queued": queued}
+        return 404, {"error": "not found"}
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trogdor leaderboard server")
+    parser.add_argument('--host', default=LEADERBOARD_SERVER_HOST)
+    parser.add_argument('--port', type=int, default=LEADERBOARD_SERVER_PORT)
+    parser.add_argument('--db', default='leaderboard_server.db')
+    args = parser.parse_args()
+
+    storage = Leaderboard(db_file=args.db, leaderboard_file=None)
+    if storage.connection is None:
+        # Nothing could be stored, so don't accept scores only to drop them
+        print(f"Leaderboard server can't open {args.db}, not starting")
+        return
+    server = LeaderboardServer(storage, args.host, args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.flush()
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
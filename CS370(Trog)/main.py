@@ -9,23 +9,28 @@ import random
 import pygame
 import math
 
-from entities import Trogdor, Peasant
+from entities import Trogdor, spawn_peasant
 from bosses import Basilisk, Lancelot, Merlin, DragonKing
 from utils import (BURNINATION_DURATION, GREEN, INITIAL_BURNINATION_THRESHOLD, ORANGE, PEASANT_SPAWN_PROBABILITY,
-                   RED, WHITE, WIDTH, HEIGHT, BLACK, FPS, INITIAL_LIVES, YELLOW, UIBARHEIGHT)
+                   RED, WHITE, WIDTH, HEIGHT, BLACK, FPS, INITIAL_LIVES, YELLOW, UIBARHEIGHT, QUALITY_ADAPTIVE)
 from ui import (start_screen, load_sound, play_music, draw_background, 
                initialize_background_images, draw_burnination_bar, 
                show_credit_screen, show_tutorial_screen, show_congratulations_screen, 
                pause_game, game_over)
-from powerups import select_power_up
-from leaderboard import Leaderboard, show_leaderboard_screen, get_player_name
+from powerups import power_up_steps
+from leaderboard import Leaderboard, LeaderboardClient, show_leaderboard_screen, get_player_name
 from projectile_handler import update_projectiles
 from util_functions import (initialize_game, update_boss, update_time, 
-                          draw_game_area, check_regular_collisions, 
+                          check_regular_collisions, 
                           handle_house_burnination, handle_peasant_collisions,
-                          update_regular_enemies, get_collision_entities,
                           handle_game_over)
 from cutscenes import show_cutscene
+from timeline import Timeline
+from gc_manager import GCManager
+from memory_monitor import MEMORY_MONITOR
+from quality import QualityGovernor
+from static_layer import StaticLayer
+from particles import print_particle_stats
 
 # Initialize Pygame
 pygame.init()
@@ -47,6 +52,9 @@ bell_noise.set_volume(1)
 splat_noise.set_volume(.25)
 slash_noise.set_volume(.25)
 
+# Times every garbage collection and moves full collections to the pauses between play
+gc_manager = GCManager()
+
 def game_loop(screen):
     # Initialize game state
     game_state = {
@@ -65,24 +73,58 @@ def game_loop(screen):
     }
     
     # Initialize game objects
-    trogdor, houses, peasants, knights, guardians, lancers, boss, projectiles, teleporters, trappers, apprentice_mages, builders = initialize_game(game_state['level'])
+    world = initialize_game(game_state['level'])
+    trogdor = world.trogdor
+    timeline = Timeline()  # Sequences like boss defeats, advanced a step per frame
+    governor = QualityGovernor()  # Lowers effect quality when frames take too long
+    static_layer = StaticLayer()  # Background, UI bar and houses, redrawn only where they change
     
     # Initialize level count to track the level
     level_cnt = 0
-    guardian_angle = 0
-    jump_time = 0
     running = True
     game_completed = False
     clock = pygame.time.Clock()
     spawn_time = 0
+    loaded_world = None  # World the collector was last set up for
+    paused = False  # Whether the timeline paused play last frame
     
     while running:
+        gc_manager.next_frame()
+
         # Event handling
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 return False, game_stats
 
+        # Victory jingles, cutscenes and the power-up choice run a frame at a time
+        timeline.update(events)
+        if timeline.busy:
+            # Play is paused, but the window keeps answering events and drawing
+            if not paused:
+                gc_manager.idle()
+                loaded_world = None  # Set the collector up for play again when it resumes
+                paused = True
+            if timeline.overlay is not None:
+                screen.blit(timeline.overlay, (0, 0))
+            pygame.display.flip()
+            clock.tick(FPS)
+            continue
+
+        # A finished boss defeat sequence moves the game on to the next level
+        if world.level != game_state['level']:
+            world = initialize_game(game_state['level'], world)
+            trogdor = world.trogdor
+        paused = False
+
+        # First frame played on a new world, its objects are loaded and can be frozen
+        if world is not loaded_world:
+            gc_manager.level_loaded()
+            governor.reset()  # This frame's time went to loading
+            loaded_world = world
+        MEMORY_MONITOR.update(world)
+
         # Start of every level play bell_noise and set spawn time to current time  
         if level_cnt < game_state['level']: 
             bell_noise.play()
@@ -106,98 +148,68 @@ def game_loop(screen):
         
         trogdor.update()
 
-        # Update all regular enemies
-        guardian_angle, jump_time = update_regular_enemies(
-            peasants, knights, apprentice_mages, builders, guardians, 
-            teleporters, lancers, trappers, trogdor, projectiles, 
-            houses, guardian_angle, game_stats, jump_time
-        )
+        # Update all regular enemies through the world's systems
+        world.update(game_stats)
         
         # Update projectiles
         continue_game, spawn_time = update_projectiles(
-            projectiles, trogdor, game_state, game_stats, 
-            spawn_time, jump_time, slash_noise, screen
+            world.projectiles, trogdor, game_state, game_stats, 
+            spawn_time, world.jump_time, slash_noise, screen
         )
         if not continue_game:
             return False, game_stats
 
-        # Get all entities that need collision checking
-        collision_entities = get_collision_entities(knights, lancers, teleporters, guardians, apprentice_mages, trappers)
-        
         # Handle boss updates with our modular system
-        if boss is not None:
-            boss, spawn_time, boss_game_completed = update_boss(
-                boss, trogdor, projectiles, game_state, game_stats, 
-                spawn_time, jump_time, slash_noise, screen
+        if world.boss is not None:
+            world.boss, spawn_time, boss_game_completed = update_boss(
+                world.boss, trogdor, world.projectiles, game_state, game_stats, 
+                spawn_time, world.jump_time, slash_noise, screen, timeline
             )
             
             if boss_game_completed:
                 game_completed = True
                 return game_completed, game_stats
                 
-            # If boss was defeated and we got a new boss, reload all entities
-            if game_state['level'] != level_cnt:
-                trogdor, houses, peasants, knights, guardians, lancers, boss, projectiles, teleporters, trappers, apprentice_mages, builders = initialize_game(game_state['level'])
+            # If the game restarted on another level, reload all entities
+            if not timeline.busy and game_state['level'] != world.level:
+                world = initialize_game(game_state['level'], world)
+                trogdor = world.trogdor
 
         # Regular level completion logic (non-boss levels)
-        if not boss and houses:
+        if not world.boss and world.houses:
             # Handle house burnination and level advancement
-            advanced, game_state = handle_house_burnination(trogdor, houses, game_state, game_stats, spawn_time, jump_time, screen)
+            advanced, game_state = handle_house_burnination(trogdor, world.houses, game_state, game_stats, spawn_time, world.jump_time, screen)
             if advanced:
-                trogdor, houses, peasants, knights, guardians, lancers, boss, projectiles, teleporters, trappers, apprentice_mages, builders = initialize_game(game_state['level'])
-                peasants.clear()
-                game_state = select_power_up(screen, trogdor, game_state, game_stats['timeH'], game_stats['timeM'], game_stats['timeS'])
+                world = initialize_game(game_state['level'], world)
+                trogdor = world.trogdor
+                world.peasants.clear()
+                timeline.start(power_up_steps(screen, trogdor, game_state, game_stats['timeH'], game_stats['timeM'], game_stats['timeS']))
                 
             # Randomly spawn new peasants
-            if random.random() < PEASANT_SPAWN_PROBABILITY and houses:
-                peasants.append(Peasant(random.choice(houses)))
+            if random.random() < PEASANT_SPAWN_PROBABILITY and world.houses:
+                spawn_peasant(world.peasants, random.choice(world.houses))
             
             # Check for collisions between Trogdor and peasants
-            handle_peasant_collisions(trogdor, peasants, game_state, splat_noise)
+            handle_peasant_collisions(trogdor, world.peasants, game_state, splat_noise)
             
-            # Check for collisions between Trogdor and collision_entities
+            # Check for collisions between Trogdor and the level's registered enemies and traps
             game_over_result, spawn_time = check_regular_collisions(
-                trogdor, collision_entities, game_state, game_stats, 
-                spawn_time, jump_time, slash_noise, screen
+                trogdor, world.collision_registry, game_state, game_stats, 
+                spawn_time, world.jump_time, slash_noise, screen
             )
             
             if game_over_result == "exit":
                 return False, game_stats
             elif game_over_result == "restart":
-                trogdor, houses, peasants, knights, guardians, lancers, boss, projectiles, teleporters, trappers, apprentice_mages, builders = initialize_game(game_state['level'])
+                world = initialize_game(game_state['level'], world)
+                trogdor = world.trogdor
 
         # Drawing
-        screen.fill(BLACK)
-        draw_background(screen, 'level')
-        pygame.draw.rect(screen, BLACK, (0, 0, WIDTH, UIBARHEIGHT), 0)
+        # Background, UI bar, game area name and houses, from one cached surface
+        static_layer.draw(screen, world)
         
-        # Draw current game area name
-        draw_game_area(screen, game_state['level'])
-        
-        # Draw all game objects
-        for house in houses:
-            house.draw(screen)
-        for peasant in peasants:
-            peasant.draw(screen)
-        for knight in knights:
-            knight.draw(screen)
-        for guardian in guardians:
-            guardian.draw(screen)
-        for lancer in lancers:
-            lancer.draw(screen)
-        for projectile in projectiles:
-            projectile.draw(screen)
-        for teleporter in teleporters:
-            teleporter.draw(screen)
-        for trapper in trappers:
-            trapper.draw(screen)
-        for apprentice_mage in apprentice_mages:
-            apprentice_mage.draw(screen)
-        for builder in builders:
-            builder.draw(screen)
-        if boss:
-            boss.draw(screen)
-        trogdor.draw(screen)
+        # Draw the other game objects, layer by layer
+        world.draw(screen, static_layer.layers)
         
         # Draw UI
         font = pygame.font.Font(None, 36)
@@ -220,6 +232,9 @@ def game_loop(screen):
         
         pygame.display.flip()
         clock.tick(FPS)
+        if QUALITY_ADAPTIVE:
+            # Time spent on the frame itself, without the wait tick added to hold FPS
+            governor.record(clock.get_rawtime())
         
         # Update time tracking
         game_stats = update_time(game_stats)
@@ -237,11 +252,16 @@ def main():
     # Initialize background images
     initialize_background_images()
     
-    # Initialize leaderboard
-    leaderboard = Leaderboard()
+    # Initialize leaderboard, scores are kept locally and synced to the global server in the background
+    leaderboard = LeaderboardClient(Leaderboard())
+    gc_manager.install()
+    MEMORY_MONITOR.start()
     running = True
     
     while running:
+        # Menus are a pause too
+        gc_manager.idle()
+
         try:
             draw_background(screen, 'menu')
         except Exception as e:
@@ -275,9 +295,14 @@ def main():
             show_tutorial_screen(screen)
         elif choice == "exit":
             running = False
+            leaderboard.close()
+            gc_manager.close()
+            print_particle_stats()
             pygame.quit()
             return
     
+    gc_manager.close()
+    print_particle_stats()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""
+Opt-in tracemalloc memory reports per level and boss phase, with a size watchdog.
+
+Long sessions have grown in memory through lists that only ever get appended to,
+like the Dragon King's fire breath, boss particle lists and the Basilisk's shed
+skins. With MEMORY_PROFILING on, the monitor snapshots tracemalloc when a level
+starts and ends and when a boss changes phase. Each snapshot is compared to the
+one before it, by allocating module and by line, and the biggest differences are
+appended to MEMORY_REPORT_PATH.
+
+Every MEMORY_WATCHDOG_INTERVAL frames the watchdog also counts the entries of the
+world's entity collections and of every list the boss holds, and warns once per
+level about each one that is over its budget (MEMORY_BUDGETS, or
+MEMORY_DEFAULT_BUDGET for collections that aren't listed).
+
+Classes:
+- MemoryMonitor: Snapshots, report writing and the collection watchdog.
+"""
+import time
+import tracemalloc
+
+from utils import (MEMORY_PROFILING, MEMORY_REPORT_PATH, MEMORY_REPORT_LINES, MEMORY_WATCHDOG_INTERVAL,
+                   MEMORY_BUDGETS, MEMORY_DEFAULT_BUDGET)
+
+# World collections the watchdog counts, next to every list the boss holds
+WORLD_COLLECTIONS = ('peasants', 'knights', 'guardians', 'lancers', 'teleporters', 'trappers',
+                     'apprentice_mages', 'builders', 'projectiles')
+
+class MemoryMonitor:
+    def __init__(self, enabled=MEMORY_PROFILING, report_path=MEMORY_REPORT_PATH, budgets=MEMORY_BUDGETS,
+                 default_budget=MEMORY_DEFAULT_BUDGET, interval=MEMORY_WATCHDOG_INTERVAL):
+        self.enabled = enabled
+        self.report_path = report_path
+        self.budgets = budgets
+        self.default_budget = default_budget
+        self.interval = interval
+        self.world = None  # World the last level start snapshot was taken for
+        self.boss_phase = None
+        self.frames = 0
+        self.warned = set()  # Collections already warned about on this level
+        self.previous = None  # (label, snapshot) the next snapshot is compared to
+        self.report_started = False
+
+    def start(self):
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def update(self, world):
+        """Call once per frame with the world being played."""
+        if not self.enabled:
+            return
+        if world is not self.world:
+            self.world = world
+            self.boss_phase = getattr(world.boss, 'phase', None)
+            self.warned.clear()
+            self.snapshot(f"level {world.level} start")
+        phase = getattr(world.boss, 'phase', None)
+        if phase != self.boss_phase:
+            self.snapshot(f"level {world.level} {type(world.boss).__name__} phase {phase}")
+            self.boss_phase = phase
+        self.frames += 1
+        if self.frames % self.interval == 0:
+            self.check_budgets(world)
+
+    def level_end(self, world):
+        """The world is about to be replaced by the next level's."""
+        if not self.enabled or world is None:
+            return
+        self.check_budgets(world)
+        self.snapshot(f"level {world.level} end")
+
+    def snapshot(self, label):
+        if not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        if self.previous is not None:
+            self.write_diff(label, snapshot)
+        self.previous = (label, snapshot)
+
+    def write_diff(self, label, snapshot):
+        previous_label, previous = self.previous
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"=== {label} vs {previous_label} ({time.strftime('%H:%M:%S')}) ===",
+                 f"traced {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB"]
+        for key_type, title in (('filename', "By module:"), ('lineno', "By line:")):
+            lines.append(title)
+            for stat in snapshot.compare_to(previous, key_type)[:MEMORY_REPORT_LINES]:
+                if stat.size_diff:
+                    lines.append(f"  {stat}")
+        self.write(lines)
+
+    def check_budgets(self, world):
+        """Warn about every collection that has more entries than its budget."""
+        collections = [(name, getattr(world, name, ())) for name in WORLD_COLLECTIONS]
+        for trapper in world.trappers:
+            collections.append(('traps', trapper.traps))
+        boss = world.boss
+        if boss is not None:
+            boss_name = type(boss).__name__
+            collections.extend((f"{boss_name}.{name}", value) for name, value in vars(boss).items()
+                               if isinstance(value, list))
+        for name, collection in collections:
+            budget = self.budgets.get(name.rpartition('.')[2], self.default_budget)
+            if len(collection) > budget and name not in self.warned:
+                self.warned.add(name)
+                warning = f"Memory watchdog: {name} has {len(collection)} entries, budget {budget} (level {world.level})"
+                print(warning)
+                self.write([warning])
+
+    def write(self, lines):
+        if not self.report_path:
+            return
+        try:
+            with open(self.report_path, 'a' if self.report_started else 'w') as report:
+                report.write("\n".join(lines) + "\n")
+            self.report_started = True
+        except OSError as e:
+            print(f"Error writing memory report: {e}")
+
+MEMORY_MONITOR = MemoryMonitor()
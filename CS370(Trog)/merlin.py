@@ -26,7 +26,11 @@ Functions:
 - _add_spell_particles: Adds visual particles for spell casting effects.
 - _create_mirror_image: Creates a mirror image of Merlin with its own behavior.
 - draw: Draws Merlin and all related visual effects on the screen.
-- _draw_wizard: Draws Merlin's wizard appearance, including robe, hat, and beard.
+- _draw_wizard: Draws Merlin's wizard appearance, including robe, hat, and beard, from cached sprites.
+- _wizard_pose: The rounded sway offsets shared by _draw_wizard and hit_parts.
+- hit_parts: Pixel masks of the robe, hat and beard as drawn, for hit tests against Merlin or a mirror image.
+- _render_robe, _render_hat, _render_hat_band, _render_eyes, _render_beard, _render_staff, _render_orb:
+  Build the pre-rendered sprites used by _draw_wizard, _draw_staff_effects and _draw_mirror_image.
 - _draw_staff_effects: Draws Merlin's staff and its magical effects.
 - _draw_mirror_image: Draws a semi-transparent mirror image of Merlin.
 - _draw_channeling_aura: Draws the aura effect during the channeling state.
@@ -41,9 +45,14 @@ from utils import (BASILISK_BURROW_DURATION, BASILISK_HEAD_SIZE, BASILISK_PHASE_
                    LANCELOT_VULNERABLE_DURATION, MERLIN_PROJECTILE_COOLDOWN, MERLIN_PROJECTILE_SIZE, 
                    MERLIN_SIZE, MERLIN_TELEPORT_DISTANCE, WIDTH, HEIGHT, UIBARHEIGHT,
                      RED, GREEN, BLUE, YELLOW, ORANGE, WHITE, BLACK)
-from utils import BOSS_HEALTH_BAR_WIDTH, BOSS_HEALTH_BAR_HEIGHT, BOSS_HEALTH_BAR_BORDER
-from entities import Projectile
+from utils import BOSS_HEALTH_BAR_WIDTH, BOSS_HEALTH_BAR_HEIGHT, BOSS_HEALTH_BAR_BORDER, ARCANE_CIRCLE_DAMAGE_FRAMES
+from entities import PROJECTILE_POOL
 from ui import load_sound
+from trig_tables import unit_vector, unit_circle, rotated_circle
+from sprite_cache import SpriteCache, RotationCache, render_polygon, sprite_mask
+from hazard_map import HazardMap
+from quality import QUALITY, draw_glow_circle
+from particles import particle_culled, cull_particles
 
 
 class Merlin:
@@ -74,6 +83,7 @@ class Merlin:
         # Spell visual effects
         self.spell_particles = []
         self.arcane_circles = []
+        self.hazards = HazardMap()  # Arcane circles in their damaging final frames
         self.staff_angle = 0
         self.staff_length = self.size * 0.8
         self.staff_orb_size = self.size * 0.3
@@ -96,6 +106,8 @@ class Merlin:
         self.robe_color = BLUE
         self.beard_length = self.size * 0.4
         self.hat_height = self.size * 0.7
+        self.sprites = SpriteCache()  # Pre-rendered body parts, see _draw_wizard
+        self.hit_masks = SpriteCache()  # Masks of the robe, hat and beard per pose, see hit_parts
         
     def update(self, trogdor, projectiles):
         # Update phase based on health
@@ -146,10 +158,10 @@ class Merlin:
                 image['cooldown'] -= 1
                 if image['cooldown'] <= 0:
                     angle = math.atan2(trogdor.y - image['y'], trogdor.x - image['x'])
-                    projectiles.append(Projectile(image['x'] + self.size // 2, 
-                                                 image['y'] + self.size // 2, 
-                                                 angle, 
-                                                 self.projectile_size * 0.8))
+                    projectiles.append(PROJECTILE_POOL.acquire(image['x'] + self.size // 2, 
+                                                         image['y'] + self.size // 2, 
+                                                         angle, 
+                                                         self.projectile_size * 0.8))
                     image['cooldown'] = MERLIN_PROJECTILE_COOLDOWN * 2
                     
                     # Add spell casting particles from mirror image
@@ -158,13 +170,18 @@ class Merlin:
                                             angle)
                     
         # Update arcane circles
+        self.hazards.tick()
         for circle in self.arcane_circles[:]:
             circle['timer'] -= 1
+            
+            # Circles only hurt in their last ARCANE_CIRCLE_DAMAGE_FRAMES, stamp them when that starts
+            if circle['timer'] == ARCANE_CIRCLE_DAMAGE_FRAMES - 1:
+                self.hazards.stamp_circle(circle['x'], circle['y'], circle['radius'], ARCANE_CIRCLE_DAMAGE_FRAMES - 1)
             if circle['timer'] <= 0:
                 # Create an explosion of projectiles when circle expires
                 if circle['explodes']:
                     # Add spell particles for explosion
-                    for _ in range(15):
+                    for _ in range(QUALITY.particles(15)):
                         angle = random.uniform(0, 2 * math.pi)
                         distance = random.uniform(0, circle['radius'])
                         particle_x = circle['x'] + math.cos(angle) * distance
@@ -184,8 +201,8 @@ class Merlin:
                     # Create projectiles in all directions
                     for i in range(8):
                         angle = i * math.pi / 4
-                        projectiles.append(Projectile(circle['x'], circle['y'], 
-                                                    angle, self.projectile_size))
+                        projectiles.append(PROJECTILE_POOL.acquire(circle['x'], circle['y'], 
+                                                            angle, self.projectile_size))
                         
                 self.arcane_circles.remove(circle)
             else:
@@ -193,22 +210,21 @@ class Merlin:
                 circle['visual_radius'] = circle['radius'] * (0.8 + 0.2 * abs(math.sin(circle['timer'] * 0.05)))
 
     def _update_particles(self):
-        # Update teleport particles
-        for particle in self.teleport_particles[:]:
+        # Update teleport particles, they fade out with their timer
+        for particle in self.teleport_particles:
             particle['timer'] -= 1
             particle['size'] -= 0.15
-            if particle['timer'] <= 0 or particle['size'] <= 0:
-                self.teleport_particles.remove(particle)
+        self.teleport_particles[:] = [particle for particle in self.teleport_particles
+                                      if not particle_culled(particle['x'], particle['y'], particle['size'],
+                                                             255 * particle['timer'] / 30)]
                 
         # Update spell particles
-        for particle in self.spell_particles[:]:
+        for particle in self.spell_particles:
             particle['x'] += particle['dx']
             particle['y'] += particle['dy']
             particle['size'] -= 0.1
             particle['alpha'] -= particle['fade_rate']
-            
-            if particle['alpha'] <= 0 or particle['size'] <= 0:
-                self.spell_particles.remove(particle)
+        cull_particles(self.spell_particles)
                 
     def _update_normal(self, trogdor, projectiles):
         # Basic attack pattern: teleport and shoot
@@ -252,7 +268,7 @@ class Merlin:
         self.spell_charge = min(1.0, self.spell_charge + 0.01)
         
         # Add channeling particles in a circle
-        if random.random() < 0.3:
+        if QUALITY.chance(0.3):
             angle = random.uniform(0, 2 * math.pi)
             radius = self.size * (0.8 + 0.4 * self.spell_charge)
             particle_x = self.x + self.size/2 + math.cos(angle) * radius
@@ -337,10 +353,10 @@ class Merlin:
                 
                 # Fire projectile at player from new position
                 angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
-                projectiles.append(Projectile(self.x + self.size // 2, 
-                                            self.y + self.size // 2, 
-                                            angle, 
-                                            self.projectile_size))
+                projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                    self.y + self.size // 2, 
+                                                    angle, 
+                                                    self.projectile_size))
                                             
                 # Add spell casting particles
                 self._add_spell_particles(self.x + self.size // 2, 
@@ -394,10 +410,10 @@ class Merlin:
                 angle = math.atan2(target_y - self.y, target_x - self.x)
                 
                 # Fire projectile and spell particles
-                projectiles.append(Projectile(self.x + self.size // 2, 
-                                            self.y + self.size // 2, 
-                                            angle, 
-                                            self.projectile_size * 1.2))  # Larger projectiles
+                projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                    self.y + self.size // 2, 
+                                                    angle, 
+                                                    self.projectile_size * 1.2))  # Larger projectiles
                                             
                 self._add_spell_particles(self.x + self.size // 2, 
                                         self.y + self.size // 2,
@@ -406,14 +422,14 @@ class Merlin:
                 # In phases 2+, add additional spread shots
                 if self.phase >= 2:
                     spread = 0.2  # Spread angle in radians
-                    projectiles.append(Projectile(self.x + self.size // 2, 
-                                                self.y + self.size // 2, 
-                                                angle + spread, 
-                                                self.projectile_size))
-                    projectiles.append(Projectile(self.x + self.size // 2, 
-                                                self.y + self.size // 2, 
-                                                angle - spread, 
-                                                self.projectile_size))
+                    projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                        self.y + self.size // 2, 
+                                                        angle + spread, 
+                                                        self.projectile_size))
+                    projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                        self.y + self.size // 2, 
+                                                        angle - spread, 
+                                                        self.projectile_size))
                 
                 # In phase 3, add arcane circles at target positions
                 if self.phase == 3 and self.arcane_barrage_count % 3 == 0:
@@ -457,10 +473,10 @@ class Merlin:
                 
                 for i in range(3):  # 3 projectiles in arc
                     shot_angle = base_angle + (i - 1) * (wave_width / 2)
-                    projectiles.append(Projectile(self.x + self.size // 2, 
-                                                self.y + self.size // 2, 
-                                                shot_angle, 
-                                                self.projectile_size))
+                    projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                        self.y + self.size // 2, 
+                                                        shot_angle, 
+                                                        self.projectile_size))
                     
                     self._add_spell_particles(self.x + self.size // 2, 
                                             self.y + self.size // 2,
@@ -476,10 +492,10 @@ class Merlin:
             angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
             
             # Fire a projectile
-            projectiles.append(Projectile(self.x + self.size // 2, 
-                                        self.y + self.size // 2, 
-                                        angle, 
-                                        self.projectile_size))
+            projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                self.y + self.size // 2, 
+                                                angle, 
+                                                self.projectile_size))
                                         
             self._add_spell_particles(self.x + self.size // 2, 
                                     self.y + self.size // 2,
@@ -488,10 +504,10 @@ class Merlin:
             # In phase 2+, occasionally fire random shots too
             if self.phase >= 2 and random.random() < 0.3:
                 random_angle = random.uniform(0, 2 * math.pi)
-                projectiles.append(Projectile(self.x + self.size // 2, 
-                                            self.y + self.size // 2, 
-                                            random_angle, 
-                                            self.projectile_size * 0.8))
+                projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                                    self.y + self.size // 2, 
+                                                    random_angle, 
+                                                    self.projectile_size * 0.8))
         
         # End fury if timer expires
         if self.state_timer <= 0:
@@ -546,10 +562,10 @@ class Merlin:
         angle = math.atan2(trogdor.y - self.y, trogdor.x - self.x)
         
         # Create projectile
-        projectiles.append(Projectile(self.x + self.size // 2, 
-                                    self.y + self.size // 2, 
-                                    angle, 
-                                    self.projectile_size))
+        projectiles.append(PROJECTILE_POOL.acquire(self.x + self.size // 2, 
+                                            self.y + self.size // 2, 
+                                            angle, 
+                                            self.projectile_size))
                                     
         # Add spell particles
         self._add_spell_particles(self.x + self.size // 2, 
@@ -596,7 +612,7 @@ class Merlin:
 
     def _add_teleport_particles(self, x, y):
         # Create particles in a circle
-        for _ in range(20):
+        for _ in range(QUALITY.particles(20)):
             angle = random.uniform(0, 2 * math.pi)
             distance = random.uniform(0, self.size * 0.7)
             particle_x = x + self.size/2 + math.cos(angle) * distance
@@ -614,7 +630,7 @@ class Merlin:
             
     def _add_spell_particles(self, x, y, angle):
         # Create spell casting particles
-        for _ in range(10):
+        for _ in range(QUALITY.particles(10)):
             spread = random.uniform(-0.5, 0.5)
             speed = random.uniform(1, 4)
             
@@ -661,37 +677,16 @@ class Merlin:
         # Draw teleport particles
         for particle in self.teleport_particles:
             alpha = int(255 * (particle['timer'] / 30))
-            color = (100, 100, 255, alpha)  # Blue with fade
             
-            # Create surface with alpha
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, 
-                             (particle['size'], particle['size']), 
-                             particle['size'])
-            
-            # Calculate position based on expanding or contracting from center
-            center_x = self.x + self.size/2
-            center_y = self.y + self.size/2
-            
-            particle_x = particle['x'] - particle['size']
-            particle_y = particle['y'] - particle['size']
-            
-            screen.blit(particle_surface, (particle_x, particle_y))
+            # Blue with fade, drawn with alpha when glow surfaces are on
+            draw_glow_circle(screen, (100, 100, 255), alpha, particle['x'], particle['y'], particle['size'])
             
         # Draw spell particles
         for particle in self.spell_particles:
-            color = (particle['color'][0], particle['color'][1], particle['color'][2], 
-                    min(255, max(0, int(particle['alpha']))))
-            
-            # Create surface with alpha
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color, 
-                             (particle['size'], particle['size']), 
-                             particle['size'])
+            alpha = min(255, max(0, int(particle['alpha'])))
             
-            screen.blit(particle_surface, (
-                int(particle['x'] - particle['size']), 
-                int(particle['y'] - particle['size'])))
+            # Drawn with alpha when glow surfaces are on
+            draw_glow_circle(screen, particle['color'], alpha, particle['x'], particle['y'], particle['size'])
                 
         # Draw mirror images (behind main Merlin)
         for image in self.mirror_images:
@@ -751,7 +746,7 @@ class Merlin:
             )
             
         # Draw Merlin as a wizard
-        self._draw_wizard(screen, base_color)
+        self._draw_wizard(screen, base_color, self.x, self.y)
         
         # Draw the staff's magical effects
         self._draw_staff_effects(screen)
@@ -759,132 +754,153 @@ class Merlin:
         # Draw health bar
         self.draw_health_bar(screen)
         
-    def _draw_wizard(self, screen, base_color):
-        """Draw Merlin with wizard robe, hat, beard, etc."""
-        # Center point of Merlin
-        center_x = self.x + self.size / 2
-        center_y = self.y + self.size / 2
-        
-        # Draw robe (body)
-        robe_points = []
-        robe_width = self.size
-        robe_height = self.size * 1.2  # Robe extends below body
+    def _draw_wizard(self, screen, base_color, x, y):
+        """Draw Merlin with wizard robe, hat, beard, etc. at (x, y) from pre-rendered parts"""
+        sway, hat_tip_bend, beard_sway = self._wizard_pose()
         
-        # Calculate robe points with slight swaying animation
-        sway = math.sin(pygame.time.get_ticks() * 0.002) * (self.size * 0.05)
-        
-        # Top left of robe
-        robe_points.append((self.x - sway, self.y + self.size * 0.3))  
-        # Top right of robe
-        robe_points.append((self.x + self.size + sway, self.y + self.size * 0.3))
-        # Bottom right with flare
-        robe_points.append((self.x + self.size * 1.2 + sway, self.y + robe_height))
-        # Bottom middle (pointed robe)
-        robe_points.append((center_x, self.y + robe_height * 1.1))
-        # Bottom left with flare
-        robe_points.append((self.x - self.size * 0.2 - sway, self.y + robe_height))
-        
-        # Draw the robe
-        pygame.draw.polygon(screen, base_color, robe_points)
-        
-        # Draw wizard hat
-        hat_width = self.size * 0.8
-        hat_height = self.hat_height
-        hat_tip_bend = math.sin(pygame.time.get_ticks() * 0.001) * (hat_width * 0.2)
-        
-        hat_points = []
-        # Hat brim left
-        hat_points.append((self.x - hat_width * 0.2, self.y + self.size * 0.3))
-        # Hat brim right
-        hat_points.append((self.x + self.size + hat_width * 0.2, self.y + self.size * 0.3))
-        # Hat mid-right
-        hat_points.append((self.x + self.size * 0.7, self.y - hat_height * 0.3))
-        # Hat tip with animation
-        hat_points.append((center_x + hat_tip_bend, self.y - hat_height))
-        # Hat mid-left
-        hat_points.append((self.x + self.size * 0.3, self.y - hat_height * 0.3))
-        
-        # Draw hat with slightly darker color than robe
+        # Hat is slightly darker than the robe
         hat_color = (
             max(0, base_color[0] - 30),
             max(0, base_color[1] - 30),
             max(0, base_color[2] - 30)
         )
-        pygame.draw.polygon(screen, hat_color, hat_points)
-        
-        # Draw hat band
-        band_y = self.y - hat_height * 0.3 + hat_height * 0.1
-        band_left = self.x + self.size * 0.3
-        band_right = self.x + self.size * 0.7
-        band_height = hat_height * 0.15
-        
-        band_color = (200, 200, 50)  # Gold band
-        pygame.draw.rect(screen, band_color, (
-            band_left, 
-            band_y, 
-            band_right - band_left, 
-            band_height
-        ))
         
-        # Draw star on hat band
-        star_x = center_x
+        # Robe, hat, hat band with its star, eyes and beard, back to front
+        parts = [
+            self.sprites.get(('robe', base_color, sway), lambda: self._render_robe(base_color, sway)),
+            self.sprites.get(('hat', hat_color, hat_tip_bend), lambda: self._render_hat(hat_color, hat_tip_bend)),
+            self.sprites.get('hat_band', self._render_hat_band),
+            self.sprites.get('eyes', self._render_eyes),
+            self.sprites.get(('beard', beard_sway), lambda: self._render_beard(beard_sway)),
+        ]
+        for surface, (part_x, part_y) in parts:
+            screen.blit(surface, (x + part_x, y + part_y))
+        
+        # Pupils - look in direction of staff movement
+        pupil_cos, pupil_sin = unit_vector(self.staff_angle)
+        pupil_offset_x = pupil_cos * (self.size * 0.03)
+        pupil_offset_y = pupil_sin * (self.size * 0.03)
+        face_y = y + self.size * 0.5
+        for i in [-1, 1]:  # Left and right eyes
+            eye_x = x + self.size / 2 + i * self.size * 0.25
+            pygame.draw.circle(screen, (0, 0, 0), 
+                              (int(eye_x + pupil_offset_x), int(face_y + pupil_offset_y)), 
+                              int(self.size * 0.04))
+    
+    def _wizard_pose(self):
+        """Robe sway, hat tip bend and beard sway for this frame. Swaying parts are
+        cached per whole pixel of sway, so these are rounded."""
+        ticks = pygame.time.get_ticks()
+        return (round(math.sin(ticks * 0.002) * (self.size * 0.05)),
+                round(math.sin(ticks * 0.001) * (self.size * 0.8 * 0.2)),
+                round(math.sin(ticks * 0.0015) * (self.size * 0.6 * 0.1)))
+        
+    def hit_parts(self, x, y):
+        """(mask, (x, y)) for the robe, hat and beard of a wizard drawn at (x, y) this frame."""
+        sway, hat_tip_bend, beard_sway = self._wizard_pose()
+        # Colour doesn't change the shape, so each pose has one mask whatever the state
+        masks = [
+            self.hit_masks.get(('robe', sway), lambda: sprite_mask(self._render_robe(WHITE, sway))),
+            self.hit_masks.get(('hat', hat_tip_bend), lambda: sprite_mask(self._render_hat(WHITE, hat_tip_bend))),
+            self.hit_masks.get(('beard', beard_sway), lambda: sprite_mask(self._render_beard(beard_sway))),
+        ]
+        return [(mask, (x + part_x, y + part_y)) for mask, (part_x, part_y) in masks]
+    
+    # Sprite builders, in coordinates relative to Merlin's top-left corner
+    
+    def _render_robe(self, color, sway):
+        robe_height = self.size * 1.2  # Robe extends below body
+        return render_polygon([
+            (-sway, self.size * 0.3),  # Top left of robe
+            (self.size + sway, self.size * 0.3),  # Top right of robe
+            (self.size * 1.2 + sway, robe_height),  # Bottom right with flare
+            (self.size / 2, robe_height * 1.1),  # Bottom middle (pointed robe)
+            (-self.size * 0.2 - sway, robe_height)  # Bottom left with flare
+        ], color)
+        
+    def _render_hat(self, color, hat_tip_bend):
+        hat_width = self.size * 0.8
+        hat_height = self.hat_height
+        return render_polygon([
+            (-hat_width * 0.2, self.size * 0.3),  # Hat brim left
+            (self.size + hat_width * 0.2, self.size * 0.3),  # Hat brim right
+            (self.size * 0.7, -hat_height * 0.3),  # Hat mid-right
+            (self.size / 2 + hat_tip_bend, -hat_height),  # Hat tip with animation
+            (self.size * 0.3, -hat_height * 0.3)  # Hat mid-left
+        ], color)
+        
+    def _render_hat_band(self):
+        """Gold hat band with a white star on it"""
+        band_y = -self.hat_height * 0.3 + self.hat_height * 0.1
+        band_left = self.size * 0.3
+        band_right = self.size * 0.7
+        band_height = self.hat_height * 0.15
+        
+        star_x = self.size / 2
         star_y = band_y + band_height / 2
         star_radius = band_height * 0.8
         star_points = []
         
-        for i in range(5):
-            # Outer points of star
-            angle = i * 2 * math.pi / 5 - math.pi / 2  # Start at top
-            star_points.append((
-                star_x + math.cos(angle) * star_radius,
-                star_y + math.sin(angle) * star_radius
-            ))
-            
-            # Inner points of star
-            angle += math.pi / 5
-            star_points.append((
-                star_x + math.cos(angle) * (star_radius * 0.4),
-                star_y + math.sin(angle) * (star_radius * 0.4)
-            ))
-            
-        pygame.draw.polygon(screen, (255, 255, 255), star_points)
-        
-        # Draw face (just simple eyes for now)
-        face_y = self.y + self.size * 0.5
+        # Outer points start at the top, inner points sit halfway between them
+        outer_points = unit_circle(5, -math.pi / 2)
+        inner_points = unit_circle(5, -math.pi / 2 + math.pi / 5)
+        for (outer_cos, outer_sin), (inner_cos, inner_sin) in zip(outer_points, inner_points):
+            star_points.append((star_x + outer_cos * star_radius, star_y + outer_sin * star_radius))
+            star_points.append((star_x + inner_cos * (star_radius * 0.4), star_y + inner_sin * (star_radius * 0.4)))
+        
+        left = math.floor(min(band_left, star_x - star_radius))
+        top = math.floor(min(band_y, star_y - star_radius))
+        right = math.ceil(max(band_right, star_x + star_radius))
+        bottom = math.ceil(max(band_y + band_height, star_y + star_radius))
+        
+        surface = pygame.Surface((right - left + 1, bottom - top + 1), pygame.SRCALPHA)
+        pygame.draw.rect(surface, (200, 200, 50), (
+            band_left - left, 
+            band_y - top, 
+            band_right - band_left, 
+            band_height
+        ))
+        pygame.draw.polygon(surface, (255, 255, 255), [(px - left, py - top) for px, py in star_points])
+        return surface, (left, top)
+        
+    def _render_eyes(self):
+        """Eye whites, the pupils move so they are drawn separately"""
+        eye_radius = int(self.size * 0.1)
+        eye_spacing = int(self.size * 0.25)
+        left = int(self.size / 2) - eye_spacing - eye_radius
+        top = int(self.size * 0.5) - eye_radius
+        
+        surface = pygame.Surface((2 * (eye_spacing + eye_radius) + 1, 2 * eye_radius + 1), pygame.SRCALPHA)
+        for i in [-1, 1]:
+            pygame.draw.circle(surface, (255, 255, 255), (eye_spacing + eye_radius + i * eye_spacing, eye_radius), eye_radius)
+        return surface, (left, top)
+        
+    def _render_beard(self, beard_sway):
+        face_y = self.size * 0.5
+        center_x = self.size / 2
         eye_spacing = self.size * 0.25
-        
-        # Eyes (two white circles with black pupils)
-        for i in [-1, 1]:  # Left and right eyes
-            eye_x = center_x + i * eye_spacing
-            pygame.draw.circle(screen, (255, 255, 255), (int(eye_x), int(face_y)), int(self.size * 0.1))
-            
-            # Pupils - look in direction of staff movement
-            pupil_offset_x = math.cos(self.staff_angle) * (self.size * 0.03)
-            pupil_offset_y = math.sin(self.staff_angle) * (self.size * 0.03)
-            pygame.draw.circle(screen, (0, 0, 0), 
-                              (int(eye_x + pupil_offset_x), int(face_y + pupil_offset_y)), 
-                              int(self.size * 0.04))
-            
-        # Draw beard (white with age animation)
         beard_width = self.size * 0.6
         beard_length = self.beard_length
-        beard_sway = math.sin(pygame.time.get_ticks() * 0.0015) * (beard_width * 0.1)
-        
-        beard_points = []
-        # Top left of beard (under left eye)
-        beard_points.append((center_x - eye_spacing, face_y + self.size * 0.1))
-        # Top right of beard (under right eye)
-        beard_points.append((center_x + eye_spacing, face_y + self.size * 0.1))
-        # Right beard curl
-        beard_points.append((center_x + beard_width/2 + beard_sway, face_y + beard_length * 0.7))
-        # Center point of beard
-        beard_points.append((center_x, face_y + beard_length))
-        # Left beard curl
-        beard_points.append((center_x - beard_width/2 - beard_sway, face_y + beard_length * 0.7))
         
         # Beard color (white with slight blue tint)
-        beard_color = (230, 230, 250)
-        pygame.draw.polygon(screen, beard_color, beard_points)
+        return render_polygon([
+            (center_x - eye_spacing, face_y + self.size * 0.1),  # Top left of beard (under left eye)
+            (center_x + eye_spacing, face_y + self.size * 0.1),  # Top right of beard (under right eye)
+            (center_x + beard_width/2 + beard_sway, face_y + beard_length * 0.7),  # Right beard curl
+            (center_x, face_y + beard_length),  # Center point of beard
+            (center_x - beard_width/2 - beard_sway, face_y + beard_length * 0.7)  # Left beard curl
+        ], (230, 230, 250))
+        
+    def _render_staff(self, color):
+        """Staff pointing right from the hand, turned to the staff angle when drawn"""
+        surface = pygame.Surface((int(self.staff_length) + 3, 5), pygame.SRCALPHA)
+        pygame.draw.line(surface, color, (1, 2), (1 + self.staff_length, 2), 3)
+        return RotationCache(surface, (1, 2))
+        
+    def _render_orb(self, color, radius):
+        surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surface, color, (radius, radius), radius)
+        return surface
         
     def _draw_staff_effects(self, screen):
         """Draw Merlin's staff and its magical effects"""
@@ -915,7 +931,8 @@ class Merlin:
         staff_end_y = hand_y + math.sin(staff_angle) * self.staff_length
         
         # Draw staff (brown wooden staff)
-        pygame.draw.line(screen, (139, 69, 19), (hand_x, hand_y), (staff_end_x, staff_end_y), 3)
+        staff_sprite = self.sprites.get(('staff', (139, 69, 19)), lambda: self._render_staff((139, 69, 19)))
+        staff_sprite.blit(screen, staff_angle, hand_x, hand_y)
         
         # Draw magical orb at end of staff
         orb_size = self.staff_orb_size
@@ -954,11 +971,10 @@ class Merlin:
         pygame.draw.circle(screen, inner_color, (int(staff_end_x), int(staff_end_y)), int(inner_size))
         
         # Draw magical sparkles around orb
-        for i in range(4):
-            sparkle_angle = pygame.time.get_ticks() * 0.01 + i * math.pi / 2
-            sparkle_dist = orb_size * (0.8 + 0.4 * pulse)
-            sparkle_x = staff_end_x + math.cos(sparkle_angle) * sparkle_dist
-            sparkle_y = staff_end_y + math.sin(sparkle_angle) * sparkle_dist
+        sparkle_dist = orb_size * (0.8 + 0.4 * pulse)
+        for sparkle_cos, sparkle_sin in rotated_circle(4, *unit_vector(pygame.time.get_ticks() * 0.01)):
+            sparkle_x = staff_end_x + sparkle_cos * sparkle_dist
+            sparkle_y = staff_end_y + sparkle_sin * sparkle_dist
             
             sparkle_size = orb_size * 0.2 * (0.8 + 0.4 * pulse)
             pygame.draw.circle(screen, (255, 255, 255), 
@@ -967,44 +983,29 @@ class Merlin:
                               
     def _draw_mirror_image(self, screen, image):
         """Draw a semi-transparent mirror image of Merlin"""
-        # Save original position
-        original_x, original_y = self.x, self.y
-        
-        # Temporarily move to image position
-        self.x, self.y = image['x'], image['y']
-        
-        # Create a surface for drawing the image with transparency
-        image_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
+        alpha = image['alpha']
         
-        # Draw the wizard on this surface
-        base_color = (100, 100, 255, image['alpha'])  # Blue with alpha
-        self._draw_wizard(image_surface, base_color)
+        # Draw the wizard with a translucent robe
+        self._draw_wizard(screen, (100, 100, 255, alpha), image['x'], image['y'])
         
         # Draw staff effects (simplified)
-        center_x = self.size
-        center_y = self.size
-        hand_x = self.size * 1.2
-        hand_y = self.size * 1.1
+        hand_x = image['x'] + self.size * 0.7
+        hand_y = image['y'] + self.size * 0.6
         
         staff_angle = math.sin(pygame.time.get_ticks() * 0.001 + image['x'] * 0.01) * 0.2
         staff_end_x = hand_x + math.cos(staff_angle) * self.staff_length
         staff_end_y = hand_y + math.sin(staff_angle) * self.staff_length
         
         # Draw staff
-        pygame.draw.line(image_surface, (139, 69, 19, image['alpha']), 
-                        (hand_x, hand_y), (staff_end_x, staff_end_y), 3)
+        staff_color = (139, 69, 19, alpha)
+        self.sprites.get(('staff', staff_color), lambda: self._render_staff(staff_color)).blit(
+            screen, staff_angle, hand_x, hand_y)
         
         # Draw orb (simpler than main wizard's)
-        orb_size = self.staff_orb_size * 0.8
-        pygame.draw.circle(image_surface, (100, 100, 255, image['alpha']), 
-                          (int(staff_end_x), int(staff_end_y)), 
-                          int(orb_size))
-        
-        # Blit the image to the screen
-        screen.blit(image_surface, (self.x - self.size / 2, self.y - self.size / 2))
-        
-        # Restore original position
-        self.x, self.y = original_x, original_y
+        orb_size = int(self.staff_orb_size * 0.8)
+        orb_color = (100, 100, 255, alpha)
+        orb = self.sprites.get(('orb', orb_color, orb_size), lambda: self._render_orb(orb_color, orb_size))
+        screen.blit(orb, (int(staff_end_x) - orb_size, int(staff_end_y) - orb_size))
         
     def _draw_channeling_aura(self, screen):
         """Draw the channeling aura effect"""
@@ -1032,18 +1033,17 @@ class Merlin:
                               int(circle_size))
             
         # Draw energy streams flowing inward
-        for i in range(12):
-            angle = i * math.pi / 6 + pygame.time.get_ticks() * 0.001
-            
+        stream_dirs = rotated_circle(12, *unit_vector(pygame.time.get_ticks() * 0.001))
+        for i, (stream_cos, stream_sin) in enumerate(stream_dirs):
             # Starting point (outer edge of aura)
             start_dist = aura_size * (0.8 + 0.2 * abs(math.sin(self.aura_pulse + i)))
-            start_x = aura_size + math.cos(angle) * start_dist
-            start_y = aura_size + math.sin(angle) * start_dist
+            start_x = aura_size + stream_cos * start_dist
+            start_y = aura_size + stream_sin * start_dist
             
             # End point (near Merlin)
             end_dist = aura_size * 0.3
-            end_x = aura_size + math.cos(angle) * end_dist
-            end_y = aura_size + math.sin(angle) * end_dist
+            end_x = aura_size + stream_cos * end_dist
+            end_y = aura_size + stream_sin * end_dist
             
             # Energy beam alpha and color
             beam_alpha = int(150 * self.spell_charge)
@@ -1140,11 +1140,10 @@ class Merlin:
             
         # Draw runes around the circle
         rune_count = 8
-        for i in range(rune_count):
-            angle = i * (2 * math.pi / rune_count) + (circle['timer'] * 0.01)
-            
-            rune_x = circle['visual_radius'] + math.cos(angle) * (circle['visual_radius'] * 0.8)
-            rune_y = circle['visual_radius'] + math.sin(angle) * (circle['visual_radius'] * 0.8)
+        rune_dirs = rotated_circle(rune_count, *unit_vector(circle['timer'] * 0.01))
+        for i, (rune_cos, rune_sin) in enumerate(rune_dirs):
+            rune_x = circle['visual_radius'] + rune_cos * (circle['visual_radius'] * 0.8)
+            rune_y = circle['visual_radius'] + rune_sin * (circle['visual_radius'] * 0.8)
             
             # Rune color and size
             if circle['explodes']:
@@ -1157,10 +1156,9 @@ class Merlin:
             # Draw a magical symbol (simple geometric shape for now)
             if i % 3 == 0:  # Triangle rune
                 vertices = []
-                for j in range(3):
-                    triangle_angle = j * (2 * math.pi / 3) + angle
-                    v_x = rune_x + math.cos(triangle_angle) * rune_size
-                    v_y = rune_y + math.sin(triangle_angle) * rune_size
+                for v_cos, v_sin in rotated_circle(3, rune_cos, rune_sin):
+                    v_x = rune_x + v_cos * rune_size
+                    v_y = rune_y + v_sin * rune_size
                     vertices.append((v_x, v_y))
                 pygame.draw.polygon(circle_surface, rune_color, vertices)
             elif i % 3 == 1:  # Square rune
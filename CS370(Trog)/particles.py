@@ -0,0 +1,51 @@
+"""
+Culling of particles that can no longer be seen.
+
+The bosses used to keep a particle until its own timer or fade ran out, even once
+it had drifted off screen, shrunk below a pixel or faded to almost nothing, so it
+was still updated and drawn every frame for no visible result. Every particle
+update now ends with the same culling check, which retires particles by screen
+bounds, drawn size and alpha, and counts what it retired.
+
+Particles whose size or alpha reached zero have simply expired and aren't counted.
+
+Functions:
+- particle_culled(x, y, size, alpha) -> bool: Whether a particle is done, counting why it was culled.
+- cull_particles(particles): Drop the finished particles from a list of particle dicts, in place.
+- particle_stats() -> dict: How many particles were culled, by reason.
+- print_particle_stats(): Print the cull counts, the game does this when it exits.
+"""
+from utils import WIDTH, HEIGHT, PARTICLE_MIN_SIZE, PARTICLE_MIN_ALPHA
+
+CULL_COUNTS = {'bounds': 0, 'size': 0, 'alpha': 0}
+
+def particle_culled(x, y, size, alpha=255):
+    """True when a particle of this drawn size and alpha around (x, y) should be retired."""
+    if size <= 0 or alpha <= 0:
+        return True  # Expired on its own
+    if size < PARTICLE_MIN_SIZE:
+        reason = 'size'
+    elif alpha < PARTICLE_MIN_ALPHA:
+        reason = 'alpha'
+    elif x + size < 0 or x - size > WIDTH or y + size < 0 or y - size > HEIGHT:
+        reason = 'bounds'
+    else:
+        return False
+    CULL_COUNTS[reason] += 1
+    return True
+
+def cull_particles(particles):
+    """Keep the particle dicts (x, y, size and optionally alpha) that are still visible."""
+    particles[:] = [particle for particle in particles
+                    if not particle_culled(particle['x'], particle['y'], particle['size'],
+                                           particle.get('alpha', 255))]
+
+def particle_stats():
+    """How many particles were culled, by reason."""
+    return dict(CULL_COUNTS)
+
+def print_particle_stats():
+    stats = particle_stats()
+    if any(stats.values()):
+        print(f"Particles culled: {stats['bounds']} off screen, {stats['size']} too small, "
+              f"{stats['alpha']} faded out")
@@ -0,0 +1,61 @@
+"""
+Free-list object pools for short lived game objects.
+
+Projectiles, fireballs, traps and the views of spawned ECS entities are made and
+thrown away all through a level. A pool keeps released objects on a free list
+and hands them out again through their reset() method, so steady gameplay
+allocates next to nothing and leaves the garbage collector less to do.
+
+A pooled class takes the same arguments in __init__ and reset(). Each object
+must be released once, after nothing refers to it any more.
+
+Classes:
+- ObjectPool: Free list for one class, with occupancy counts.
+
+Functions:
+- pool_stats() -> dict: Occupancy of every pool, by name.
+"""
+
+POOLS = {}  # name -> ObjectPool, for pool_stats
+
+class ObjectPool:
+    def __init__(self, cls, name=None, capacity=256):
+        self.cls = cls
+        self.name = name or cls.__name__
+        self.capacity = capacity  # Most free objects kept, the rest are left to the garbage collector
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        POOLS[self.name] = self
+
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            self.created += 1
+        self.in_use += 1
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+        return obj
+
+    def release(self, obj):
+        self.in_use -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(obj)
+
+    def release_all(self, objs):
+        for obj in objs:
+            self.release(obj)
+
+    def stats(self):
+        return {'in_use': self.in_use, 'free': len(self.free), 'peak_in_use': self.peak_in_use,
+                'created': self.created, 'reused': self.reused}
+
+def pool_stats():
+    """Occupancy of every pool, by name."""
+    return {name: pool.stats() for name, pool in POOLS.items()}
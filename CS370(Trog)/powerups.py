@@ -10,11 +10,14 @@ Classes:
 Functions:
 - select_power_up(screen: pygame.Surface, trogdor: Trogdor, game_state: dict) -> dict:
   Handles power-up selection UI and applies the chosen power-up.
+- power_up_steps(screen, trogdor, game_state, hours, minutes, seconds): The same selection
+  as timeline steps, so the game loop keeps running while the player chooses.
 """
 import random
 import pygame
 from utils import POWER_UP_DURATION_MULTIPLIER, POWER_UP_EXTRA_LIFE, POWER_UP_SPEED_BOOST, WIDTH, HEIGHT, BLACK, WHITE,GAME_TIME_S,GAME_TIME_M,GAME_TIME_H
 from ui import draw_background
+from timeline import run_blocking
 
 # def get_power_up_time(hours,minutes, seconds):
 #     time_text = font.render(f"Time: {hours}:{minutes}:{seconds}",True ,WHITE)
@@ -48,15 +51,22 @@ class ExtraLife(PowerUp):
         return game_state
 
 def select_power_up(screen, trogdor, game_state,hours,minutes,seconds):
+    return run_blocking(screen, power_up_steps(screen, trogdor, game_state, hours, minutes, seconds))
+
+def power_up_steps(screen, trogdor, game_state, hours, minutes, seconds):
+    """The power-up choice as timeline steps, returns the updated game state."""
     power_ups = [SpeedBoost(), ExtendedBurnination(), ExtraLife()]
     chosen_power_ups = random.sample(power_ups, 3)
 
+    # The menu is drawn once into its own frame, which is shown until a power-up is picked
+    frame = pygame.Surface(screen.get_size())
+
     # Try to draw the menu background, fall back to black if it fails
     try:
-        draw_background(screen, 'menu')
+        draw_background(frame, 'menu')
     except Exception as e:
         print(f"Error drawing menu background: {e}")
-        screen.fill(BLACK)
+        frame.fill(BLACK)
     font = pygame.font.Font(None, 45)
 
     power_up_texts = [
@@ -68,24 +78,12 @@ def select_power_up(screen, trogdor, game_state,hours,minutes,seconds):
 
 
     for i, text in enumerate(power_up_texts):
-        screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 + i * 50))
-
-    pygame.display.flip()
+        frame.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 + i * 50))
 
-    choosing = True
-    while choosing:
-        for event in pygame.event.get():
+    choice_keys = {pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2}
+    while True:
+        for event in (yield frame):
             if event.type == pygame.QUIT:
-                pygame.quit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:
-                    game_state = chosen_power_ups[0].apply(trogdor, game_state)
-                    choosing = False
-                elif event.key == pygame.K_2:
-                    game_state = chosen_power_ups[1].apply(trogdor, game_state)
-                    choosing = False
-                elif event.key == pygame.K_3:
-                    game_state = chosen_power_ups[2].apply(trogdor, game_state)
-                    choosing = False
-
-    return game_state
\ No newline at end of file
+                return game_state  # Leave quitting to the caller, no power-up
+            if event.type == pygame.KEYDOWN and event.key in choice_keys:
+                return chosen_power_ups[choice_keys[event.key]].apply(trogdor, game_state)
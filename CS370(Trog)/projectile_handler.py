@@ -6,6 +6,7 @@ Functions:
 """
 
 from utils import WIDTH, HEIGHT, TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y, INITIAL_LIVES
+from entities import PROJECTILE_POOL
 
 def update_projectiles(projectiles, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
     """
@@ -31,6 +32,7 @@ def update_projectiles(projectiles, trogdor, game_state, game_stats, spawn_time,
         if (projectile.x < 0 or projectile.x > WIDTH or 
             projectile.y < 0 or projectile.y > HEIGHT):
             projectiles.remove(projectile)
+            PROJECTILE_POOL.release(projectile)
             continue
             
         # Check for collision with Trogdor (using the new invincibility system)
@@ -41,6 +43,7 @@ def update_projectiles(projectiles, trogdor, game_state, game_stats, spawn_time,
                 trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
                 trogdor.make_invincible()  # Make trogdor invincible after hit
                 projectiles.remove(projectile)
+                PROJECTILE_POOL.release(projectile)
                 
                 if game_state['lives'] <= 0:
                     from ui import game_over  # Import here to avoid circular import
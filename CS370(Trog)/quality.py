@@ -0,0 +1,113 @@
+"""
+Effect quality settings and the governor that picks them from measured frame time.
+
+The Basilisk and Merlin phases can fall well below FPS on slow machines, mostly
+because of effects: an arc per body segment, constriction ripples and rays,
+particles, and particles drawn through their own alpha surfaces. The bosses read
+those knobs from QUALITY, and the governor watches a rolling average of how long
+frames take to update and draw. It moves down a level when frames run over the
+budget and back up once there's plenty of room, and prints every change.
+
+Quality levels (lowest first):
+- low: A quarter of the particles, no scale arcs, few ripples and rays, no glow surfaces.
+- medium: Half the particles, one scale arc per segment, plain circles instead of glow surfaces.
+- high: Everything, the way the effects were designed.
+
+Classes:
+- QualitySettings: The knobs of the current quality level.
+- QualityGovernor: Rolling frame time average that moves QUALITY between levels.
+
+Functions:
+- draw_glow_circle(screen, color, alpha, x, y, size): Translucent circle, or a solid one without glow surfaces.
+"""
+import random
+from collections import deque
+
+import pygame
+
+from utils import FPS, QUALITY_WINDOW, QUALITY_DOWNGRADE_LOAD, QUALITY_UPGRADE_LOAD
+
+QUALITY_LEVELS = (
+    {'name': 'low', 'particle_rate': 0.25, 'scale_arcs': 0, 'constrict_ripples': 8, 'constrict_rays': 4,
+     'glow': False},
+    {'name': 'medium', 'particle_rate': 0.5, 'scale_arcs': 1, 'constrict_ripples': 12, 'constrict_rays': 6,
+     'glow': False},
+    {'name': 'high', 'particle_rate': 1.0, 'scale_arcs': 3, 'constrict_ripples': 24, 'constrict_rays': 8,
+     'glow': True},
+)
+
+class QualitySettings:
+    def __init__(self, level=len(QUALITY_LEVELS) - 1):
+        self.apply(level)
+
+    def apply(self, level):
+        self.level = level
+        for knob, value in QUALITY_LEVELS[level].items():
+            setattr(self, knob, value)
+
+    def particles(self, count):
+        """How many of count particles to emit, at least one if any were asked for."""
+        if self.particle_rate >= 1 or count <= 0:
+            return count
+        return max(1, round(count * self.particle_rate))
+
+    def chance(self, probability):
+        """Roll for a particle that is emitted with the given probability at full quality."""
+        return random.random() < probability * self.particle_rate
+
+QUALITY = QualitySettings()  # Read by the bosses while they update and draw
+
+def draw_glow_circle(screen, color, alpha, x, y, size):
+    """Circle around (x, y) drawn through an alpha surface, or straight onto the screen without glow."""
+    if QUALITY.glow:
+        surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (color[0], color[1], color[2], alpha), (size, size), size)
+        screen.blit(surface, (x - size, y - size))
+    elif alpha > 0:
+        pygame.draw.circle(screen, color[:3], (x, y), size)
+
+class QualityGovernor:
+    def __init__(self, settings=QUALITY, fps=FPS, window=QUALITY_WINDOW):
+        self.settings = settings
+        self.budget = 1000 / fps  # ms a frame may take
+        self.samples = deque(maxlen=window)
+        self.total = 0.0
+        self.frames_at_level = 0  # Frames since the last change, so a change is measured before the next
+        self.skip = 0  # Frames left to ignore, like the one that loaded a level
+        self.changes = []  # (level name, average ms) of every change
+
+    def reset(self):
+        """Start measuring again, ignoring the current frame (a level load or a pause)."""
+        self.samples.clear()
+        self.total = 0.0
+        self.skip = 1
+
+    def record(self, frame_ms):
+        """Add the time one frame took to update and draw, not counting the wait for the next frame."""
+        if self.skip:
+            self.skip -= 1
+            return
+        if len(self.samples) == self.samples.maxlen:
+            self.total -= self.samples[0]
+        self.samples.append(frame_ms)
+        self.total += frame_ms
+        self.frames_at_level += 1
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        average = self.total / len(self.samples)
+        level = self.settings.level
+        if average > self.budget * QUALITY_DOWNGRADE_LOAD and level > 0:
+            self.change(level - 1, average)
+        elif (average < self.budget * QUALITY_UPGRADE_LOAD and level < len(QUALITY_LEVELS) - 1
+              and self.frames_at_level >= self.samples.maxlen * 3):
+            # Going up waits longer than going down, so the levels don't flip back and forth
+            self.change(level + 1, average)
+
+    def change(self, level, average):
+        self.settings.apply(level)
+        self.changes.append((self.settings.name, average))
+        print(f"Quality set to {self.settings.name} (average frame {average:.1f} ms of {self.budget:.1f} ms)")
+        self.samples.clear()
+        self.total = 0.0
+        self.frames_at_level = 0
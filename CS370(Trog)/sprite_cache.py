@@ -0,0 +1,122 @@
+"""
+Pre-rendered sprites for the boss draw code.
+
+Boss bodies are built from polygons, circles and lines that only depend on a few
+inputs (a colour, a sway offset rounded to whole pixels, a heading). Each shape is
+drawn once into a transparent surface and reused, so a frame is mostly blits and
+only the pulses and glows are drawn procedurally.
+
+The same sprites double as pixel-perfect hitboxes: a pygame Mask is made from a
+sprite the first time a hit test needs it and cached next to it.
+
+Classes:
+- SpriteCache: Bounded store of pre-rendered surfaces, keyed by what the shape depends on.
+- RotationCache: Rotated copies of one sprite and their masks, keyed by heading quantized to SPRITE_ROTATION_STEPS.
+
+Functions:
+- quantize_angle(angle, steps) -> int: Index of the nearest of steps evenly spaced headings.
+- snap_angle(angle, steps) -> float: The heading a RotationCache actually draws for angle.
+- render_polygon(points, color) -> tuple: A polygon drawn into its own surface, plus the offset to blit it at.
+- render_circle(color, radius) -> tuple: A filled circle in its own surface, plus the offset from its centre to blit it at.
+- sprite_mask(sprite) -> tuple: The (mask, offset) hitbox of a (surface, offset) sprite.
+"""
+import math
+import pygame
+from utils import SPRITE_ROTATION_STEPS, SPRITE_CACHE_SIZE
+from trig_tables import unit_vector
+
+def quantize_angle(angle, steps=SPRITE_ROTATION_STEPS):
+    """Index of the nearest of steps evenly spaced headings."""
+    return int(round(angle * steps / (2 * math.pi))) % steps
+
+def snap_angle(angle, steps=SPRITE_ROTATION_STEPS):
+    """The heading a RotationCache actually draws for angle, for lining up procedural details."""
+    return quantize_angle(angle, steps) * 2 * math.pi / steps
+
+def render_polygon(points, color):
+    """Draw a polygon into a surface just big enough for it.
+    Returns (surface, (x, y)) where (x, y) is where the surface goes in the points' space."""
+    left = math.floor(min(x for x, _ in points))
+    top = math.floor(min(y for _, y in points))
+    width = math.ceil(max(x for x, _ in points)) - left + 1
+    height = math.ceil(max(y for _, y in points)) - top + 1
+    
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, color, [(x - left, y - top) for x, y in points])
+    return surface, (left, top)
+
+def render_circle(color, radius):
+    """Draw a filled circle into a surface just big enough for it.
+    Returns (surface, (x, y)) where (x, y) is where the surface goes relative to the centre."""
+    surface = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius + 1, radius + 1), radius)
+    return surface, (-radius - 1, -radius - 1)
+
+def sprite_mask(sprite):
+    """The (mask, offset) hitbox of a (surface, offset) sprite, covering its opaque pixels."""
+    surface, offset = sprite
+    return pygame.mask.from_surface(surface), offset
+
+class SpriteCache:
+    def __init__(self, max_entries=SPRITE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.sprites = {}  # Insertion ordered, oldest built first
+        
+    def get(self, key, build):
+        """Return the sprite for key, calling build() the first time it is needed."""
+        # Hits are a plain lookup, they happen for every entity every frame
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = build()
+            if len(self.sprites) >= self.max_entries:
+                # Drop the oldest sprite, it is built again if it is still in use
+                del self.sprites[next(iter(self.sprites))]
+            self.sprites[key] = sprite
+        return sprite
+        
+    def clear(self):
+        self.sprites.clear()
+
+class RotationCache:
+    """Rotated copies of a sprite drawn facing angle 0 (pointing right), turning about a pivot."""
+    def __init__(self, base, pivot, steps=SPRITE_ROTATION_STEPS):
+        self.base = base
+        self.pivot = pivot  # Pivot position inside the base surface
+        self.steps = steps
+        self.frames = [None] * steps  # Built on first use, most headings never come up
+        self.masks = [None] * steps  # Hitboxes for the frames, also built on first use
+        
+    def get(self, angle):
+        """Return (surface, (dx, dy)); blit the surface at the pivot's screen position plus (dx, dy)."""
+        index = quantize_angle(angle, self.steps)
+        if self.frames[index] is None:
+            self.frames[index] = self._build(index)
+        return self.frames[index]
+        
+    def get_mask(self, angle):
+        """Return (mask, (dx, dy)) for the frame get(angle) draws, placed the same way."""
+        index = quantize_angle(angle, self.steps)
+        if self.masks[index] is None:
+            self.masks[index] = sprite_mask(self.get(angle))
+        return self.masks[index]
+        
+    def blit(self, screen, angle, x, y):
+        """Draw the sprite turned to angle with its pivot at (x, y)."""
+        surface, (dx, dy) = self.get(angle)
+        screen.blit(surface, (x + dx, y + dy))
+        
+    def _build(self, index):
+        angle = index * 2 * math.pi / self.steps
+        # pygame rotates counter-clockwise in degrees while screen y points down
+        rotated = pygame.transform.rotate(self.base, -math.degrees(angle))
+        
+        # transform.rotate keeps the centre fixed, so turn the pivot->centre offset the same way
+        width, height = self.base.get_size()
+        center_x = width / 2 - self.pivot[0]
+        center_y = height / 2 - self.pivot[1]
+        cos_a, sin_a = unit_vector(angle)
+        offset_x = center_x * cos_a - center_y * sin_a
+        offset_y = center_x * sin_a + center_y * cos_a
+        
+        rotated_width, rotated_height = rotated.get_size()
+        return rotated, (offset_x - rotated_width / 2, offset_y - rotated_height / 2)
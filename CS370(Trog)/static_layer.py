@@ -0,0 +1,74 @@
+"""
+Cached surface with everything on a level that doesn't move.
+
+Every frame used to blit the level background, draw the black UI bar, render the
+area name with a new font, and draw every house with its health colour and bar,
+although houses only change when they are burned or repaired. All of that is now
+drawn once per level into one surface, which the game loop blits first each frame.
+
+A house is only drawn again when its colour or the whole-pixel width of its health
+bar changes. Its rect is restored from the copy without houses, and then every house
+overlapping that rect is drawn again, clipped to it, so overlapping houses stay
+stacked the same way.
+
+Classes:
+- StaticLayer: The cached background, UI bar and house surface of the current world.
+"""
+import pygame
+
+from utils import BLACK, WIDTH, UIBARHEIGHT
+from ui import draw_background
+from util_functions import draw_game_area
+from world import LAYER_HOUSES
+
+class StaticLayer:
+    layers = (LAYER_HOUSES,)  # World layers drawn here, the world skips them
+
+    def __init__(self):
+        self.world = None  # World the surfaces were rendered for
+        self.base = None  # Background, UI bar and area name
+        self.surface = None  # base with the houses on it
+        self.appearances = {}  # house -> the appearance() it was last drawn with
+        self.rebuilds = 0
+        self.house_redraws = 0
+
+    def draw(self, screen, world):
+        if self.world is not world or self.surface.get_size() != screen.get_size():
+            self.rebuild(screen, world)
+        else:
+            self.update(world.houses)
+        screen.blit(self.surface, (0, 0))
+
+    def rebuild(self, screen, world):
+        # Same format as the screen, so the blit each frame is a straight copy
+        base = pygame.Surface(screen.get_size(), 0, screen)
+        base.fill(BLACK)
+        draw_background(base, 'level')
+        pygame.draw.rect(base, BLACK, (0, 0, WIDTH, UIBARHEIGHT), 0)
+        draw_game_area(base, world.level)
+
+        self.surface = base.copy()
+        self.appearances.clear()
+        for house in world.houses:
+            house.draw(self.surface)
+            self.appearances[house] = house.appearance()
+        world.houses.take_changed()  # All drawn as they are now
+        self.base = base
+        self.world = world
+        self.rebuilds += 1
+
+    def update(self, houses):
+        dirty = []
+        for house in houses.take_changed():
+            appearance = house.appearance()
+            if appearance != self.appearances.get(house):
+                self.appearances[house] = appearance
+                dirty.append(house.bounds())
+        for rect in dirty:
+            self.surface.set_clip(rect)
+            self.surface.blit(self.base, rect, rect)
+            for house in houses:
+                if rect.colliderect(house.bounds()):
+                    house.draw(self.surface)
+            self.surface.set_clip(None)
+            self.house_redraws += 1
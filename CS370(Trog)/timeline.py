@@ -0,0 +1,85 @@
+"""
+Timeline of queued sequences, advanced one step per frame by the game loop.
+
+Boss defeats used to play a jingle and call pygame.time.wait for four seconds,
+then run the cutscene and the power-up screen in loops of their own. Nothing
+pumped events in the waits, so the window looked hung. A sequence is now a
+generator that the timeline resumes from the game loop, so the loop keeps
+answering events and drawing the whole time.
+
+A sequence yields what it wants next:
+- a number: wait that many milliseconds, the game stays on screen
+- a Surface: show it over the game this frame and resume next frame
+- None: resume next frame
+The yield evaluates to the events of the frame it resumes on, and the value the
+generator returns is kept as its result.
+
+Classes:
+- Sequence: One queued generator and when to resume it.
+- Timeline: The running sequences, the overlay they show and whether they pause play.
+
+Functions:
+- run_blocking(screen, steps): Run a sequence to the end with a loop of its own.
+"""
+import pygame
+from utils import FPS
+
+class Sequence:
+    def __init__(self, steps, blocking):
+        self.steps = steps
+        self.blocking = blocking  # Gameplay waits for blocking sequences
+        self.resume_at = 0
+        self.started = False
+        self.done = False
+        self.result = None
+
+class Timeline:
+    def __init__(self, clock=pygame.time.get_ticks):
+        self.clock = clock
+        self.sequences = []
+        self.overlay = None  # Surface the current step wants shown instead of the game
+
+    def start(self, steps, blocking=True):
+        sequence = Sequence(steps, blocking)
+        self.sequences.append(sequence)
+        return sequence
+
+    @property
+    def busy(self):
+        return any(sequence.blocking for sequence in self.sequences)
+
+    def update(self, events=()):
+        """Resume every sequence that is due. Call once per frame with that frame's events."""
+        now = self.clock()
+        for sequence in self.sequences[:]:
+            if now < sequence.resume_at:
+                continue
+            try:
+                # A generator that hasn't started yet can only be sent None
+                step = sequence.steps.send(events if sequence.started else None)
+            except StopIteration as finished:
+                sequence.done = True
+                sequence.result = finished.value
+                self.sequences.remove(sequence)
+                self.overlay = None
+                continue
+            sequence.started = True
+            if isinstance(step, pygame.Surface):
+                self.overlay = step
+                sequence.resume_at = now
+            else:
+                self.overlay = None
+                sequence.resume_at = now + (step or 0)
+
+def run_blocking(screen, steps):
+    """Run steps to the end and return their result, for screens shown outside the game loop."""
+    timeline = Timeline()
+    sequence = timeline.start(steps)
+    clock = pygame.time.Clock()
+    while not sequence.done:
+        timeline.update(pygame.event.get())
+        if timeline.overlay is not None:
+            screen.blit(timeline.overlay, (0, 0))
+        pygame.display.flip()
+        clock.tick(FPS)
+    return sequence.result
@@ -0,0 +1,101 @@
+"""
+Hierarchical timer wheel counting in frames.
+
+Cooldowns and state timers used to be counters that every entity decremented
+itself every frame, whether or not anything was about to happen. Timers on the
+wheel only cost something when they are scheduled and when they fire.
+
+Level 0 has a slot for each of the next 64 frames. Each higher level has 64 slots
+that are 64 times as long, and when a lower level wraps around, the timers of the
+higher level's current slot are dropped down a level. A timer is moved at most
+once per level, and advance() only looks at the one slot that is due. Timers that
+are further out than the top level covers wait in an overflow list.
+
+Classes:
+- Timer: Handle of a scheduled callback, can be cancelled and asked for the frames left.
+- TimerWheel: The wheel, advanced once per frame.
+"""
+
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS  # 64 slots per level
+WHEEL_MASK = WHEEL_SLOTS - 1
+
+class Timer:
+    __slots__ = ('wheel', 'deadline', 'interval', 'callback', 'args', 'active')
+
+    def __init__(self, wheel, deadline, interval, callback, args):
+        self.wheel = wheel
+        self.deadline = deadline
+        self.interval = interval  # Frames between repeats, 0 for a one-shot timer
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self):
+        # Left in its slot, the wheel skips inactive timers when it gets there
+        self.active = False
+
+    @property
+    def remaining(self):
+        """Frames until the timer fires, 0 once it has fired or been cancelled."""
+        return max(0, self.deadline - self.wheel.now) if self.active else 0
+
+class TimerWheel:
+    def __init__(self, levels=3):
+        self.now = 0  # Frames advanced so far
+        self.levels = [[[] for _ in range(WHEEL_SLOTS)] for _ in range(levels)]
+        self.overflow = []
+
+    def schedule(self, delay, callback, *args):
+        """Call callback(*args) delay frames from now, at least one frame out."""
+        timer = Timer(self, self.now + max(1, int(delay)), 0, callback, args)
+        self._insert(timer)
+        return timer
+
+    def every(self, interval, callback, *args):
+        """Call callback(*args) every interval frames until the timer is cancelled."""
+        interval = max(1, int(interval))
+        timer = Timer(self, self.now + interval, interval, callback, args)
+        self._insert(timer)
+        return timer
+
+    def advance(self):
+        """Move on one frame and fire the timers that are due."""
+        self.now += 1
+        now = self.now
+
+        # Drop down the slots of every level that just came around, highest first so
+        # its timers can fall through the levels below
+        wrapped = 0
+        while wrapped + 1 < len(self.levels) and not now & ((1 << (WHEEL_BITS * (wrapped + 1))) - 1):
+            wrapped += 1
+        if wrapped + 1 == len(self.levels) and not now & ((1 << (WHEEL_BITS * len(self.levels))) - 1):
+            pending, self.overflow = self.overflow, []
+            for timer in pending:
+                self._insert(timer)
+        for level in range(wrapped, 0, -1):
+            slot = (now >> (WHEEL_BITS * level)) & WHEEL_MASK
+            pending, self.levels[level][slot] = self.levels[level][slot], []
+            for timer in pending:
+                if timer.active:
+                    self._insert(timer)
+
+        slot = now & WHEEL_MASK
+        due, self.levels[0][slot] = self.levels[0][slot], []
+        for timer in due:
+            if not timer.active:
+                continue
+            if timer.interval:
+                timer.deadline += timer.interval
+                self._insert(timer)
+            else:
+                timer.active = False
+            timer.callback(*timer.args)
+
+    def _insert(self, timer):
+        delta = timer.deadline - self.now
+        for level, slots in enumerate(self.levels):
+            if delta < 1 << (WHEEL_BITS * (level + 1)):
+                slots[(timer.deadline >> (WHEEL_BITS * level)) & WHEEL_MASK].append(timer)
+                return
+        self.overflow.append(timer)
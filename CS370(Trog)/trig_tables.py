@@ -0,0 +1,48 @@
+"""
+Precomputed trig tables for Trogdor's movement and draw code.
+
+Most of the boss effects (rune stars, crown spikes, ripples, rays, shield curves)
+place a fixed set of evenly spaced points around a circle and only spin the whole
+set each frame. The unit vectors for those sets are built once here, and a frame
+only needs one cos/sin pair for the current rotation instead of one per vertex.
+
+Functions:
+- unit_vector(angle) -> tuple: (cos, sin) of an angle.
+- angle_steps(count, step, offset) -> tuple: Cached (cos, sin) pairs for offset + i * step.
+- unit_circle(count, offset) -> tuple: Cached (cos, sin) pairs for count evenly spaced angles.
+- rotated_circle(count, cos_a, sin_a, offset) -> list: unit_circle rotated by angle a.
+- rotate_all(table, cos_a, sin_a) -> list: Any (cos, sin) table rotated by angle a.
+- rotate(cos_a, sin_a, offset) -> tuple: Unit vector of a + offset for a constant offset.
+"""
+import math
+from functools import lru_cache
+
+def unit_vector(angle):
+    """Return the (cos, sin) unit vector for an angle in radians."""
+    return math.cos(angle), math.sin(angle)
+
+@lru_cache(maxsize=None)
+def angle_steps(count, step, offset=0.0):
+    """(cos, sin) pairs for angles offset + i * step, computed once per set."""
+    return tuple((math.cos(offset + i * step), math.sin(offset + i * step)) for i in range(count))
+
+def unit_circle(count, offset=0.0):
+    """(cos, sin) pairs for count evenly spaced angles starting at offset."""
+    return angle_steps(count, 2 * math.pi / count, offset)
+
+def rotated_circle(count, cos_a, sin_a, offset=0.0):
+    """The unit_circle set rotated by an angle given as its cos and sin."""
+    return rotate_all(unit_circle(count, offset), cos_a, sin_a)
+
+def rotate_all(table, cos_a, sin_a):
+    """Rotate every (cos, sin) pair in a table by an angle given as its cos and sin."""
+    return [(c * cos_a - s * sin_a, s * cos_a + c * sin_a) for c, s in table]
+
+@lru_cache(maxsize=None)
+def _constant_vector(offset):
+    return math.cos(offset), math.sin(offset)
+
+def rotate(cos_a, sin_a, offset):
+    """Unit vector of (a + offset). offset is a constant, so its cos/sin are cached."""
+    c, s = _constant_vector(offset)
+    return cos_a * c - sin_a * s, sin_a * c + cos_a * s
@@ -12,15 +12,21 @@ This module contains helper functions to clean up the main game logic, including
 import random
 import math
 import pygame
-from entities import Trogdor, Peasant, Knight, Guardian, House, Lancer, Teleporter, Trapper, ApprenticeMage, Builder
+from entities import (Trogdor, Guardian, House, Lancer, Teleporter, Trapper, Builder,
+                      spawn_knights, spawn_apprentice_mages, PROJECTILE_POOL)
 from bosses import Basilisk, Lancelot, Merlin, DragonKing
 from utils import (WIDTH, HEIGHT, UIBARHEIGHT, FPS, INITIAL_LIVES, TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y,
                   GREEN, YELLOW, PURPLE, RED, WHITE, BLACK,
                   GAME_AREA_OUTSKIRTS, GAME_AREA_TOWNS, GAME_AREA_WIZARDS, GAME_AREA_CASTLE,
                   BOSS_LEVELS, BUILDER_MAX_COUNT)
 from ui import game_over, show_congratulations_screen, load_sound
-from powerups import select_power_up
-from cutscenes import show_cutscene
+from powerups import power_up_steps
+from cutscenes import cutscene_steps
+from collision import point_hits_polyline, swept_boxes_overlap, rect_hits_masks
+from house_registry import HouseRegistry
+from world import World
+from timer_wheel import TimerWheel
+from memory_monitor import MEMORY_MONITOR
 
 def get_victory_sounds():
     """Load and return victory sounds."""
@@ -88,95 +94,87 @@ def handle_game_over(screen, game_state, game_stats, spawn_time, jump_time):
         jump_time = 0
         return "restart"
 
-def handle_level_advance(screen, trogdor, game_state, game_stats):
-    """Handle advancement to next level."""
-    game_state = select_power_up(screen, trogdor, game_state, int(game_stats['timeH']), game_stats['timeM'], game_stats['timeS'])
-    return game_state
+def level_advance_steps(screen, trogdor, game_state, game_stats):
+    """Timeline steps for advancing to the next level, the power-up choice."""
+    return (yield from power_up_steps(screen, trogdor, game_state, int(game_stats['timeH']), game_stats['timeM'], game_stats['timeS']))
 
-def update_basilisk_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
+def boss_defeat_steps(screen, cutscene_id, trogdor, game_state, game_stats):
+    """Timeline steps after a boss falls: victory sounds, its cutscene, then the next level's power-up."""
+    # Load and play victory sounds
+    victory_jingle, victory_noise = get_victory_sounds()
+    victory_jingle.play()
+    yield 3000
+    victory_noise.play()
+    yield 1000
+    
+    # Show the boss's defeat cutscene
+    if not (yield from cutscene_steps(screen, cutscene_id)):
+        return False  # User quit during cutscene
+    
+    game_state['level'] += 1
+    yield from level_advance_steps(screen, trogdor, game_state, game_stats)
+    return True
+
+def update_basilisk_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline):
     """Update and handle Basilisk boss."""
     boss.update(trogdor)
     game_completed = False
     
-    # Check for collisions with poison trails
+    # Check for collisions with poison trails (stamped into the boss's hazard map)
     if not trogdor.is_invincible:  # Use new invincibility check
-        for trail in boss.poison_trails:
-            if math.sqrt((trogdor.x - trail.x)**2 + (trogdor.y - trail.y)**2) < trogdor.size/2 + trail.size/2:
-                slash_noise.play()
-                game_state['lives'] -= 1
-                trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
-                trogdor.make_invincible()  # Make trogdor invincible
-                if game_state['lives'] <= 0:
-                    if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
-                        return None, spawn_time, True
-                    else:
-                        return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+        if boss.hazards.hit(trogdor.x, trogdor.y):
+            slash_noise.play()
+            game_state['lives'] -= 1
+            trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
+            trogdor.make_invincible()  # Make trogdor invincible
+            if game_state['lives'] <= 0:
+                if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
+                    return None, spawn_time, True
+                else:
+                    return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
 
     # Check for collisions with basilisk body segments
     if not trogdor.is_invincible and boss.state != "burrowing":  # Use new invincibility check
-        for i in range(0, len(boss.segments), 5):  # Check every 5th segment for better performance
-            pos = boss.segments[i]
-            if math.sqrt((trogdor.x - pos[0])**2 + (trogdor.y - pos[1])**2) < trogdor.size/2 + boss.segment_size/2:
-                slash_noise.play()
-                game_state['lives'] -= 1
-                trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
-                trogdor.make_invincible()  # Make trogdor invincible
-                if game_state['lives'] <= 0:
-                    if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
-                        return None, spawn_time, True
-                    else:
-                        return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+        # The body is a chain of capsules through every segment, not a sample of circles
+        if point_hits_polyline(trogdor.x, trogdor.y, boss.segments,
+                               trogdor.size/2 + boss.segment_size/2, boss.max_step):
+            slash_noise.play()
+            game_state['lives'] -= 1
+            trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
+            trogdor.make_invincible()  # Make trogdor invincible
+            if game_state['lives'] <= 0:
+                if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
+                    return None, spawn_time, True
+                else:
+                    return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
 
     # Check if Trogdor hit the head when vulnerable
     if math.sqrt((trogdor.x - boss.x)**2 + (trogdor.y - boss.y)**2) < trogdor.size/2 + boss.head_size/2:
         if boss.take_damage():
             if boss.health <= 0:
-                # Load and play victory sounds
-                victory_jingle, victory_noise = get_victory_sounds()
-                victory_jingle.play()
-                pygame.time.wait(3000)
-                victory_noise.play()
-                pygame.time.wait(1000)
-                pygame.event.clear()
-                
-                
-                # Show basilisk defeat cutscene
-                if not show_cutscene(screen, "basilisk"):
-                    return None, spawn_time, True  # User quit during cutscene
-                    
-                game_state['level'] += 1
-                handle_level_advance(screen, trogdor, game_state, game_stats)
-                return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+                # The game loop moves on to the next level once the sequence is done
+                timeline.start(boss_defeat_steps(screen, "basilisk", trogdor, game_state, game_stats))
 
     return boss, spawn_time, game_completed
 
-def update_lancelot_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
+def update_lancelot_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline):
     """Update and handle Lancelot boss."""
     boss.update(trogdor)
     game_completed = False
     
+    # Both move fast enough to pass through each other in a frame, so test their whole paths
+    reach = trogdor.size + boss.size
+    touching = swept_boxes_overlap((trogdor.prev_x, trogdor.prev_y), (trogdor.x, trogdor.y),
+                                   (boss.prev_x, boss.prev_y), (boss.x, boss.y), reach, reach)
+    
     if boss.state == "vulnerable":
-        if (abs(trogdor.x - boss.x) < trogdor.size + boss.size and
-            abs(trogdor.y - boss.y) < trogdor.size + boss.size):
+        if touching:
             boss.take_damage()
         if boss.health <= 0:
-            victory_jingle, victory_noise = get_victory_sounds()
-            victory_jingle.play()
-            pygame.time.wait(3000)
-            victory_noise.play()
-            pygame.time.wait(1000)
-            pygame.event.clear()
-            
-            # Show lancelot defeat cutscene
-            if not show_cutscene(screen, "lancelot"):
-                return None, spawn_time, True  # User quit during cutscene
-                
-            game_state['level'] += 1
-            handle_level_advance(screen, trogdor, game_state, game_stats)
-            return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+            # The game loop moves on to the next level once the sequence is done
+            timeline.start(boss_defeat_steps(screen, "lancelot", trogdor, game_state, game_stats))
     elif boss.state == "charging" and not trogdor.is_invincible:
-        if (abs(trogdor.x - boss.x) < trogdor.size + boss.size and
-            abs(trogdor.y - boss.y) < trogdor.size + boss.size):
+        if touching:
             slash_noise.play()
             game_state['lives'] -= 1
             trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
@@ -189,7 +187,7 @@ def update_lancelot_boss(boss, trogdor, game_state, game_stats, spawn_time, jump
                     
     return boss, spawn_time, game_completed
 
-def update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
+def update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline):
     """Update and handle Merlin boss."""
     boss.update(trogdor, projectiles)
     game_completed = False
@@ -204,6 +202,7 @@ def update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn
                 trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
                 trogdor.make_invincible()  # Make trogdor invincible
                 projectiles.remove(projectile)
+                PROJECTILE_POOL.release(projectile)
                 if game_state['lives'] <= 0:
                     if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
                         return None, spawn_time, True
@@ -211,36 +210,23 @@ def update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn
                         return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
             else:
                 projectiles.remove(projectile)
+                PROJECTILE_POOL.release(projectile)
     
-    # Check for Trogdor hitting Merlin
+    # Check for Trogdor hitting Merlin, against the shape he is drawn with
+    trogdor_rect = pygame.Rect(trogdor.x, trogdor.y, trogdor.size, trogdor.size)
     if not boss.invulnerable:
-        if (abs(trogdor.x - boss.x) < trogdor.size + boss.size and
-            abs(trogdor.y - boss.y) < trogdor.size + boss.size):
+        if rect_hits_masks(trogdor_rect, boss.hit_parts(boss.x, boss.y)):
             boss.take_damage()
             if boss.health <= 0:
-                # Load and play victory sounds
-                victory_jingle, victory_noise = get_victory_sounds()
-                victory_jingle.play()
-                pygame.time.wait(3000)
-                victory_noise.play()
-                pygame.time.wait(1000)
-                pygame.event.clear()
-
-                
-                # Show merlin defeat cutscene
-                if not show_cutscene(screen, "merlin"):
-                    return None, spawn_time, True  # User quit during cutscene
-                    
-                game_state['level'] += 1
-                handle_level_advance(screen, trogdor, game_state, game_stats)
-                return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+                # The game loop moves on to the next level once the sequence is done
+                timeline.start(boss_defeat_steps(screen, "merlin", trogdor, game_state, game_stats))
+                return boss, spawn_time, False
     
     # Handle collisions with Merlin's mirror images (additional challenge in enhanced Merlin)
     if hasattr(boss, 'mirror_images'):
         for image in boss.mirror_images:
             if not trogdor.is_invincible:
-                if (abs(trogdor.x - image['x']) < trogdor.size + boss.size and
-                    abs(trogdor.y - image['y']) < trogdor.size + boss.size):
+                if rect_hits_masks(trogdor_rect, boss.hit_parts(image['x'], image['y'])):
                     slash_noise.play()
                     game_state['lives'] -= 1
                     trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
@@ -252,23 +238,18 @@ def update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn
                             return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
     
     # Handle collisions with arcane circles (another feature in enhanced Merlin)
-    if hasattr(boss, 'arcane_circles'):
-        for circle in boss.arcane_circles:
-            if not trogdor.is_invincible:
-                # Only cause damage if the player is inside an active circle
-                distance = math.sqrt((trogdor.x + trogdor.size/2 - circle['x'])**2 + 
-                               (trogdor.y + trogdor.size/2 - circle['y'])**2)
-                
-                if distance < circle['radius'] and circle['timer'] < 10:  # Damage in final moments
-                    slash_noise.play()
-                    game_state['lives'] -= 1
-                    trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
-                    trogdor.make_invincible()  # Make trogdor invincible
-                    if game_state['lives'] <= 0:
-                        if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
-                            return None, spawn_time, True
-                        else:
-                            return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+    # Circles are only in the hazard map during their damaging final moments
+    if hasattr(boss, 'hazards') and not trogdor.is_invincible:
+        if boss.hazards.hit(trogdor.x + trogdor.size/2, trogdor.y + trogdor.size/2):
+            slash_noise.play()
+            game_state['lives'] -= 1
+            trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
+            trogdor.make_invincible()  # Make trogdor invincible
+            if game_state['lives'] <= 0:
+                if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
+                    return None, spawn_time, True
+                else:
+                    return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
     
     # Handle arcane wave collision (phase 3 attack)
     if hasattr(boss, 'arcane_wave_active') and boss.arcane_wave_active:
@@ -313,7 +294,7 @@ def update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn
                     
     return boss, spawn_time, game_completed
 
-def update_dragonking_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
+def update_dragonking_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline):
     """Update and handle Dragon King boss."""
     boss.update(trogdor)
     game_completed = False
@@ -326,8 +307,8 @@ def update_dragonking_boss(boss, trogdor, game_state, game_stats, spawn_time, ju
             game_completed = True
             return None, spawn_time, game_completed
         else:
-            handle_level_advance(screen, trogdor, game_state, game_stats)
-            return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
+            timeline.start(level_advance_steps(screen, trogdor, game_state, game_stats))
+            return boss, spawn_time, False
     else:
         for fx, fy, _ in boss.fire_breath:
             if not trogdor.is_invincible:  # Use new invincibility check
@@ -337,20 +318,20 @@ def update_dragonking_boss(boss, trogdor, game_state, game_stats, spawn_time, ju
                     game_state['lives'] -= 1
                     trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
                     trogdor.make_invincible()  # Make trogdor invincible
-                    trogdor.burnination_mode = False
+                    trogdor.end_burnination()
                     if game_state['lives'] <= 0:
                         if handle_game_over(screen, game_state, game_stats, spawn_time, jump_time) == "exit":
                             return None, spawn_time, True
                         else:
                             return create_boss(get_current_area(game_state['level']), game_state['level']), spawn_time, False
 
-        if (abs(trogdor.x - boss.x) < trogdor.size + boss.size and
-            abs(trogdor.y - boss.y) < trogdor.size + boss.size):
+        trogdor_rect = pygame.Rect(trogdor.x, trogdor.y, trogdor.size, trogdor.size)
+        if rect_hits_masks(trogdor_rect, boss.hit_parts()):
             boss.take_damage()
             
     return boss, spawn_time, game_completed
 
-def update_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
+def update_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline):
     """Handle boss updates, damage, and collisions."""
     # No boss to update
     if boss is None:
@@ -358,64 +339,61 @@ def update_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time,
         
     # Update boss based on type
     if isinstance(boss, Basilisk):
-        return update_basilisk_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen)
+        return update_basilisk_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline)
     elif isinstance(boss, Lancelot):
-        return update_lancelot_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen)
+        return update_lancelot_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline)
     elif isinstance(boss, Merlin):
-        return update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time, jump_time, slash_noise, screen)
+        return update_merlin_boss(boss, trogdor, projectiles, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline)
     elif isinstance(boss, DragonKing):
-        return update_dragonking_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen)
+        return update_dragonking_boss(boss, trogdor, game_state, game_stats, spawn_time, jump_time, slash_noise, screen, timeline)
     
     return boss, spawn_time, False
 
-def check_regular_collisions(trogdor, collision_entities, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
-    """Check for collisions between Trogdor and regular enemies."""
+def check_regular_collisions(trogdor, collision_registry, game_state, game_stats, spawn_time, jump_time, slash_noise, screen):
+    """Check for collisions between Trogdor and regular enemies and traps."""
+    collision_registry.update()  # Every frame, so enemy paths never span more than one
     if not trogdor.is_invincible:
-        for entity in collision_entities:
-            if (abs(trogdor.x - entity.x) < trogdor.size and
-                abs(trogdor.y - entity.y) < trogdor.size):
+        # Enemies first (swept along both paths), then traps where Trogdor ends up
+        enemy_hit = lambda x, y: collision_registry.first_hit(x, y, trogdor.prev_x, trogdor.prev_y)
+        for check in (enemy_hit, collision_registry.trapped):
+            if check(trogdor.x, trogdor.y):
                 slash_noise.play()
                 game_state['lives'] -= 1
                 trogdor.x, trogdor.y = TROGDOR_INITIAL_X, TROGDOR_INITIAL_Y
                 trogdor.peasants_stomped = 0
                 trogdor.make_invincible()  # Make trogdor invincible after hit
-                trogdor.burnination_mode = False
+                trogdor.end_burnination()
                 if game_state['lives'] <= 0:
                     return handle_game_over(screen, game_state, game_stats, spawn_time, jump_time), spawn_time
     return None, spawn_time
 
 def handle_house_burnination(trogdor, houses, game_state, game_stats, spawn_time, jump_time, screen):
     """Handle house burnination logic and level advancement."""
-    for house in houses[:]:
-        if (abs(trogdor.x - house.x) < trogdor.size and
-            abs(trogdor.y - house.y) < trogdor.size):
-            if trogdor.burnination_mode:
-                house.health -= 2
-                if house.health <= 0 and not getattr(house, 'is_destroyed', False):
-                    house.is_destroyed = True
-                    house.health = 0
-                    game_state['houses_crushed'] += 1
-                    
-                    if game_state['houses_crushed'] >= game_state['level'] + 2:
-                        game_state['level'] += 1
-                        game_state['burnination_threshold'] += 2
-                        game_state['houses_crushed'] = 0
-                        return True, game_state
+    if not trogdor.burnination_mode:
+        return False, game_state
+    # Only the houses Trogdor is standing on, found through the registry's grid
+    for house in houses.touching(trogdor.x, trogdor.y, trogdor.size):
+        if houses.damage(house, 2):
+            game_state['houses_crushed'] += 1
+            
+            if game_state['houses_crushed'] >= game_state['level'] + 2:
+                game_state['level'] += 1
+                game_state['burnination_threshold'] += 2
+                game_state['houses_crushed'] = 0
+                return True, game_state
     return False, game_state
 
 def handle_peasant_collisions(trogdor, peasants, game_state, splat_noise):
     """Handle peasant stomping and burnination mode activation."""
-    for peasant in peasants[:]:
-        if (abs(trogdor.x - peasant.x) < trogdor.size and
-            abs(trogdor.y - peasant.y) < trogdor.size):
-            splat_noise.play()
-            peasants.remove(peasant)
-            trogdor.peasants_stomped += 1
-            if trogdor.peasants_stomped >= game_state['burnination_threshold'] and not trogdor.burnination_mode:
-                trogdor.burnination_mode = True
-                trogdor.burnination_timer = game_state['burnination_duration']
-                trogdor.peasants_stomped = 0
-                return True
+    # Tested on the peasant columns, only the stomped ones are despawned by id
+    for peasant_id in peasants.hits(trogdor.x, trogdor.y, trogdor.size):
+        splat_noise.play()
+        peasants.despawn(peasant_id)
+        trogdor.peasants_stomped += 1
+        if trogdor.peasants_stomped >= game_state['burnination_threshold'] and not trogdor.burnination_mode:
+            trogdor.start_burnination(game_state['burnination_duration'])
+            trogdor.peasants_stomped = 0
+            return True
     return False
 
 def draw_game_area(screen, level):
@@ -453,115 +431,72 @@ def update_time(game_stats):
         game_stats['timeM'] = 0
     return game_stats
 
-def initialize_game(level):
-    """Create game objects for a specific level."""
-    trogdor = Trogdor()
+def initialize_game(level, previous=None):
+    """Create the world for a specific level, keeping the movement clocks of the previous one."""
+    MEMORY_MONITOR.level_end(previous)
+    timers = TimerWheel()  # Shared by everything on the level, advanced by the world
+    trogdor = Trogdor(timers)
     trogdor.make_invincible()  # Make Trogdor invincible at start of level
+    world = World(trogdor, level, timers)
+    if previous is not None:
+        world.guardian_angle = previous.guardian_angle
+        world.jump_time = previous.jump_time
+        previous.release()
     
     # Determine the current game area
     current_area = get_current_area(level)
     
-    # Initialize lists
-    houses = []
-    peasants = []
-    knights = []
-    guardians = []
-    lancers = []
-    teleporters = []
-    trappers = []
-    apprentice_mages = []
-    builders = []
-    projectiles = []
-    
     # Handle boss levels
     if level in BOSS_LEVELS:
-        boss = create_boss(current_area, level)
-        return trogdor, houses, peasants, knights, guardians, lancers, boss, projectiles, teleporters, trappers, apprentice_mages, builders
+        world.boss = create_boss(current_area, level)
+        return world
 
     # Regular level initialization (non-boss levels)
-    houses = [House() for _ in range(level + 2)]
+    houses = world.houses = HouseRegistry(House() for _ in range(level + 2))
+    trap_hazards = world.collision_registry.trap_hazards
     
     # Outskirts Area (Levels 1-5): Knights, Guardians, Peasants
     if current_area == GAME_AREA_OUTSKIRTS:
         # Basic enemies for the kingdom outskirts
-        knights = [Knight() for _ in range(min(level, 4))]
-        guardians = [Guardian(random.choice(houses)) for _ in range(min(level + 1, 5))]
+        spawn_knights(world.knights, min(level, 4))
+        world.guardians = [Guardian(random.choice(houses)) for _ in range(min(level + 1, 5))]
         
     # Towns Area (Levels 6-10): Knights, Guardians, Lancers, Trappers, Builders
     elif current_area == GAME_AREA_TOWNS:
         # More sophisticated defense in the towns
-        knights = [Knight() for _ in range(min(level - 5, 4))]
-        guardians = [Guardian(random.choice(houses)) for _ in range(min(level - 4, 5))]
-        lancers = [Lancer() for _ in range(min(level - 5, 3))]
-        trappers = [Trapper() for _ in range(min(level - 5, 2))]
+        spawn_knights(world.knights, min(level - 5, 4))
+        world.guardians = [Guardian(random.choice(houses)) for _ in range(min(level - 4, 5))]
+        world.lancers = [Lancer() for _ in range(min(level - 5, 3))]
+        world.trappers = [Trapper(trap_hazards, timers) for _ in range(min(level - 5, 2))]
         
         # Builders appear in towns
-        builders = [Builder() for _ in range(min(level - 5, BUILDER_MAX_COUNT))]
+        world.builders = [Builder(timers) for _ in range(min(level - 5, BUILDER_MAX_COUNT))]
         
     # Wizards Area (Levels 11-15): Apprentice Mages, Teleporters, Builders
     elif current_area == GAME_AREA_WIZARDS:
         # Magic-focused enemies in the wizard society
-        apprentice_mages = [ApprenticeMage() for _ in range(min(level - 10, 3))]
-        teleporters = [Teleporter() for _ in range(min(level - 10, 2))]
-        builders = [Builder() for _ in range(BUILDER_MAX_COUNT)]
+        spawn_apprentice_mages(world.apprentice_mages, min(level - 10, 3))
+        world.teleporters = [Teleporter() for _ in range(min(level - 10, 2))]
+        world.builders = [Builder(timers) for _ in range(BUILDER_MAX_COUNT)]
         
         # Fewer traditional guards, more magical defenses
-        knights = [Knight() for _ in range(2)]
-        guardians = [Guardian(random.choice(houses)) for _ in range(2)]
+        spawn_knights(world.knights, 2)
+        world.guardians = [Guardian(random.choice(houses)) for _ in range(2)]
         
     # Castle Area (Levels 16-20): All enemy types possible
     elif current_area == GAME_AREA_CASTLE:
         # Castle has all types of enemies, representing elite royal forces
-        knights = [Knight() for _ in range(random.randint(2, 4))]
-        guardians = [Guardian(random.choice(houses)) for _ in range(random.randint(2, 4))]
-        lancers = [Lancer() for _ in range(random.randint(1, 3))]
-        apprentice_mages = [ApprenticeMage() for _ in range(random.randint(1, 2))]
-        teleporters = [Teleporter() for _ in range(1)]
-        trappers = [Trapper() for _ in range(random.randint(1, 2))]
-        builders = [Builder() for _ in range(BUILDER_MAX_COUNT)]
+        spawn_knights(world.knights, random.randint(2, 4))
+        world.guardians = [Guardian(random.choice(houses)) for _ in range(random.randint(2, 4))]
+        world.lancers = [Lancer() for _ in range(random.randint(1, 3))]
+        spawn_apprentice_mages(world.apprentice_mages, random.randint(1, 2))
+        world.teleporters = [Teleporter() for _ in range(1)]
+        world.trappers = [Trapper(trap_hazards, timers) for _ in range(random.randint(1, 2))]
+        world.builders = [Builder(timers) for _ in range(BUILDER_MAX_COUNT)]
 
-    # No boss for regular levels
-    boss = None
-    return trogdor, houses, peasants, knights, guardians, lancers, boss, projectiles, teleporters, trappers, apprentice_mages, builders
-
-def update_regular_enemies(peasants, knights, apprentice_mages, builders, guardians, teleporters, lancers, trappers, trogdor, projectiles, houses, guardian_angle, game_stats, jump_time):
-    """Update all regular enemy entities."""
-    # Update basic enemies
-    for peasant in peasants:
-        peasant.move()
-    for knight in knights:
-        knight.move(trogdor)
-    for apprentice_mage in apprentice_mages:
-        apprentice_mage.update(trogdor, projectiles)
-    
-    # Update builders
-    for builder in builders:
-        builder.move(houses)
-    
-    # Update guardians and guardian angle
-    for guardian in guardians:
-        guardian.move(guardian_angle)
-    guardian_angle += 0.0175
-    
-    # Handle teleporters
-    new_jump_time = jump_time
-    if (jump_time + 100 < game_stats['timeF']):
-        new_jump_time = game_stats['timeF']
-        for teleporter in teleporters:
-            teleporter.move(trogdor)
-    
-    # Update lancers and trappers
-    for lancer in lancers:
-        lancer.move(trogdor)
-    for trapper in trappers:
-        trapper.move()
-        trapper.place_trap()
-        
-    return guardian_angle, new_jump_time
+    # Register everything that needs collision checking with Trogdor, traps register themselves
+    for hostiles in (world.knights, world.lancers, world.teleporters, world.guardians, world.apprentice_mages):
+        world.collision_registry.add_all(hostiles)
 
-def get_collision_entities(knights, lancers, teleporters, guardians, apprentice_mages, trappers):
-    """Get a list of all entities that need collision checking with Trogdor."""
-    collision_entities = knights + lancers + teleporters + guardians + apprentice_mages
-    for trapper in trappers:
-        collision_entities.extend(trapper.traps)
-    return collision_entities
\ No newline at end of file
+    # No boss for regular levels
+    return world
\ No newline at end of file
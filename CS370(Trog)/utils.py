@@ -45,6 +45,7 @@ LANCER_SIZE = 25
 
 HOUSE_SIZE = 40
 HOUSE_HEALTH = 100
+HOUSE_GRID_CELL_SIZE = 100  # Pixels per cell of the house lookup grid
 
 TELEPORTER_SIZE = 30
 
@@ -60,12 +61,22 @@ BUTTON_WIDTH = 250
 BUTTON_HEIGHT = 70
 BUTTON_PADDING = 25
 
+# Leaderboard Settings
+LEADERBOARD_SIZE = 10  # Entries shown on the leaderboard screen
+LEADERBOARD_SERVER_HOST = "127.0.0.1"
+LEADERBOARD_SERVER_PORT = 8765
+LEADERBOARD_POOL_SIZE = 2  # Keep-alive connections held by the client
+LEADERBOARD_TIMEOUT = 2.0  # Seconds before a server request is given up on
+LEADERBOARD_BATCH_SIZE = 32  # Server writes once this many scores are queued
+LEADERBOARD_FLUSH_INTERVAL = 0.5  # ...or after this many seconds
+
 # Boss Settings
 MERLIN_SIZE = 50
 MERLIN_PROJECTILE_SIZE = 15
 MERLIN_PROJECTILE_SPEED = 3
 MERLIN_PROJECTILE_COOLDOWN = 60
 MERLIN_TELEPORT_DISTANCE = 250
+ARCANE_CIRCLE_DAMAGE_FRAMES = 10  # Arcane circles hurt while their timer is below this
 
 LANCELOT_SIZE = 45
 LANCELOT_CHARGE_SPEED = 12
@@ -76,6 +87,39 @@ BOSS_HEALTH_BAR_WIDTH = 800
 BOSS_HEALTH_BAR_HEIGHT = 430
 BOSS_HEALTH_BAR_BORDER = 5
 
+# Pre-rendered boss sprites
+SPRITE_ROTATION_STEPS = 64  # Quantized headings per rotation cache
+SPRITE_CACHE_SIZE = 128  # Sprites kept per boss before the oldest is dropped
+
+# Hazard map (poison trails, traps, arcane circles)
+HAZARD_CELL_SIZE = 4  # Pixels per hazard map cell
+
+# Flow field that chasing enemies follow around houses
+FLOW_FIELD_CELL_SIZE = 20  # Pixels per flow field cell
+
+# Garbage collection, see gc_manager.py
+GC_SCHEDULING = False  # Freeze each level's objects and collect at pauses instead of mid-play, opt in
+GC_GAMEPLAY_THRESHOLDS = (20000, 50, 1000)  # Collector thresholds while a level is played
+GC_PROFILE_PATH = None  # CSV file the collections are logged to, e.g. 'gc_profile.csv'
+
+# Memory reports, see memory_monitor.py
+MEMORY_PROFILING = False  # Snapshot tracemalloc per level and boss phase, slows the game down
+MEMORY_REPORT_PATH = 'memory_report.txt'
+MEMORY_REPORT_LINES = 10  # Biggest differences listed per grouping
+MEMORY_WATCHDOG_INTERVAL = 60  # Frames between collection size checks
+MEMORY_DEFAULT_BUDGET = 500  # Most entries expected in any entity or particle list
+MEMORY_BUDGETS = {'fire_particles': 800, 'fire_breath': 300}  # Collections whose budget differs from the default
+
+# Effect quality governor, see quality.py
+QUALITY_ADAPTIVE = True  # Lower the effect quality when frames take too long
+QUALITY_WINDOW = 60  # Frames in the rolling frame time average
+QUALITY_DOWNGRADE_LOAD = 0.9  # Share of the frame budget above which quality goes down
+QUALITY_UPGRADE_LOAD = 0.5  # Share of the frame budget below which quality goes back up
+
+# Particle culling, see particles.py
+PARTICLE_MIN_SIZE = 1  # Particles drawn smaller than a pixel are retired
+PARTICLE_MIN_ALPHA = 4  # Particles fainter than this are retired
+
 # Basilisk Boss Settings
 BASILISK_HEAD_SIZE = 110
 BASILISK_SEGMENT_SIZE = 70
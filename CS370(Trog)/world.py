@@ -0,0 +1,234 @@
+"""
+World object holding everything that lives on a level.
+
+initialize_game used to hand a dozen lists to the game loop as one long tuple,
+and the loop then ran its own update and draw loop over each of them. The World
+owns those collections instead. Updates run through systems registered in a
+fixed order, and drawing goes through render layers, so the loop only calls
+world.update() and world.draw(). Entities with a sprites() method are blitted
+with one Surface.blits call per layer instead of drawing themselves.
+
+Render layers (drawn from lowest to highest):
+- LAYER_HOUSES: Houses and their health bars.
+- LAYER_UNITS: Peasants and the regular enemies, trappers draw their traps.
+- LAYER_PROJECTILES: Enemy and boss shots, drawn over the units they fly past.
+- LAYER_BOSS: The level's boss.
+- LAYER_PLAYER: Trogdor.
+
+Classes:
+- World: Entity collections of a level, their update systems and render layers.
+
+Functions:
+- update_timers(world, game_stats): Advance the timer wheel a frame, firing the timers that are due.
+- update_flow_field(world, game_stats): Refresh the chasers' flow field.
+- update_chasers(world, game_stats): Steer the archetypes with a Chaser towards Trogdor.
+- update_random_walkers(world, game_stats): Turn the random walkers whose timer ran out.
+- update_movement(world, game_stats): Move every archetype along its velocity.
+- update_shooters(world, game_stats): Fire the shooters whose cooldown ran out.
+- update_builders(world, game_stats): Move the builders to damaged houses.
+- update_guardians(world, game_stats): Circle the guardians around their houses.
+- update_teleporters(world, game_stats): Jump the teleporters every 100 frames.
+- update_lancers(world, game_stats): Charge the lancers along their axis.
+- update_trappers(world, game_stats): Move the trappers, their traps are placed on timers.
+"""
+import pygame
+
+from utils import WIDTH, HEIGHT, KNIGHT_SIZE
+from collision_registry import CollisionRegistry
+from flow_field import FlowField
+from house_registry import HouseRegistry
+from timer_wheel import TimerWheel
+from entities import (PROJECTILE_POOL, TRAP_POOL, peasant_archetype, knight_archetype,
+                      apprentice_mage_archetype)
+from dragonKing import FIREBALL_POOL
+from ecs import (RANDOM_WALK, CHASER, SHOOTER, VELOCITY, Archetype, random_walk_system, chase_system,
+                 movement_system, shooter_system)
+
+LAYER_HOUSES = 0
+LAYER_UNITS = 1
+LAYER_PROJECTILES = 2
+LAYER_BOSS = 3
+LAYER_PLAYER = 4
+
+class World:
+    def __init__(self, trogdor, level, timers=None, boss=None):
+        self.trogdor = trogdor
+        self.timers = timers if timers is not None else TimerWheel()  # Cooldowns and state timers, in frames
+        self.level = level  # The game loop builds a new world when the game state's level moves on
+        self.boss = boss
+        self.houses = HouseRegistry()
+        self.peasants = peasant_archetype()
+        self.knights = knight_archetype()
+        self.guardians = []
+        self.lancers = []
+        self.teleporters = []
+        self.trappers = []
+        self.apprentice_mages = apprentice_mage_archetype()
+        self.builders = []
+        self.projectiles = []
+        self.collision_registry = CollisionRegistry()  # Everything that hurts Trogdor on this level
+        self.flow_field = FlowField()  # Paths to Trogdor around the houses for chasing enemies
+        self.flow_field_houses = None  # (registry, standing_version) the field's obstacles came from
+
+        # ecs archetypes, each component system runs over all of them that have its components
+        self.archetypes = [self.peasants, self.knights, self.apprentice_mages]
+
+        # Shared movement clocks, carried over when the next level's world is built
+        self.guardian_angle = 0
+        self.jump_time = 0
+
+        # Updates run in registration order, see register_system
+        self.systems = [update_timers, update_flow_field, update_chasers, update_random_walkers, update_movement,
+                        update_shooters, update_builders, update_guardians, update_teleporters, update_lancers,
+                        update_trappers]
+
+        # Collections are looked up by attribute name, so levels can swap the lists freely
+        self.layers = {}
+        for name in ('houses',):
+            self.add_to_layer(LAYER_HOUSES, name)
+        for name in ('peasants', 'knights', 'guardians', 'lancers', 'teleporters',
+                     'trappers', 'apprentice_mages', 'builders'):
+            self.add_to_layer(LAYER_UNITS, name)
+        self.add_to_layer(LAYER_PROJECTILES, 'projectiles')
+
+        # Only rebuilt by cull(), once per frame
+        self.visible = {layer: [] for layer in self.layers}
+        self.screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+    def register_system(self, system, before=None):
+        """Add an update system, a function taking (world, game_stats), optionally ahead of another."""
+        if before in self.systems:
+            self.systems.insert(self.systems.index(before), system)
+        else:
+            self.systems.append(system)
+
+    def add_to_layer(self, layer, name):
+        """Draw the collection stored in attribute name on a render layer."""
+        self.layers.setdefault(layer, []).append(name)
+
+    def update(self, game_stats):
+        for system in self.systems:
+            system(self, game_stats)
+
+    def release(self):
+        """Hand the level's pooled objects back once the world is replaced."""
+        PROJECTILE_POOL.release_all(self.projectiles)
+        self.projectiles.clear()
+        for trapper in self.trappers:
+            TRAP_POOL.release_all(trapper.traps)
+            trapper.traps.clear()
+        for archetype in self.archetypes:
+            archetype.clear()
+        fireballs = getattr(self.boss, 'fireballs', None)
+        if fireballs:
+            FIREBALL_POOL.release_all(fireballs)
+            fireballs.clear()
+
+    def cull(self, screen_rect=None, skip=()):
+        """Collect the entities of every layer that can touch the screen this frame."""
+        screen_rect = screen_rect or self.screen_rect
+        left, top, right, bottom = screen_rect.left, screen_rect.top, screen_rect.right, screen_rect.bottom
+        for layer, names in self.layers.items():
+            if layer in skip:
+                continue
+            visible = self.visible.setdefault(layer, [])
+            visible.clear()
+            for name in names:
+                collection = getattr(self, name)
+                if isinstance(collection, Archetype):
+                    # Culled from its columns, the archetype then draws just its visible rows
+                    if collection.cull(left, top, right, bottom):
+                        visible.append(collection)
+                    continue
+                for entity in collection:
+                    # Projectiles draw around their position and builders draw a halo at their corner,
+                    # so pad every box by one size on each side
+                    size = entity.size
+                    if (entity.x + size * 2 >= left and entity.x - size <= right and
+                            entity.y + size * 2 >= top and entity.y - size <= bottom):
+                        visible.append(entity)
+
+    def draw(self, screen, skip=()):
+        """Draw every layer but the ones in skip, which are drawn elsewhere (see static_layer.py)."""
+        self.cull(screen.get_rect(), skip)
+        for layer in sorted(set(self.layers) | {LAYER_BOSS, LAYER_PLAYER}):
+            if layer in skip:
+                continue
+            if layer == LAYER_BOSS:
+                # Bosses fly partly off screen during their attacks and clip themselves
+                if self.boss:
+                    self.boss.draw(screen)
+            elif layer == LAYER_PLAYER:
+                self.trogdor.draw(screen)
+            else:
+                # Entities with sprites are blitted in one call, the batch is sent early only
+                # to keep the stacking order around an entity that draws itself
+                batch = []
+                for entity in self.visible[layer]:
+                    sprites = getattr(entity, 'sprites', None)
+                    if sprites is not None:
+                        batch.extend(sprites())
+                    else:
+                        if batch:
+                            screen.blits(batch, doreturn=False)
+                            batch.clear()
+                        entity.draw(screen)
+                if batch:
+                    screen.blits(batch, doreturn=False)
+
+def update_timers(world, game_stats):
+    world.timers.advance()
+
+def update_flow_field(world, game_stats):
+    # Standing houses are in the way of chasers, the field only rebuilds when they or Trogdor's cell change
+    houses = world.houses
+    if world.flow_field_houses != (houses, houses.standing_version):
+        world.flow_field_houses = (houses, houses.standing_version)
+        world.flow_field.set_obstacles([(house.x, house.y, house.size, house.size)
+                                        for house in houses if not house.is_destroyed], KNIGHT_SIZE)
+    world.flow_field.update(world.trogdor.x, world.trogdor.y)
+
+def update_chasers(world, game_stats):
+    now = pygame.time.get_ticks()
+    for archetype in world.archetypes:
+        if archetype.has(CHASER):
+            chase_system(archetype, world.trogdor.x, world.trogdor.y, now, world.flow_field)
+
+def update_random_walkers(world, game_stats):
+    for archetype in world.archetypes:
+        if archetype.has(RANDOM_WALK):
+            random_walk_system(archetype)
+
+def update_movement(world, game_stats):
+    for archetype in world.archetypes:
+        if archetype.has(VELOCITY):
+            movement_system(archetype)
+
+def update_shooters(world, game_stats):
+    for archetype in world.archetypes:
+        if archetype.has(SHOOTER):
+            shooter_system(archetype, world.trogdor.x, world.trogdor.y, world.projectiles,
+                           PROJECTILE_POOL.acquire)
+
+def update_builders(world, game_stats):
+    for builder in world.builders:
+        builder.move(world.houses)
+
+def update_guardians(world, game_stats):
+    for guardian in world.guardians:
+        guardian.move(world.guardian_angle)
+    world.guardian_angle += 0.0175
+
+def update_teleporters(world, game_stats):
+    if world.jump_time + 100 < game_stats['timeF']:
+        world.jump_time = game_stats['timeF']
+        for teleporter in world.teleporters:
+            teleporter.move(world.trogdor, world.flow_field)
+
+def update_lancers(world, game_stats):
+    for lancer in world.lancers:
+        lancer.move(world.trogdor)
+
+def update_trappers(world, game_stats):
+    for trapper in world.trappers:
+        trapper.move()